@@ -0,0 +1,70 @@
+"""Compare sessions/sec of the async graph against the threaded sync graph.
+
+Both graphs run against a local fake model with fixed per-call latency, so the
+numbers reflect how many concurrent conversations one process can multiplex.
+
+Usage:
+    python benchmarks/async_sessions.py --sessions 500 --concurrency 200 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.messages import HumanMessage
+
+from react_agent.agent import create_agent_graph
+from react_agent.fake_llm import FakeChatModel, Latency
+from react_agent.llm import llm_manager
+
+
+def _inputs(i: int) -> dict:
+    return {"messages": [HumanMessage(content=f"session {i}: 157 * 23 + 89를 계산해줘")]}
+
+
+def run_sync(sessions: int, threads: int) -> float:
+    """Run ``sessions`` conversations on a thread pool and return sessions/sec."""
+    agent = create_agent_graph()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda i: agent.invoke(_inputs(i)), range(sessions)))
+    return sessions / (time.perf_counter() - start)
+
+
+async def run_async(sessions: int, concurrency: int) -> float:
+    """Run ``sessions`` conversations on one event loop and return sessions/sec."""
+    agent = create_agent_graph(async_mode=True)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            await agent.ainvoke(_inputs(i))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(sessions)))
+    return sessions / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=200, help="async in-flight sessions")
+    parser.add_argument("--threads", type=int, default=32, help="worker threads for the sync path")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake model latency per call (s)")
+    args = parser.parse_args()
+
+    model = FakeChatModel(first_token_latency=Latency("constant", args.latency))
+    llm_manager.set_factory(lambda config: model)
+
+    sync_rate = run_sync(args.sessions, args.threads)
+    async_rate = asyncio.run(run_async(args.sessions, args.concurrency))
+
+    print(f"sessions={args.sessions} latency={args.latency}s")
+    print(f"sync  ({args.threads:>4} threads): {sync_rate:8.1f} sessions/sec")
+    print(f"async ({args.concurrency:>4} in flight): {async_rate:8.1f} sessions/sec")
+    print(f"speedup: {async_rate / sync_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
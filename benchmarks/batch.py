@@ -0,0 +1,92 @@
+"""Throughput of batch mode at different concurrency levels.
+
+Writes ``--items`` queries to a temporary JSONL file and runs them through
+``run_batch`` on the shared async graph, against the fake model with a fixed
+per-call latency. Concurrency 1 is the sequential baseline (what running the
+queries one after another, like ``run_demo``, costs). Reports items/sec,
+p50/p99 item latency and total tokens per level, then interrupts one run
+halfway and checks that resuming finishes exactly the remaining lines.
+
+Usage:
+    python benchmarks/batch.py --items 200 --concurrency 1 8 32 128 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+from pathlib import Path
+
+from react_agent.agent import get_agent_graph
+from react_agent.batch import completed_lines, run_batch
+from react_agent.fake_llm import FakeChatModel, Latency
+from react_agent.llm import llm_manager
+
+
+def write_input(path: Path, items: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(items):
+            query = f"{i} * 23 + 89를 계산해줘" if i % 2 else f"LangGraph {i}에 대해 검색해줘"
+            f.write(json.dumps({"id": f"q{i}", "query": query}, ensure_ascii=False) + "\n")
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q / 100 * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+async def interrupted_run(agent, input_path: Path, output_path: Path, concurrency: int, stop_after: int) -> None:
+    """Cancel a batch run once ``stop_after`` results were written."""
+    task = None
+
+    def on_result(record: dict) -> None:
+        if sum(1 for _ in open(output_path, encoding="utf-8")) >= stop_after:
+            task.cancel()
+
+    task = asyncio.ensure_future(run_batch(agent, input_path, output_path, concurrency, on_result=on_result))
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--latency", type=float, default=0.05, help="fake model latency per call (seconds)")
+    args = parser.parse_args()
+
+    model = FakeChatModel(tool_plan=[["calculator"]], first_token_latency=Latency(a=args.latency))
+    llm_manager.set_factory(lambda config: model)
+    agent = get_agent_graph(async_mode=True)
+
+    print(f"{'concurrency':>11} {'items/s':>9} {'p50':>9} {'p99':>9} {'tokens':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "queries.jsonl"
+        write_input(input_path, args.items)
+        for concurrency in args.concurrency:
+            output_path = Path(tmp) / f"results-{concurrency}.jsonl"
+            stats = asyncio.run(run_batch(agent, input_path, output_path, concurrency))
+            records = [json.loads(line) for line in open(output_path, encoding="utf-8")]
+            latencies = [r["latency_s"] for r in records]
+            tokens = sum(r["usage"]["total_tokens"] for r in records)
+            print(
+                f"{concurrency:>11} {stats['completed'] / stats['seconds']:>9.1f} "
+                f"{percentile(latencies, 50) * 1000:>7.0f}ms {percentile(latencies, 99) * 1000:>7.0f}ms {tokens:>9}"
+            )
+
+        output_path = Path(tmp) / "resumed.jsonl"
+        concurrency = max(args.concurrency)
+        asyncio.run(interrupted_run(agent, input_path, output_path, concurrency, args.items // 2))
+        first = len(completed_lines(output_path))
+        stats = asyncio.run(run_batch(agent, input_path, output_path, concurrency))
+        lines = [json.loads(line)["line"] for line in open(output_path, encoding="utf-8")]
+        print(
+            f"\nresume: {first} done before interrupt, {stats['skipped']} skipped, {stats['completed']} run after; "
+            f"{len(set(lines))}/{args.items} lines, {len(lines) - len(set(lines))} duplicates"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Calculator evaluation cost: legacy ``eval`` vs the compiled arithmetic engine.
+
+Part one times typical expressions with the old character-check + ``eval``
+path, with the engine on a cold compile cache and with a warm one, then
+compares a per-row loop with the NumPy batch path used by calculator_batch
+(``--rows`` template rows and as many same-shape expressions). Part two
+feeds adversarial inputs to the engine in a child process and fails (exit 1)
+if any of them takes longer than ``--max-ms`` or does not finish at all. The
+legacy path is never run on adversarial inputs, since ``9**9**9`` would hang.
+
+Usage:
+    python benchmarks/calculator.py --iterations 20000 --max-ms 50
+"""
+
+import argparse
+import multiprocessing
+import random
+import sys
+import time
+
+from react_agent.arithmetic import ExpressionError, compile_expression, evaluate, evaluate_batch, evaluate_many
+
+EXPRESSIONS = [
+    "2 + 2",
+    "157 * 23 + 89",
+    "(1200 - 350) / 7",
+    "3.5 * (2 + 4.25) - 1 / 3",
+    "((12 + 8) * (7 - 3)) / (2 ** 4)",
+    "2 ** 64 - 1",
+]
+
+ADVERSARIAL = [
+    "9**9**9",
+    "2**10**10",
+    "(10**1000)**(10**1000)",
+    "99999999999**99999999999",
+    "10**4000 * 10**4000",
+    "2.0**100000",
+    "1e308 * 1e308",
+    "-" * 999 + "1",
+    "1" + "+1" * 499,
+    "(" * 400 + "1" + ")" * 400,
+    "9" * 999,
+    "__import__('os').system('true')",
+    "(-8) ** 0.5",
+    "1" * 5000,
+]
+
+
+def legacy_eval(expression: str):
+    """The calculator implementation this engine replaced."""
+    allowed_chars = set("0123456789+-*/(). ")
+    if not all(c in allowed_chars for c in expression):
+        raise ValueError("invalid characters")
+    return eval(expression)  # noqa: S307
+
+
+def bench(fn, iterations: int) -> float:
+    """Return mean microseconds per evaluation over all ``EXPRESSIONS``."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for expression in EXPRESSIONS:
+            fn(expression)
+    return (time.perf_counter() - start) / (iterations * len(EXPRESSIONS)) * 1e6
+
+
+def cold_evaluate(expression: str):
+    compile_expression.cache_clear()
+    return evaluate(expression)
+
+
+def bench_batch(rows: int) -> None:
+    """Compare row-by-row evaluation with the vectorized batch paths."""
+    rng = random.Random(0)
+    template = "price * qty * (1 + tax) - discount"
+    variables = {
+        "price": [round(rng.uniform(1, 500), 2) for _ in range(rows)],
+        "qty": [rng.randint(1, 50) for _ in range(rows)],
+        "tax": [rng.choice([0, 0.1, 0.08]) for _ in range(rows)],
+        "discount": [rng.randint(0, 20) for _ in range(rows)],
+    }
+    expressions = [
+        f"{variables['price'][i]} * {variables['qty'][i]} * (1 + {variables['tax'][i]}) - {variables['discount'][i]}"
+        for i in range(rows)
+    ]
+
+    def timed(fn) -> tuple[float, list]:
+        compile_expression.cache_clear()
+        start = time.perf_counter()
+        result = fn()
+        return (time.perf_counter() - start) * 1000, result
+
+    loop_ms, expected = timed(lambda: [evaluate(template, {k: v[i] for k, v in variables.items()}) for i in range(rows)])
+    batch_ms, batched = timed(lambda: evaluate_batch(template, variables))
+    each_ms, separate = timed(lambda: [evaluate(e) for e in expressions])
+    many_ms, many = timed(lambda: evaluate_many(expressions))
+    assert batched == expected and many == separate
+
+    print(f"\nbatch of {rows} rows{'':<8} {'ms':>10}")
+    print(f"{'template loop':<24} {loop_ms:10.2f}")
+    print(f"{'template batch':<24} {batch_ms:10.2f}  ({loop_ms / batch_ms:.1f}x)")
+    print(f"{'expressions one by one':<24} {each_ms:10.2f}")
+    print(f"{'expressions batched':<24} {many_ms:10.2f}  ({each_ms / many_ms:.1f}x)")
+
+
+def timed_adversarial(expression: str) -> tuple[float, str]:
+    """Evaluate one adversarial input and return (milliseconds, outcome)."""
+    compile_expression.cache_clear()
+    start = time.perf_counter()
+    try:
+        outcome = f"= {str(evaluate(expression))[:20]}"
+    except (ExpressionError, ZeroDivisionError) as e:
+        outcome = f"{type(e).__name__}: {str(e)[:60]}"
+    return (time.perf_counter() - start) * 1000, outcome
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--rows", type=int, default=5000, help="rows in the batch comparison")
+    parser.add_argument("--max-ms", type=float, default=50.0, help="latency bound for adversarial inputs")
+    args = parser.parse_args()
+
+    for expression in EXPRESSIONS:
+        assert evaluate(expression) == legacy_eval(expression), expression
+
+    print(f"{'path':<16} {'us/expr':>10}")
+    for label, fn in (("legacy eval", legacy_eval), ("engine cold", cold_evaluate), ("engine warm", evaluate)):
+        print(f"{label:<16} {bench(fn, args.iterations):10.2f}")
+    bench_batch(args.rows)
+
+    print(f"\nadversarial inputs (bound {args.max_ms:.0f}ms):")
+    failures = 0
+    with multiprocessing.Pool(1) as pool:
+        for expression in ADVERSARIAL:
+            label = expression if len(expression) <= 28 else expression[:25] + "..."
+            try:
+                elapsed, outcome = pool.apply_async(timed_adversarial, (expression,)).get(timeout=args.max_ms / 1000 + 5)
+            except multiprocessing.TimeoutError:
+                elapsed, outcome = float("inf"), "did not finish"
+            ok = elapsed <= args.max_ms
+            failures += not ok
+            print(f"  {'ok ' if ok else 'FAIL'} {label:<28} {elapsed:8.3f}ms  {outcome}")
+            if elapsed == float("inf"):
+                break
+
+    if failures:
+        print(f"\n{failures} adversarial input(s) exceeded {args.max_ms:.0f}ms")
+        sys.exit(1)
+    print("\nall adversarial inputs bounded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Checkpoint write latency and throughput of the SQLite checkpointer.
+
+Two workloads run against a fresh database for every fsync policy:
+
+* ``direct``: worker threads call ``SQLiteSaver.put`` in a loop with
+  checkpoints of a growing conversation, once with group commit and once
+  with one transaction per call (``max_batch=1``). Reports per-put p50/p99
+  latency, puts/sec and the mean number of calls sharing a commit.
+* ``graph``: concurrent sessions drive ``create_agent_graph`` with the
+  offline fake model and the saver attached. Reports per-step checkpoint
+  write latency (as seen by the graph) and sessions/sec next to the same run
+  without a checkpointer.
+
+Usage:
+    python benchmarks/checkpoint.py --threads 1 8 32 --puts 200 --sessions 200
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from react_agent.agent import create_agent_graph
+from react_agent.checkpoint import FSYNC_POLICIES, SQLiteSaver
+from react_agent.fake_llm import FakeChatModel
+from react_agent.llm import llm_manager
+
+
+def percentile_ms(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q / 100 * len(ordered)), len(ordered) - 1)] * 1000 if ordered else 0.0
+
+
+def run_direct(saver: SQLiteSaver, threads: int, puts: int) -> tuple[list[float], float]:
+    """Each thread writes ``puts`` checkpoints of its own conversation."""
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def worker(t: int) -> None:
+        config = {"configurable": {"thread_id": f"direct-{t}", "checkpoint_ns": ""}}
+        messages, version, local = [], None, []
+        for step in range(puts):
+            messages.append(HumanMessage(f"질문 {step}") if step % 2 == 0 else AIMessage(f"답변 {step} " * 8))
+            version = saver.get_next_version(version, None)
+            checkpoint = empty_checkpoint()
+            checkpoint["channel_values"] = {"messages": messages}
+            checkpoint["channel_versions"] = {"messages": version}
+            start = time.perf_counter()
+            config = saver.put(config, checkpoint, {"source": "loop", "step": step}, {"messages": version})
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    return latencies, threads * puts / (time.perf_counter() - start)
+
+
+class TimedSaver(SQLiteSaver):
+    """SQLiteSaver recording how long each graph-issued put takes."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies: list[float] = []
+
+    def put(self, *args, **kwargs):
+        start = time.perf_counter()
+        result = super().put(*args, **kwargs)
+        self.latencies.append(time.perf_counter() - start)
+        return result
+
+
+def run_graph(saver: SQLiteSaver | None, sessions: int, concurrency: int) -> float:
+    """Return sessions/sec of one-tool conversations, each on its own thread_id."""
+    agent = create_agent_graph(checkpointer=saver)
+
+    def one(i: int) -> None:
+        config = {"configurable": {"thread_id": uuid.uuid4().hex}}
+        agent.invoke({"messages": [HumanMessage(f"세션 {i}: 157 * 23 + 89를 계산해줘")]}, config)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(sessions)))
+    return sessions / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fsync", nargs="+", choices=list(FSYNC_POLICIES), default=list(FSYNC_POLICIES))
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--puts", type=int, default=200, help="checkpoints written per thread (direct)")
+    parser.add_argument("--sessions", type=int, default=200, help="graph sessions per run")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent graph sessions")
+    args = parser.parse_args()
+
+    model = FakeChatModel(tool_plan=[["calculator"]])
+    llm_manager.set_factory(lambda config: model)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'fsync':>7} {'threads':>8} {'batching':>9} {'p50':>9} {'p99':>9} {'puts/s':>9} {'calls/commit':>13}")
+        for fsync in args.fsync:
+            for threads in args.threads:
+                for label, max_batch in (("group", 256), ("none", 1)):
+                    with SQLiteSaver(Path(tmp) / f"direct-{fsync}-{threads}-{label}.db", fsync, max_batch) as saver:
+                        latencies, rate = run_direct(saver, threads, args.puts)
+                        stats = saver.stats()
+                    print(
+                        f"{fsync:>7} {threads:>8} {label:>9} {percentile_ms(latencies, 50):>7.2f}ms "
+                        f"{percentile_ms(latencies, 99):>7.2f}ms {rate:>9.0f} {stats['calls_per_commit']:>13.1f}"
+                    )
+
+        baseline = run_graph(None, args.sessions, args.concurrency)
+        print(f"\ngraph, {args.concurrency} concurrent sessions: no checkpointer {baseline:.0f} sessions/s")
+        for fsync in args.fsync:
+            with TimedSaver(Path(tmp) / f"graph-{fsync}.db", fsync) as saver:
+                rate = run_graph(saver, args.sessions, args.concurrency)
+                steps = len(saver.latencies) / args.sessions
+            print(
+                f"{fsync:>7}: {rate:6.0f} sessions/s, {steps:.0f} checkpoints/session, put "
+                f"p50 {percentile_ms(saver.latencies, 50):.2f}ms p99 {percentile_ms(saver.latencies, 99):.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
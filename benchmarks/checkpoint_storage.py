@@ -0,0 +1,109 @@
+"""Storage size and restore time of full vs delta-encoded checkpoints.
+
+Each configuration writes ``--threads`` conversations of ``--steps``
+checkpoints (one new message per step, as ``add_messages`` produces) into a
+fresh ``SQLiteSaver`` database, then reports:
+
+* database size and serialized blob bytes,
+* write time per step,
+* restore latency (``get_tuple``) of the latest and of random earlier
+  checkpoints,
+* size and latest-restore latency after ``compact(keep=1)`` and ``vacuum``.
+
+``snapshot_every=0`` stores every version in full, which is the
+O(steps²) baseline.
+
+Usage:
+    python benchmarks/checkpoint_storage.py --steps 1000 --snapshot-every 0 8 32 128
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from react_agent.checkpoint import SQLiteSaver
+
+
+def percentile_ms(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q / 100 * len(ordered)), len(ordered) - 1)] * 1000 if ordered else 0.0
+
+
+def write_thread(saver: SQLiteSaver, thread_id: str, steps: int) -> list[str]:
+    """Write one conversation and return its checkpoint ids in order."""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    messages, version, ids = [], None, []
+    for step in range(steps):
+        if step % 2 == 0:
+            message = HumanMessage(f"질문 {step}: 157 * {step} + 89는 얼마야?", id=uuid.uuid4().hex)
+        else:
+            message = AIMessage(f"답변 {step}: 계산 결과는 {157 * step + 89}입니다. " * 3, id=uuid.uuid4().hex)
+        messages = [*messages, message]
+        version = saver.get_next_version(version, None)
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": messages}
+        checkpoint["channel_versions"] = {"messages": version}
+        config = saver.put(config, checkpoint, {"source": "loop", "step": step}, {"messages": version})
+        ids.append(checkpoint["id"])
+    return ids
+
+
+def restore_ms(saver: SQLiteSaver, thread_id: str, checkpoint_ids: list[str | None]) -> list[float]:
+    latencies = []
+    for checkpoint_id in checkpoint_ids:
+        config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+        if checkpoint_id is not None:
+            config["configurable"]["checkpoint_id"] = checkpoint_id
+        start = time.perf_counter()
+        saver.get_tuple(config)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=3)
+    parser.add_argument("--snapshot-every", type=int, nargs="+", default=[0, 8, 32, 128])
+    parser.add_argument("--restores", type=int, default=50, help="restores measured per checkpoint kind")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(
+        f"{'snapshot':>9} {'db':>9} {'blobs':>9} {'write/step':>11} {'latest p50':>11} "
+        f"{'random p50':>11} {'random p99':>11} {'compacted':>10} {'latest p50':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for every in args.snapshot_every:
+            with SQLiteSaver(Path(tmp) / f"every-{every}.db", fsync="off", snapshot_every=every) as saver:
+                start = time.perf_counter()
+                history = {f"t{t}": write_thread(saver, f"t{t}", args.steps) for t in range(args.threads)}
+                write_ms = (time.perf_counter() - start) / (args.threads * args.steps) * 1000
+                stats = saver.stats()
+
+                latest = restore_ms(saver, "t0", [None] * args.restores)
+                earlier = restore_ms(saver, "t0", [rng.choice(history["t0"]) for _ in range(args.restores)])
+
+                for thread_id in history:
+                    saver.compact(thread_id, keep=1)
+                saver.vacuum()
+                compacted = saver.stats()
+                after = restore_ms(saver, "t0", [None] * args.restores)
+            label = "full" if every <= 0 else str(every)
+            print(
+                f"{label:>9} {stats['db_bytes'] / 1024 / 1024:>7.1f}MB {stats['blob_bytes'] / 1024 / 1024:>7.1f}MB "
+                f"{write_ms:>9.2f}ms {percentile_ms(latest, 50):>9.2f}ms {percentile_ms(earlier, 50):>9.2f}ms "
+                f"{percentile_ms(earlier, 99):>9.2f}ms {compacted['db_bytes'] / 1024:>8.0f}KB "
+                f"{percentile_ms(after, 50):>9.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
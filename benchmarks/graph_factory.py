@@ -0,0 +1,131 @@
+"""Per-request graph construction vs the shared compiled-graph factory.
+
+Simulates a server that handles each request with an agent graph, using the
+offline fake model:
+
+* ``build``: ``create_agent_graph()`` per request (the old pattern),
+* ``shared``: ``get_agent_graph()`` per request (one cached graph).
+
+For each it reports per-request latency, requests/sec from a thread pool and
+how many threads the process ends up with (every built graph owns a tool
+thread pool). It also measures first-request latency in a fresh process with
+and without ``warm_up()``, and runs the shared async graph from several event
+loops at once to check that concurrent use stays correct.
+
+Usage:
+    python benchmarks/graph_factory.py --requests 500 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage
+
+from react_agent.agent import clear_agent_graphs, create_agent_graph, get_agent_graph
+from react_agent.fake_llm import FakeChatModel
+from react_agent.llm import llm_manager
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FIRST_REQUEST = """
+import time
+from langchain_core.messages import HumanMessage
+from react_agent.agent import get_agent_graph, warm_up
+from react_agent.fake_llm import FakeChatModel
+from react_agent.llm import llm_manager
+model = FakeChatModel(tool_plan=[["calculator"]])
+llm_manager.set_factory(lambda config: model)
+if {warm}:
+    warm_up()
+start = time.perf_counter()
+get_agent_graph().invoke({{"messages": [HumanMessage("157 * 23 + 89를 계산해줘")]}})
+print(time.perf_counter() - start)
+"""
+
+
+def _inputs(i: int) -> dict:
+    return {"messages": [HumanMessage(f"요청 {i}: 157 * 23 + 89를 계산해줘")]}
+
+
+def run_requests(factory, requests: int, concurrency: int) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def one(i: int) -> None:
+        start = time.perf_counter()
+        factory().invoke(_inputs(i))
+        with lock:
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    return latencies, requests / (time.perf_counter() - start)
+
+
+def first_request_ms(warm: bool, repeat: int) -> float:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    code = FIRST_REQUEST.format(warm=warm)
+    runs = [
+        float(subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeat)
+    ]
+    return statistics.median(runs) * 1000
+
+
+def run_event_loops(loops: int, sessions: int) -> int:
+    """Drive the shared async graph from ``loops`` threads, each with its own event loop."""
+    graph = get_agent_graph(async_mode=True)
+    answers = []
+
+    def loop_main(n: int) -> None:
+        async def main() -> list:
+            return await asyncio.gather(*(graph.ainvoke(_inputs(n * sessions + i)) for i in range(sessions)))
+
+        results = asyncio.run(main())
+        answers.extend(len(r["messages"]) for r in results)
+
+    threads = [threading.Thread(target=loop_main, args=(n,)) for n in range(loops)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sum(count == 4 for count in answers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--loops", type=int, default=4, help="event loops sharing the async graph")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per first-request measurement")
+    args = parser.parse_args()
+
+    model = FakeChatModel(tool_plan=[["calculator"]])
+    llm_manager.set_factory(lambda config: model)
+
+    print(f"{'mode':>7} {'p50':>9} {'p99':>9} {'req/s':>8} {'threads':>8}")
+    for label, factory in (("shared", get_agent_graph), ("build", create_agent_graph)):
+        clear_agent_graphs()
+        latencies, rate = run_requests(factory, args.requests, args.concurrency)
+        latencies.sort()
+        p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+        print(f"{label:>7} {p50 * 1000:>7.2f}ms {p99 * 1000:>7.2f}ms {rate:>8.0f} {threading.active_count():>8}")
+
+    cold, warm = first_request_ms(False, args.repeat), first_request_ms(True, args.repeat)
+    print(f"\nfirst request in a fresh process: {cold:.1f}ms cold, {warm:.1f}ms after warm_up()")
+
+    ok = run_event_loops(args.loops, 50)
+    print(f"{args.loops} event loops x 50 sessions on one async graph: {ok}/{args.loops * 50} completed correctly")
+
+
+if __name__ == "__main__":
+    main()
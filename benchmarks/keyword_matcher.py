@@ -0,0 +1,75 @@
+"""Keyword lookup cost vs table size: substring scan vs Aho-Corasick automaton.
+
+For each table size a keyword table is generated (the three built-in
+``search_web`` keywords plus random multi-word phrases), and a fixed set of
+queries is run through the old per-keyword ``keyword in query`` scan and the
+``KeywordTable`` automaton. The automaton's per-query time should stay flat
+as the table grows while the scan grows linearly; build time is reported
+separately since it is paid once per table change.
+
+Usage:
+    python benchmarks/keyword_matcher.py --sizes 100 1000 10000 100000
+"""
+
+import argparse
+import random
+import time
+
+from react_agent.keyword_matcher import KeywordTable
+from react_agent.tools import MOCK_RESULTS
+
+SYLLABLES = ["lang", "graph", "re", "act", "ge", "mi", "ni", "ap", "i", "to", "ol", "no", "de", "se", "arch", "cal", "cu"]
+
+
+def make_table(size: int, rng: random.Random) -> dict[str, str]:
+    table = dict(MOCK_RESULTS)
+    while len(table) < size:
+        words = ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(rng.randint(1, 2))]
+        table[" ".join(words)] = f"result for {' '.join(words)}"
+    return table
+
+
+def make_queries(count: int, rng: random.Random) -> list[str]:
+    templates = ["What is {}?", "Tell me about {} and how it compares", "{} 검색해줘", "search {} docs for a react agent"]
+    topics = ["LangGraph", "the Gemini API", "graph search", "a calculator tool", "langgraph nodes"]
+    return [rng.choice(templates).format(rng.choice(topics)) for _ in range(count)]
+
+
+def scan(table: dict[str, str], query: str) -> list[str]:
+    """The original search_web lookup generalized to return every match."""
+    query_lower = query.lower()
+    return [keyword for keyword in table if keyword in query_lower]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    queries = make_queries(args.queries, rng)
+    print(f"{'keywords':>9} {'build':>10} {'scan us/q':>10} {'automaton us/q':>15}")
+    for size in args.sizes:
+        plain = make_table(size, rng)
+        table = KeywordTable(plain)
+
+        start = time.perf_counter()
+        matcher = table.matcher
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        expected = [scan(plain, q) for q in queries]
+        scan_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+        start = time.perf_counter()
+        found = [table.lookup(q) for q in queries]
+        automaton_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+        assert [sorted(k for k, _ in f) for f in found] == [sorted(e) for e in expected]
+        print(f"{len(matcher.keywords):>9} {build_ms:>8.1f}ms {scan_us:>10.1f} {automaton_us:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Sequential vs parallel execution of several I/O-bound tool calls.
+
+The fake model issues ``--calls`` tool calls in a single AIMessage, each
+sleeping ``--tool-latency`` seconds, first with a sync tool and then with an
+async one. With ParallelToolNode the tool step should take roughly the
+slowest call instead of the sum of all calls.
+
+Usage:
+    python benchmarks/parallel_tools.py --calls 4 --tool-latency 0.2
+"""
+
+import argparse
+import asyncio
+import time
+
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import tool
+from langgraph.graph import END, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from react_agent.agent import agent_node, should_continue
+from react_agent.fake_llm import FakeChatModel
+from react_agent.llm import llm_manager
+from react_agent.state import AgentState
+from react_agent.tool_executor import ParallelToolNode
+
+TOOL_LATENCY = 0.2
+
+
+@tool
+def slow_lookup(query: str) -> str:
+    """Simulate an I/O-bound lookup."""
+    time.sleep(TOOL_LATENCY)
+    return f"result for {query}"
+
+
+@tool
+async def slow_fetch(query: str) -> str:
+    """Simulate an async I/O-bound fetch."""
+    await asyncio.sleep(TOOL_LATENCY)
+    return f"fetched {query}"
+
+
+def build(tool_node) -> StateGraph:
+    """Build the ReAct loop around ``tool_node``."""
+    graph = StateGraph(AgentState)
+    graph.add_node("agent", agent_node)
+    graph.add_node("tools", tool_node)
+    graph.set_entry_point("agent")
+    graph.add_conditional_edges("agent", should_continue, {"tools": "tools", END: END})
+    graph.add_edge("tools", "agent")
+    return graph.compile()
+
+
+def main() -> None:
+    global TOOL_LATENCY
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=4)
+    parser.add_argument("--tool-latency", type=float, default=0.2)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    TOOL_LATENCY = args.tool_latency
+
+    inputs = {"messages": [HumanMessage(content="look everything up")]}
+    tools = [slow_lookup, slow_fetch]
+    sequential = build(ToolNode(tools).with_config(max_concurrency=1))
+    parallel = build(ParallelToolNode(tools).as_runnable())
+
+    for tool_name in ("slow_lookup", "slow_fetch"):
+        model = FakeChatModel(tool_plan=[[tool_name] * args.calls], tool_args={tool_name: {"query": "x"}})
+        llm_manager.set_factory(lambda config, model=model: model)
+        print(f"{args.calls} x {tool_name} ({args.tool_latency}s each)")
+
+        # ToolNode limited to one call at a time stands in for sequential execution
+        for name, agent in (("ToolNode(max_concurrency=1)", sequential), ("ParallelToolNode", parallel)):
+            timings = []
+            if tool_name == "slow_lookup" or agent is parallel:
+                start = time.perf_counter()
+                for _ in range(args.runs):
+                    agent.invoke(inputs)
+                timings.append(f"sync {(time.perf_counter() - start) / args.runs * 1000:7.1f}ms")
+
+            async def run_async(agent=agent):
+                for _ in range(args.runs):
+                    await agent.ainvoke(inputs)
+
+            start = time.perf_counter()
+            asyncio.run(run_async())
+            timings.append(f"async {(time.perf_counter() - start) / args.runs * 1000:7.1f}ms")
+            print(f"  {name:<28} " + "  ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
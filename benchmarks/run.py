@@ -0,0 +1,257 @@
+"""End-to-end throughput and per-node latency benchmarks for the agent graph.
+
+Every scenario drives ``create_agent_graph()`` with the offline fake backend,
+so the numbers measure the graph machinery (StateGraph, ToolNode,
+add_messages) and the tools rather than network time. For each scenario the
+suite reports p50/p95/p99 latency per node, graph overhead (session wall time
+minus time spent inside nodes) and sessions/sec at several concurrency
+levels, and writes everything as JSON.
+
+Usage:
+    python benchmarks/run.py --out results.json
+    python benchmarks/run.py --out results.json --compare baseline.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import AIMessage, HumanMessage
+
+from react_agent.agent import create_agent_graph
+from react_agent.fake_llm import FakeChatModel, Latency
+from react_agent.llm import llm_manager
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmark workload."""
+
+    tool_plan: tuple[tuple[str, ...], ...]
+    history: int = 0
+
+
+SCENARIOS = {
+    "no_tool": Scenario(()),
+    "single_calculator": Scenario((("calculator",),)),
+    "multi_tool_chain": Scenario((("search_web", "calculator"), ("get_current_time",), ("calculator",))),
+    "history_10": Scenario((("calculator",),), history=10),
+    "history_100": Scenario((("calculator",),), history=100),
+    "history_1000": Scenario((("calculator",),), history=1000),
+}
+
+
+class NodeTimer(BaseCallbackHandler):
+    """Callback handler recording the wall time of each top-level graph node."""
+
+    def __init__(self):
+        self.root = None
+        self.starts: dict = {}
+        self.names: dict = {}
+        self.durations: list[tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, metadata=None, **kwargs):
+        with self._lock:
+            if parent_run_id is None:
+                self.root = run_id
+            elif parent_run_id == self.root:
+                self.starts[run_id] = time.perf_counter()
+                self.names[run_id] = kwargs.get("name") or (metadata or {}).get("langgraph_node", "?")
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        with self._lock:
+            start = self.starts.pop(run_id, None)
+            if start is not None:
+                self.durations.append((self.names.pop(run_id), time.perf_counter() - start))
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self.on_chain_end(None, run_id=run_id)
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of ``values`` (``q`` in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(q / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(values: list[float]) -> dict:
+    """Return p50/p95/p99/mean in milliseconds."""
+    return {
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "mean_ms": sum(values) / len(values) * 1000 if values else 0.0,
+    }
+
+
+def make_history(length: int) -> list:
+    """Build a synthetic prior conversation of ``length`` messages."""
+    messages = []
+    for i in range(length):
+        if i % 2 == 0:
+            messages.append(HumanMessage(content=f"이전 질문 {i}: {i} * 3 + 7는 얼마야?"))
+        else:
+            messages.append(AIMessage(content=f"이전 답변 {i}: 계산 결과는 {i * 3 + 7}입니다."))
+    return messages
+
+
+def use_fake_model(scenario: Scenario, latency: float, token_latency: float) -> None:
+    """Point the shared LLM client at a fake model running ``scenario``'s plan."""
+    model = FakeChatModel(
+        tool_plan=[list(step) for step in scenario.tool_plan],
+        first_token_latency=Latency("constant", latency),
+        token_latency=Latency("constant", token_latency),
+    )
+    llm_manager.set_factory(lambda config: model)
+
+
+def run_latency(agent, scenario: Scenario, sessions: int) -> dict:
+    """Run sessions one at a time and collect per-node and overhead latency."""
+    history = make_history(scenario.history)
+    node_times: dict[str, list[float]] = {}
+    overheads, totals = [], []
+
+    for i in range(sessions):
+        timer = NodeTimer()
+        inputs = {"messages": [*history, HumanMessage(content=f"세션 {i}: 157 * 23 + 89를 계산해줘")]}
+        start = time.perf_counter()
+        agent.invoke(inputs, config={"callbacks": [timer]})
+        total = time.perf_counter() - start
+        totals.append(total)
+        overheads.append(total - sum(d for _, d in timer.durations))
+        for name, duration in timer.durations:
+            node_times.setdefault(name, []).append(duration)
+
+    return {
+        "session": summarize(totals),
+        "graph_overhead": summarize(overheads),
+        "nodes": {name: summarize(values) for name, values in sorted(node_times.items())},
+    }
+
+
+def run_throughput(agent, scenario: Scenario, sessions: int, concurrency: int) -> float:
+    """Return sessions/sec with ``concurrency`` worker threads."""
+    history = make_history(scenario.history)
+
+    def one(i: int) -> None:
+        agent.invoke({"messages": [*history, HumanMessage(content=f"세션 {i}: 157 * 23 + 89를 계산해줘")]})
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(sessions)))
+    return sessions / (time.perf_counter() - start)
+
+
+def run_suite(args) -> dict:
+    """Run the selected scenarios and return the JSON-ready report."""
+    agent = create_agent_graph()
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "sessions": args.sessions,
+            "latency": args.latency,
+            "token_latency": args.token_latency,
+        },
+        "scenarios": {},
+    }
+
+    for name in args.scenarios:
+        scenario = SCENARIOS[name]
+        use_fake_model(scenario, args.latency, args.token_latency)
+        # Warm up client, tool binding and any lazy imports
+        run_latency(agent, scenario, 2)
+
+        result = run_latency(agent, scenario, args.sessions)
+        result["throughput"] = {
+            str(c): run_throughput(agent, scenario, args.sessions, c) for c in args.concurrency
+        }
+        report["scenarios"][name] = result
+
+        session = result["session"]
+        rates = " ".join(f"c{c}={rate:.0f}/s" for c, rate in result["throughput"].items())
+        print(
+            f"{name:<18} session p50={session['p50_ms']:7.2f}ms p99={session['p99_ms']:7.2f}ms "
+            f"overhead p50={result['graph_overhead']['p50_ms']:6.2f}ms {rates}"
+        )
+        for node, stats in result["nodes"].items():
+            print(f"  {node:<16} p50={stats['p50_ms']:7.2f}ms p95={stats['p95_ms']:7.2f}ms p99={stats['p99_ms']:7.2f}ms")
+
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return human-readable regressions of ``report`` against ``baseline``.
+
+    Latency metrics regress when they grow by more than ``tolerance``
+    (relative); throughput regresses when it drops by more than ``tolerance``.
+    """
+    regressions = []
+    for name, current in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+
+        latency_pairs = [("session", current["session"], base["session"])]
+        latency_pairs.append(("graph_overhead", current["graph_overhead"], base["graph_overhead"]))
+        latency_pairs += [
+            (f"node {node}", stats, base["nodes"][node]) for node, stats in current["nodes"].items() if node in base["nodes"]
+        ]
+        for label, cur, old in latency_pairs:
+            for metric in ("p50_ms", "p95_ms"):
+                if old[metric] > 0 and cur[metric] > old[metric] * (1 + tolerance):
+                    regressions.append(f"{name} {label} {metric}: {old[metric]:.2f} -> {cur[metric]:.2f}")
+
+        for level, rate in current["throughput"].items():
+            old_rate = base.get("throughput", {}).get(level)
+            if old_rate and rate < old_rate * (1 - tolerance):
+                regressions.append(f"{name} throughput c{level}: {old_rate:.1f}/s -> {rate:.1f}/s")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--sessions", type=int, default=200, help="sessions per measurement")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--latency", type=float, default=0.0, help="fake model time to first token (s)")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="fake model delay between tokens (s)")
+    parser.add_argument("--out", type=str, help="write the JSON report to this file")
+    parser.add_argument("--compare", type=str, metavar="BASELINE", help="flag regressions against a stored report")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    args = parser.parse_args()
+
+    report = run_suite(args)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nreport written to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nno regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Build and query latency of the BM25 search index on synthetic corpora.
+
+For each corpus size a JSONL corpus with a Zipf-distributed vocabulary is
+generated in a temporary directory, indexed with ``SearchIndex.build`` and
+reopened (memory-mapped) before querying. Reported per size: build time,
+index size, open time and p50/p95/p99 latency of top-k queries with and
+without snippet extraction.
+
+Usage:
+    python benchmarks/search_index.py --sizes 10000 100000 1000000 --queries 500
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from react_agent.search_index import SearchIndex
+
+
+def percentile_ms(values: list[float], q: float) -> float:
+    return float(np.percentile(values, q)) * 1000
+
+
+def write_corpus(path: Path, docs: int, vocab: int, doc_words: int, seed: int) -> list[str]:
+    """Write a synthetic JSONL corpus and return its vocabulary."""
+    rng = np.random.default_rng(seed)
+    words = [f"w{i:x}" for i in range(vocab)]
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, docs, 10000):
+            count = min(10000, docs - start)
+            ids = np.minimum(rng.zipf(1.2, size=(count, doc_words)) - 1, vocab - 1)
+            for offset, row in enumerate(ids):
+                text = " ".join(words[i] for i in row)
+                f.write(json.dumps({"title": f"doc {start + offset}", "text": text}) + "\n")
+    return words
+
+
+def run_size(size: int, args, workdir: Path) -> dict:
+    corpus = workdir / f"corpus_{size}.jsonl"
+    words = write_corpus(corpus, size, args.vocab, args.doc_words, args.seed)
+
+    start = time.perf_counter()
+    SearchIndex.build(corpus, workdir / f"index_{size}")
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SearchIndex.open(workdir / f"index_{size}")
+    open_ms = (time.perf_counter() - start) * 1000
+
+    # Queries mix frequent and rare terms, 1-3 terms each
+    rng = np.random.default_rng(args.seed + 1)
+    queries = [
+        " ".join(words[min(int(i) - 1, args.vocab - 1)] for i in rng.zipf(1.1, size=rng.integers(1, 4)))
+        for _ in range(args.queries)
+    ]
+    result = {"docs": size, "build_s": build_seconds, "index_mb": index.stats()["index_bytes"] / 1024 / 1024}
+    result["open_ms"] = open_ms
+    for label, snippets in (("ranked", False), ("snippets", True)):
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query, k=args.k, snippets=snippets)
+            latencies.append(time.perf_counter() - start)
+        result[label] = {f"p{q}_ms": percentile_ms(latencies, q) for q in (50, 95, 99)}
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--vocab", type=int, default=50000)
+    parser.add_argument("--doc-words", type=int, default=60)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'docs':>9} {'build':>8} {'size':>8} {'open':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'+snip p50':>10} {'+snip p99':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            r = run_size(size, args, Path(tmp))
+            ranked, snip = r["ranked"], r["snippets"]
+            print(
+                f"{r['docs']:>9} {r['build_s']:>7.1f}s {r['index_mb']:>6.1f}MB {r['open_ms']:>6.2f}ms "
+                f"{ranked['p50_ms']:>6.2f}ms {ranked['p95_ms']:>6.2f}ms {ranked['p99_ms']:>6.2f}ms "
+                f"{snip['p50_ms']:>8.2f}ms {snip['p99_ms']:>8.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Precision/recall of the semantic cache on a labeled paraphrase set.
+
+Each anchor query is cached with a distinct answer, then every probe is looked
+up. A probe labeled with an anchor should hit that anchor's answer; probes
+labeled None should miss. Results are reported for a sweep of thresholds.
+
+Finally the agent graph is run twice on a calculator question and twice on a
+time question with the semantic cache enabled: the repeated calculator
+question must be a cache hit, and the repeated time question must miss and
+call ``get_current_time`` again, since its answer depends on the clock.
+
+Usage:
+    python benchmarks/semantic_cache_pr.py
+"""
+
+import argparse
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from react_agent.agent import get_agent_graph
+from react_agent.fake_llm import FakeChatModel
+from react_agent.llm import llm_manager
+from react_agent.semantic_cache import SemanticCache, configure_semantic_cache
+
+ANCHORS = [
+    "157*23+89 계산해줘",
+    "LangGraph에 대해 검색해줘",
+    "지금 몇 시야?",
+    "ReAct agent가 뭐야?",
+    "Gemini API에 대해 알려줘",
+    "1024 / 8 계산해줘",
+    "what is 12 plus 30",
+    "안녕! 너는 어떤 도구들을 사용할 수 있어?",
+    "12345678 * 87654321 - 1000000 + 99999",
+    "Gemini API limits",
+]
+
+# (probe, index of the anchor it paraphrases or None)
+PROBES = [
+    ("157 곱하기 23 더하기 89", 0),
+    ("157 * 23 + 89", 0),
+    ("157*23+89 계산해", 0),
+    ("157*23+89를 계산해줘", 0),
+    ("157*23+90 계산해줘", None),
+    ("158 곱하기 23 더하기 89", None),
+    ("LangGraph 검색해줘", 1),
+    ("langgraph에 대해서 검색해줘", 1),
+    ("LangChain에 대해 검색해줘", None),
+    ("지금 몇 시야", 2),
+    ("지금 몇시야?", 2),
+    ("내일 몇 시야?", None),
+    ("ReAct agent가 뭐야", 3),
+    ("react agent 가 뭐야?", 3),
+    ("ReAct 논문 저자가 누구야?", None),
+    ("Gemini API 알려줘", 4),
+    ("gemini api에 대해서 좀 알려줘", 4),
+    ("Gemini 요금제 알려줘", None),
+    ("1024 나누기 8 계산해줘", 5),
+    ("1024/8", 5),
+    ("1024 / 16 계산해줘", None),
+    ("What is 12 plus 30?", 6),
+    ("calculate 12 + 30", 6),
+    ("what is 12 minus 30", None),
+    ("안녕! 너는 어떤 도구를 사용할 수 있어?", 7),
+    ("너는 어떤 도구들을 쓸 수 있어?", 7),
+    ("오늘 날씨 어때?", None),
+    ("12345678 * 87654321 - 1000000 + 99999 계산해줘", 8),
+    ("gemini api limits", 9),
+    # Near misses: same numbers or context, different operators or key word
+    ("12345678 * 87654321 + 1000000 - 99999 계산해줘", None),
+    ("12345678 + 87654321 - 1000000 + 99999", None),
+    ("what is 12 times 30", None),
+    ("1024 * 8 계산해줘", None),
+    ("Gemini API pricing", None),
+    ("Gemini API limits in Korea", None),
+]
+
+
+def evaluate(threshold: float) -> dict:
+    """Return precision/recall/F1 and lookup latency at ``threshold``."""
+    cache = SemanticCache(threshold=threshold)
+    for i, anchor in enumerate(ANCHORS):
+        cache.add([], anchor, AIMessage(content=f"answer-{i}"))
+
+    tp = fp = fn = 0
+    start = time.perf_counter()
+    for probe, label in PROBES:
+        hit = cache.lookup([], probe)
+        if hit is not None and label is not None and hit.content == f"answer-{label}":
+            tp += 1
+        elif hit is not None:
+            fp += 1
+        elif label is not None:
+            fn += 1
+    elapsed = time.perf_counter() - start
+
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "threshold": threshold,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "lookup_us": elapsed / len(PROBES) * 1e6,
+    }
+
+
+def check_impure_tools() -> None:
+    """Assert that answers built from impure tools are never served from the cache."""
+    agent = get_agent_graph()
+    for tool_name, query, cacheable in (
+        ("calculator", "157*23+89 계산해줘", True),
+        ("get_current_time", "지금 몇 시야?", False),
+    ):
+        model = FakeChatModel(tool_plan=[[tool_name]])
+        llm_manager.set_factory(lambda config, model=model: model)
+        cache = configure_semantic_cache()
+        runs = []
+        for _ in range(2):
+            result = agent.invoke({"messages": [HumanMessage(content=query)]})
+            runs.append(sum(isinstance(m, ToolMessage) for m in result["messages"]))
+        hits = cache.stats()["hits"]
+        if cacheable:
+            assert hits == 1 and runs == [1, 0], f"{tool_name}: expected a cache hit, got {hits} hits, tool runs {runs}"
+        else:
+            assert hits == 0 and runs == [1, 1], f"{tool_name}: served from cache ({hits} hits, tool runs {runs})"
+        print(f"{tool_name}: {hits} semantic hits, tool calls per run {runs}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--thresholds", type=float, nargs="+", default=[0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95])
+    args = parser.parse_args()
+
+    print(f"{'threshold':>9} {'precision':>9} {'recall':>7} {'f1':>6} {'lookup':>10}")
+    for threshold in args.thresholds:
+        r = evaluate(threshold)
+        print(
+            f"{r['threshold']:>9.2f} {r['precision']:>9.3f} {r['recall']:>7.3f} {r['f1']:>6.3f} {r['lookup_us']:>8.1f}us"
+        )
+    print()
+    check_impure_tools()
+
+
+if __name__ == "__main__":
+    main()
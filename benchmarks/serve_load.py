@@ -0,0 +1,206 @@
+"""Load-test client for ``main.py --serve``.
+
+Opens ``--concurrency`` keep-alive connections, each sending requests back to
+back until ``--requests`` have completed, and reports requests/sec, p50/p95/p99
+latency, time to first token for streamed requests, errors and how many TCP
+connections were needed (1 per worker when keep-alive works).
+
+By default the script starts its own server with the fake model backend
+(``--latency`` seconds per model call) and finally checks graceful drain:
+it sends SIGTERM while ``--concurrency`` requests are in flight and expects
+every one of them to finish with 200 and the server to exit cleanly. Use
+``--url`` to target a server that is already running instead.
+
+With ``--distinct N`` the requests cycle through N questions, so many
+identical questions are in flight at once; ``--coalesce`` starts the server
+with in-flight request coalescing and reports how many runs were shared.
+
+Usage:
+    python benchmarks/serve_load.py --requests 2000 --concurrency 32 --mode stream
+    python benchmarks/serve_load.py --url http://127.0.0.1:8000 --sessions 50
+    python benchmarks/serve_load.py --distinct 5 --coalesce
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection that reconnects when the server closes it."""
+
+    def __init__(self, host: str, port: int):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+        self.opened = 0
+
+    async def request(self, path: str, body: dict | None = None) -> tuple[int, bytes, float | None]:
+        """Send a POST (GET without ``body``) and return (status, body, seconds to the first SSE token)."""
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            self.opened += 1
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else b""
+        method = "POST" if body is not None else "GET"
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+        self.writer.write(f"{head}Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data)
+        start = time.perf_counter()
+        status = int((await self.reader.readline()).split()[1])
+        headers = {}
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        first_token = None
+        if headers.get("transfer-encoding") == "chunked":
+            chunks = []
+            while size := int((await self.reader.readline()).strip(), 16):
+                chunk = await self.reader.readexactly(size + 2)
+                if first_token is None and chunk.startswith(b"event: token"):
+                    first_token = time.perf_counter() - start
+                chunks.append(chunk[:-2])
+            await self.reader.readline()
+            payload = b"".join(chunks)
+        else:
+            payload = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection") == "close":
+            self.close()
+        return status, payload, first_token
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q / 100 * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+async def run_load(
+    host: str, port: int, requests: int, concurrency: int, mode: str, sessions: int, distinct: int = 0
+) -> dict:
+    counter = iter(range(requests))
+    latencies, ttfts, errors, connections = [], [], [], []
+
+    async def worker() -> None:
+        conn = Connection(host, port)
+        connections.append(conn)
+        for i in counter:
+            body = {"query": f"요청 {i % distinct if distinct else i}: 157 * 23 + 89를 계산해줘"}
+            if sessions:
+                body["thread_id"] = f"load-{i % sessions}"
+            path = "/chat/stream" if mode == "stream" or (mode == "both" and i % 2) else "/chat"
+            start = time.perf_counter()
+            try:
+                status, payload, ttft = await conn.request(path, body)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+                conn.close()
+                errors.append(type(e).__name__)
+                continue
+            latencies.append(time.perf_counter() - start)
+            if ttft is not None:
+                ttfts.append(ttft)
+            if status != 200 or b"event: error" in payload:
+                errors.append(str(status))
+        conn.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    conn = Connection(host, port)
+    health = json.loads((await conn.request("/health"))[1])
+    conn.close()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "ttft_p50": percentile(ttfts, 50) if ttfts else None,
+        "errors": len(errors),
+        "connections": sum(c.opened for c in connections),
+        "coalesce": health.get("coalesce"),
+    }
+
+
+async def check_drain(host: str, port: int, server: subprocess.Popen, concurrency: int) -> tuple[int, int]:
+    """SIGTERM the server mid-load and return (requests answered with 200, in flight)."""
+    conns = [Connection(host, port) for _ in range(concurrency)]
+    tasks = [asyncio.create_task(c.request("/chat", {"query": f"drain {i}"})) for i, c in enumerate(conns)]
+    await asyncio.sleep(0.05)
+    server.send_signal(signal.SIGTERM)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for conn in conns:
+        conn.close()
+    return sum(not isinstance(r, BaseException) and r[0] == 200 for r in results), len(tasks)
+
+
+def start_server(port: int, latency: float, coalesce: bool) -> subprocess.Popen:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src"), "FAKE_LLM_LATENCY": str(latency)}
+    cmd = [sys.executable, str(ROOT / "main.py"), "--backend", "fake", "--serve", "--port", str(port)]
+    if coalesce:
+        cmd.append("--coalesce")
+    server = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, text=True)
+    # The server prints its address once it is accepting connections
+    server.stdout.readline()
+    server.stdout.readline()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", type=str, help="existing server (default: start one with the fake backend)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32, help="keep-alive connections")
+    parser.add_argument("--mode", choices=["chat", "stream", "both"], default="both")
+    parser.add_argument("--sessions", type=int, default=0, help="reuse this many thread_ids (0: new session each)")
+    parser.add_argument("--distinct", type=int, default=0, help="cycle through this many questions (0: all unique)")
+    parser.add_argument("--coalesce", action="store_true", help="start the server with --coalesce")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake model latency of the started server")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        host, server = "127.0.0.1", start_server(port, args.latency, args.coalesce)
+
+    try:
+        result = asyncio.run(
+            run_load(host, port, args.requests, args.concurrency, args.mode, args.sessions, args.distinct)
+        )
+        ttft = f"{result['ttft_p50'] * 1000:.1f}ms" if result["ttft_p50"] is not None else "-"
+        print(
+            f"{args.requests} requests ({args.mode}), {args.concurrency} connections: "
+            f"{result['rps']:.0f} req/s, p50 {result['p50'] * 1000:.1f}ms, p95 {result['p95'] * 1000:.1f}ms, "
+            f"p99 {result['p99'] * 1000:.1f}ms, first token p50 {ttft}, "
+            f"{result['errors']} errors, {result['connections']} TCP connections"
+        )
+        if result["coalesce"]:
+            shared = result["coalesce"]
+            print(f"coalescing: {shared['runs']} graph runs, {shared['joined']} requests joined an in-flight run")
+        if server is not None:
+            ok, total = asyncio.run(check_drain(host, port, server, args.concurrency))
+            code = server.wait(timeout=60)
+            print(f"drain: {ok}/{total} in-flight requests completed after SIGTERM, server exit code {code}")
+    finally:
+        if server is not None and server.poll() is None:
+            server.kill()
+
+
+if __name__ == "__main__":
+    main()
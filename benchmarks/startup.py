@@ -0,0 +1,142 @@
+"""CLI and package startup time, measured with ``python -X importtime``.
+
+Each target command runs ``--repeat`` times in a fresh interpreter. The
+``-X importtime`` output is parsed into per-module self and cumulative
+import times (median over runs), and the report lists wall time, total
+import time and the slowest modules per target.
+
+The run fails (exit 1) when:
+
+* a target imports a module it must not (e.g. ``--help`` loading LangGraph), or
+* with ``--compare``, a target's wall or import time grows by more than
+  ``--tolerance`` and ``--min-delta-ms`` over the stored baseline.
+
+Usage:
+    python benchmarks/startup.py --out startup.json
+    python benchmarks/startup.py --compare startup.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# name -> (arguments after ``python -X importtime``, module prefixes that must not load)
+TARGETS = {
+    "help": (["main.py", "--help"], ["langchain", "langgraph", "google", "numpy"]),
+    "bad_args": (["main.py", "--no-such-flag"], ["langchain", "langgraph", "google", "numpy"]),
+    "package": (["-c", "import react_agent"], ["langchain", "langgraph", "google", "numpy"]),
+    "agent": (["-c", "import react_agent.agent"], ["langchain_google_genai", "google.genai"]),
+    "fake_query": (["main.py", "--backend", "fake", "-q", "157 * 23 + 89를 계산해줘"], ["langchain_google_genai"]),
+}
+
+_LINE_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int, int]]:
+    """Return ``{module: (self_us, cumulative_us, depth)}`` from ``-X importtime`` output."""
+    modules = {}
+    for match in _LINE_RE.finditer(stderr):
+        self_us, cumulative_us, indent, name = match.groups()
+        modules[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return modules
+
+
+def run_target(args: list[str]) -> tuple[float, dict[str, tuple[int, int, int]]]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src"), "REACT_AGENT_BACKEND": "fake"}
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    return time.perf_counter() - start, parse_importtime(proc.stderr)
+
+
+def measure(name: str, repeat: int, top: int) -> dict:
+    args, forbidden = TARGETS[name]
+    walls, runs = [], []
+    for _ in range(repeat):
+        wall, modules = run_target(args)
+        walls.append(wall)
+        runs.append(modules)
+
+    names = set().union(*runs)
+    median = {
+        m: (
+            statistics.median(r[m][0] for r in runs if m in r),
+            statistics.median(r[m][1] for r in runs if m in r),
+        )
+        for m in names
+    }
+    total_us = statistics.median(sum(c for _, c, depth in r.values() if depth == 0) for r in runs)
+    slowest = sorted(median.items(), key=lambda item: -item[1][0])[:top]
+    violations = sorted(m for m in names if any(m == p or m.startswith(p + ".") for p in forbidden))
+    return {
+        "wall_ms": statistics.median(walls) * 1000,
+        "import_ms": total_us / 1000,
+        "modules": len(names),
+        "slowest": {m: {"self_ms": s / 1000, "cumulative_ms": c / 1000} for m, (s, c) in slowest},
+        "forbidden": violations,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list[str]:
+    """Return regressions of ``report`` against ``baseline``."""
+    regressions = []
+    for name, current in report["targets"].items():
+        old = baseline.get("targets", {}).get(name)
+        if old is None:
+            continue
+        for metric in ("wall_ms", "import_ms"):
+            delta = current[metric] - old[metric]
+            if delta > min_delta_ms and current[metric] > old[metric] * (1 + tolerance):
+                regressions.append(f"{name} {metric}: {old[metric]:.1f} -> {current[metric]:.1f}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=5, help="runs per target (median is reported)")
+    parser.add_argument("--top", type=int, default=8, help="slowest modules listed per target")
+    parser.add_argument("--out", type=str, help="write the JSON report to this file")
+    parser.add_argument("--compare", type=str, metavar="BASELINE", help="flag regressions against a stored report")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    parser.add_argument("--min-delta-ms", type=float, default=20.0, help="ignore regressions smaller than this")
+    args = parser.parse_args()
+
+    report = {"python": sys.version.split()[0], "repeat": args.repeat, "targets": {}}
+    failures = []
+    for name in args.targets:
+        result = measure(name, args.repeat, args.top)
+        report["targets"][name] = result
+        print(f"{name:<11} wall {result['wall_ms']:7.1f}ms  imports {result['import_ms']:7.1f}ms  ({result['modules']} modules)")
+        for module, times in result["slowest"].items():
+            print(f"    {times['self_ms']:7.1f}ms self {times['cumulative_ms']:8.1f}ms cum  {module}")
+        if result["forbidden"]:
+            failures.append(f"{name} imports {', '.join(result['forbidden'][:5])}")
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2))
+        print(f"\nreport written to {args.out}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        failures += compare(report, baseline, args.tolerance, args.min_delta_ms)
+
+    if failures:
+        print(f"\n{len(failures)} startup regression(s):")
+        for line in failures:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\nno startup regressions")
+
+
+if __name__ == "__main__":
+    main()
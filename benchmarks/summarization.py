@@ -0,0 +1,78 @@
+"""Prompt-token reduction and per-turn latency of rolling summarization.
+
+Drives the graph through long synthetic conversations, carrying the state
+between turns as main.py does, once with the full history and once with the
+summarize node enabled. The fake model's latency grows with prompt size
+(``--base-latency`` plus ``--ms-per-1k-tokens``) to stand in for prefill cost,
+and every reply reports its prompt size in ``usage_metadata``.
+
+Usage:
+    python benchmarks/summarization.py --turns 200 --summarize-after 2000
+"""
+
+import argparse
+import statistics
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from react_agent.agent import create_agent_graph
+from react_agent.fake_llm import FakeChatModel, Latency
+from react_agent.llm import llm_manager
+
+
+def run_conversation(turns: int, summarize_after: int | None) -> dict:
+    """Run one conversation of ``turns`` turns and collect per-turn metrics."""
+    agent = create_agent_graph(summarize_after_tokens=summarize_after)
+    state = {"messages": []}
+    latencies = []
+    prompt_tokens = []
+    for t in range(turns):
+        known = len(state["messages"]) + 1
+        state["messages"] = [*state["messages"], HumanMessage(content=f"질문 {t}: {t} * 23 + 89를 계산해줘. " * 3)]
+        start = time.perf_counter()
+        state = agent.invoke(state)
+        latencies.append(time.perf_counter() - start)
+        # Agent replies carry the prompt size reported by the fake model
+        prompt_tokens.append(
+            sum(m.usage_metadata["input_tokens"] for m in state["messages"][known:] if isinstance(m, AIMessage))
+        )
+
+    latencies.sort()
+    return {
+        "prompt_tokens_total": sum(prompt_tokens),
+        "prompt_tokens_last_turn": prompt_tokens[-1],
+        "latency_mean_ms": statistics.mean(latencies) * 1000,
+        "latency_p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "latency_max_ms": latencies[-1] * 1000,
+        "summarized_through": state.get("summarized_through", 0),
+        "messages": len(state["messages"]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--summarize-after", type=int, default=2000, help="trigger in estimated tokens")
+    parser.add_argument("--base-latency", type=float, default=0.0, help="fake model latency per call (s)")
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=2.0, help="extra fake latency per 1k prompt tokens")
+    args = parser.parse_args()
+
+    model = FakeChatModel(
+        first_token_latency=Latency("constant", args.base_latency),
+        prefill_seconds_per_1k_tokens=args.ms_per_1k_tokens / 1000,
+    )
+    llm_manager.set_factory(lambda config: model)
+
+    full = run_conversation(args.turns, None)
+    summarized = run_conversation(args.turns, args.summarize_after)
+
+    print(f"{args.turns} turns, summarize after {args.summarize_after} tokens")
+    print(f"{'metric':<26} {'full history':>14} {'summarized':>14}")
+    for name in full:
+        print(f"{name:<26} {full[name]:>14.1f} {summarized[name]:>14.1f}")
+    print(f"prompt-token reduction: {1 - summarized['prompt_tokens_total'] / full['prompt_tokens_total']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
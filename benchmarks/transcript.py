@@ -0,0 +1,103 @@
+"""Conversation export: full JSON rewrite vs append-only NDJSON transcripts.
+
+Simulates a session of ``--turns`` turns (one human message, one tool round
+trip and one answer per turn) exported after every turn, and reports:
+
+* total export time for the legacy approach (rebuild the whole dict and
+  ``json.dumps(..., indent=2)`` it each turn) and for appending only the new
+  messages to a transcript, per format (ndjson, gzip, zstd),
+* final file size,
+* read-back time and peak Python memory of ``json.load`` on the legacy file
+  vs streaming the transcript with ``read_transcript``.
+
+Usage:
+    python benchmarks/transcript.py --turns 1000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from react_agent.transcript import TranscriptWriter, read_transcript
+
+
+def make_turn(i: int) -> list:
+    call_id = f"call_{i}"
+    return [
+        HumanMessage(f"질문 {i}: 157 * {i} + 89를 계산하고 LangGraph에 대해 검색해줘"),
+        AIMessage("", tool_calls=[{"name": "calculator", "args": {"expression": f"157 * {i} + 89"}, "id": call_id}]),
+        ToolMessage(f"Result: 157 * {i} + 89 = {157 * i + 89}", tool_call_id=call_id),
+        AIMessage(f"계산 결과는 {157 * i + 89}입니다. " + "LangGraph는 상태 기반 에이전트 프레임워크입니다. " * 4),
+    ]
+
+
+def legacy_export(messages: list, path: Path) -> None:
+    """The previous ConversationHistory.export_to_file."""
+    data = {"start_time": "", "export_time": "", "messages": []}
+    for msg in messages:
+        item = {"type": type(msg).__name__, "content": msg.content}
+        if getattr(msg, "tool_calls", None):
+            item["tool_calls"] = msg.tool_calls
+        data["messages"].append(item)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def measure_read(fn) -> tuple[float, float]:
+    """Return (seconds, peak MB) of ``fn()``; memory is traced in a separate run."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--formats", nargs="+", default=["ndjson", "ndjson.gz", "ndjson.zst"])
+    args = parser.parse_args()
+
+    turns = [make_turn(i) for i in range(args.turns)]
+    total = sum(len(t) for t in turns)
+    print(f"{args.turns} turns, {total} messages, exported after every turn\n")
+    print(f"{'format':>12} {'export total':>13} {'last export':>12} {'size':>9} {'read':>9} {'read peak':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "legacy.json"
+        messages, start = [], time.perf_counter()
+        for turn in turns:
+            messages.extend(turn)
+            last = time.perf_counter()
+            legacy_export(messages, path)
+        export_s, last_ms = time.perf_counter() - start, (time.perf_counter() - last) * 1000
+        read_s, peak = measure_read(lambda: [item for item in json.loads(path.read_text())["messages"]])
+        print(
+            f"{'legacy json':>12} {export_s:>12.2f}s {last_ms:>10.2f}ms {path.stat().st_size / 1024 / 1024:>7.1f}MB "
+            f"{read_s * 1000:>7.0f}ms {peak:>8.1f}MB"
+        )
+
+        for fmt in args.formats:
+            path = Path(tmp) / f"conversation.{fmt}"
+            writer = TranscriptWriter(path, "bench")
+            start = time.perf_counter()
+            for turn in turns:
+                last = time.perf_counter()
+                writer.append(turn)
+            export_s, last_ms = time.perf_counter() - start, (time.perf_counter() - last) * 1000
+            read_s, peak = measure_read(lambda path=path: sum(1 for _ in read_transcript(path)))
+            print(
+                f"{fmt:>12} {export_s:>12.2f}s {last_ms:>10.2f}ms {path.stat().st_size / 1024 / 1024:>7.1f}MB "
+                f"{read_s * 1000:>7.0f}ms {peak:>8.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Dense retrieval: exact vs IVF recall/latency, batched scoring and hybrid search.
+
+A topical synthetic corpus (each document mixes words of one topic with
+common filler) is indexed with ``SearchIndex.build`` and
+``VectorIndex.build``. The script then reports:
+
+* exact top-k latency for single queries and per-query cost when queries are
+  scored together in one matrix multiply,
+* recall@k against exact search and latency for several ``nprobe`` values,
+* end-to-end latency of hybrid (dense + BM25) search.
+
+Usage:
+    python benchmarks/vector_index.py --docs 20000 --nprobe 1 2 4 8 16 32
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from react_agent.search_index import SearchIndex
+from react_agent.vector_index import VectorIndex
+
+
+def write_corpus(path: Path, docs: int, topics: int, seed: int) -> list[list[str]]:
+    """Write a topical JSONL corpus and return each topic's vocabulary."""
+    rng = np.random.default_rng(seed)
+    vocab = [[f"t{t}w{i}" for i in range(200)] for t in range(topics)]
+    filler = [f"common{i}" for i in range(500)]
+    with open(path, "w", encoding="utf-8") as f:
+        for d in range(docs):
+            topic = vocab[int(rng.integers(topics))]
+            words = [topic[int(i) % 200] for i in rng.zipf(1.3, size=40)]
+            words += [filler[int(i)] for i in rng.integers(0, 500, size=20)]
+            rng.shuffle(words)
+            f.write(json.dumps({"title": f"doc {d}", "text": " ".join(words)}) + "\n")
+    return vocab
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--topics", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch", type=int, default=64, help="queries per batched matrix multiply")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed + 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        vocab = write_corpus(tmp / "corpus.jsonl", args.docs, args.topics, args.seed)
+        search_index = SearchIndex.build(tmp / "corpus.jsonl", tmp / "bm25")
+        build_s, vectors = timed(lambda: VectorIndex.build(search_index, tmp / "dense", seed=args.seed))
+        stats = vectors.stats()
+        print(
+            f"{args.docs} docs -> {stats['chunks']} chunks, {stats['clusters']} clusters, "
+            f"{stats['index_bytes'] / 1024 / 1024:.1f}MB, build {build_s:.1f}s"
+        )
+
+        queries = []
+        for _ in range(args.queries):
+            topic = vocab[int(rng.integers(args.topics))]
+            queries.append(" ".join(topic[int(i) % 200] for i in rng.zipf(1.3, size=3)))
+
+        single = [timed(lambda q=q: vectors.search_chunks([q], args.k))[0] for q in queries]
+        exact = [vectors.search_chunks([q], args.k)[0] for q in queries]
+        batched_s = 0.0
+        for i in range(0, len(queries), args.batch):
+            elapsed, _ = timed(lambda i=i: vectors.search_chunks(queries[i : i + args.batch], args.k))
+            batched_s += elapsed
+        print(f"\nexact      p50 {np.percentile(single, 50) * 1000:7.2f}ms  p95 {np.percentile(single, 95) * 1000:7.2f}ms")
+        print(f"batched    {batched_s / len(queries) * 1000:7.2f}ms/query (batch {args.batch})")
+
+        print(f"\n{'nprobe':>7} {'recall@' + str(args.k):>10} {'p50':>9} {'p95':>9}")
+        for nprobe in args.nprobe:
+            latencies, recalls = [], []
+            for query, truth in zip(queries, exact):
+                elapsed, (found,) = timed(lambda q=query, nprobe=nprobe: vectors.search_chunks([q], args.k, nprobe=nprobe))
+                latencies.append(elapsed)
+                truth_ids = {chunk for chunk, _ in truth}
+                recalls.append(len(truth_ids & {chunk for chunk, _ in found}) / max(len(truth_ids), 1))
+            print(
+                f"{nprobe:>7} {np.mean(recalls):>10.3f} {np.percentile(latencies, 50) * 1000:>7.2f}ms "
+                f"{np.percentile(latencies, 95) * 1000:>7.2f}ms"
+            )
+
+        hybrid = [timed(lambda q=q: vectors.hybrid_search(search_index, q, k=5))[0] for q in queries]
+        print(f"\nhybrid     p50 {np.percentile(hybrid, 50) * 1000:7.2f}ms  p95 {np.percentile(hybrid, 95) * 1000:7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,122 @@
-"""Main entry point for the ReAct Agent."""
+"""Main entry point for the ReAct Agent.
+
+LangChain, LangGraph and the agent modules are imported inside the
+functions that need them, so ``--help``, argument errors and index builds
+start without loading the model stack.
+"""
 
 import argparse
-import json
+import os
 import sys
+import time
+import uuid
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 
-from react_agent.agent import create_agent_graph
+if TYPE_CHECKING:
+    from react_agent.transcript import TranscriptWriter
 
 
 class ConversationHistory:
-    """Manages conversation history for multi-turn interactions."""
-
-    def __init__(self):
-        self.messages: list = []
+    """View of one conversation thread stored by the graph's checkpointer.
+
+    The graph owns the state: each turn submits only the new human message
+    with this thread's config, and messages and the running summary are
+    read back from the latest checkpoint.
+
+    Args:
+        agent: Graph compiled with a checkpointer.
+        thread_id: Thread to continue; a new one is started if omitted.
+        export_dir: If set, every turn is appended to the thread's
+            transcript in this directory.
+        export_suffix: Transcript file suffix (``.ndjson``, ``.ndjson.gz``
+            or ``.ndjson.zst``).
+    """
+
+    def __init__(
+        self,
+        agent,
+        thread_id: str | None = None,
+        export_dir: str | None = None,
+        export_suffix: str = ".ndjson",
+    ):
+        self.agent = agent
+        self.thread_id = thread_id or uuid.uuid4().hex
         self.start_time = datetime.now()
-
-    def add_human_message(self, content: str) -> None:
-        """Add a human message to history."""
-        self.messages.append(HumanMessage(content=content))
-
-    def add_ai_messages(self, messages: list) -> None:
-        """Add AI response messages to history."""
-        self.messages.extend(messages)
+        self.export_dir = Path(export_dir) if export_dir else None
+        self.export_suffix = export_suffix
+        self.transcript: "TranscriptWriter | None" = None
+        self._writers: "dict[Path, TranscriptWriter]" = {}
+        if self.export_dir is not None:
+            self.export_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def config(self) -> dict:
+        """Graph config selecting this conversation's thread."""
+        return {"configurable": {"thread_id": self.thread_id}}
+
+    @property
+    def messages(self) -> list:
+        """All messages of the thread, loaded from the latest checkpoint."""
+        return self.agent.get_state(self.config).values.get("messages", [])
 
     def get_messages(self) -> list:
         """Get all messages in history."""
         return self.messages
 
+    def turn_input(self, content: str) -> dict:
+        """Get the graph input for a new turn: just the new human message."""
+        from langchain_core.messages import HumanMessage
+
+        return {"messages": [HumanMessage(content=content)]}
+
     def clear(self) -> None:
-        """Clear conversation history."""
-        self.messages = []
+        """Start a new, empty thread; the previous one stays in the checkpointer."""
+        self.thread_id = uuid.uuid4().hex
         self.start_time = datetime.now()
+        self.transcript = None
+        self._writers = {}
+
+    def _writer(self, path: str | Path | None = None) -> "TranscriptWriter":
+        """Return the transcript writer for ``path`` (default: this thread's file)."""
+        from react_agent.transcript import TranscriptWriter
+
+        if path is None:
+            path = (self.export_dir or Path()) / f"conversation_{self.thread_id}{self.export_suffix}"
+        path = Path(path)
+        if path not in self._writers:
+            self._writers[path] = TranscriptWriter(path, self.thread_id)
+        return self._writers[path]
+
+    def record_turn(self, messages: list) -> None:
+        """Auto-export a finished turn's messages when an export directory is set."""
+        if self.export_dir is None:
+            return
+        if self.transcript is None:
+            # First export of this thread: catch up on anything the file lacks
+            self.transcript = self._writer()
+            self.transcript.append(self.messages[self.transcript.count :] or messages)
+        else:
+            self.transcript.append(messages)
 
-    def export_to_file(self, filepath: str) -> None:
-        """Export conversation to a JSON file."""
-        export_data = {
-            "start_time": self.start_time.isoformat(),
-            "export_time": datetime.now().isoformat(),
-            "messages": [],
-        }
+    def export_to_file(self, filepath: str | None = None) -> None:
+        """Append the messages not yet in the transcript at ``filepath``."""
+        writer = self._writer(filepath)
+        written = writer.append(self.messages[writer.count :])
+        print(f"대화 내용이 {writer.path}에 저장되었습니다. (새 메시지 {written}개)")
 
-        for msg in self.messages:
-            msg_data = {
-                "type": type(msg).__name__,
-                "content": msg.content if hasattr(msg, "content") else "",
-            }
-            if hasattr(msg, "tool_calls") and msg.tool_calls:
-                msg_data["tool_calls"] = msg.tool_calls
-            export_data["messages"].append(msg_data)
+    def import_from_file(self, filepath: str) -> int:
+        """Start a new thread seeded with the messages of a transcript."""
+        from react_agent.transcript import read_transcript
 
-        Path(filepath).write_text(json.dumps(export_data, ensure_ascii=False, indent=2))
-        print(f"대화 내용이 {filepath}에 저장되었습니다.")
+        messages = list(read_transcript(filepath))
+        self.clear()
+        if messages:
+            self.agent.update_state(self.config, {"messages": messages}, as_node="agent")
+        return len(messages)
 
 
 def print_separator(char: str = "=", length: int = 60) -> None:
@@ -64,6 +126,8 @@ def print_separator(char: str = "=", length: int = 60) -> None:
 
 def print_message(msg, verbose: bool = False) -> None:
     """Print a message with appropriate formatting."""
+    from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
     if isinstance(msg, HumanMessage):
         print(f"\n🧑 [사용자] {msg.content}")
     elif isinstance(msg, AIMessage):
@@ -78,43 +142,124 @@ def print_message(msg, verbose: bool = False) -> None:
         print(f"\n📋 [도구 결과] {content}")
 
 
+def print_stats() -> None:
+    """Print LLM client, cache and tool cache statistics."""
+    from react_agent.cache import get_response_cache
+    from react_agent.checkpoint import get_checkpointer
+    from react_agent.context import get_context_window
+    from react_agent.agent import agent_graph_stats
+    from react_agent.llm import llm_manager
+    from react_agent.search_index import get_search_index
+    from react_agent.semantic_cache import get_semantic_cache
+    from react_agent.tool_cache import tool_cache_stats
+    from react_agent.vector_index import get_vector_index
+
+    print("\n📊 LLM 클라이언트:")
+    for name, value in llm_manager.stats().items():
+        print(f"   {name}: {value}")
+    graphs = agent_graph_stats()
+    print(f"📊 그래프 캐시: 빌드 {graphs['builds']} / 재사용 {graphs['hits']}")
+    sections = (
+        ("응답 캐시", get_response_cache()),
+        ("의미 캐시", get_semantic_cache()),
+        ("컨텍스트 윈도우", get_context_window()),
+        ("검색 인덱스", get_search_index()),
+        ("벡터 인덱스", get_vector_index()),
+        ("체크포인트", get_checkpointer()),
+    )
+    for label, cache in sections:
+        if cache is None:
+            print(f"📊 {label}: 꺼짐")
+            continue
+        print(f"📊 {label}:")
+        for name, value in cache.stats().items():
+            print(f"   {name}: {value}")
+    for tool_name, stats in tool_cache_stats().items():
+        print(f"📊 도구 캐시 ({tool_name}): 적중 {stats['hits']} / 미스 {stats['misses']} ({stats['hit_rate']:.0%})")
+
+
 def run_single_query(agent, query: str, history: ConversationHistory, verbose: bool = False) -> str:
     """Run a single query with conversation history."""
     print(f"\n{'='*60}")
     print(f"📝 질문: {query}")
     print("=" * 60)
 
-    history.add_human_message(query)
-    result = agent.invoke({"messages": history.get_messages()})
-
-    # Get new messages (after the human message we just added)
-    new_messages = result["messages"][len(history.messages) :]
-    history.add_ai_messages(new_messages)
+    # Node updates carry exactly the messages produced by this turn
+    inputs = history.turn_input(query)
+    new_messages = []
+    for update in agent.stream(inputs, history.config, stream_mode="updates"):
+        for output in update.values():
+            if output:
+                new_messages.extend(output.get("messages", []))
+    final_content = new_messages[-1].content if new_messages else ""
+    history.record_turn([*inputs["messages"], *new_messages])
 
     if verbose:
         print("\n--- 메시지 흐름 ---")
         for msg in new_messages:
             print_message(msg, verbose=True)
     else:
-        final_message = result["messages"][-1]
-        print(f"\n💬 응답: {final_message.content}")
+        print(f"\n💬 응답: {final_content}")
 
-    return result["messages"][-1].content
+    return final_content
+
+
+def _chunk_text(chunk) -> str:
+    """Extract the plain text of a streamed message chunk."""
+    if isinstance(chunk.content, str):
+        return chunk.content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in chunk.content
+        if not isinstance(block, dict) or block.get("type", "text") == "text"
+    )
 
 
-def run_streaming(agent, query: str, history: ConversationHistory) -> str:
-    """Run a query with streaming output."""
+def run_streaming(agent, query: str, history: ConversationHistory, tokens: bool = True) -> str:
+    """Run a query with streaming output.
+
+    With ``tokens`` enabled, model tokens are printed as they arrive,
+    interleaved with tool-call and tool-result events, and the time to first
+    token is reported. Otherwise only node-level updates are shown.
+    """
+    from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
     print(f"\n{'='*60}")
     print(f"📝 질문: {query}")
     print("=" * 60)
     print("\n⏳ [처리 중...]")
 
-    history.add_human_message(query)
+    inputs = history.turn_input(query)
     final_content = ""
     new_messages = []
-
-    for step in agent.stream({"messages": history.get_messages()}):
-        for node_name, output in step.items():
+    stream_mode = ["updates", "messages"] if tokens else ["updates"]
+    start = time.perf_counter()
+    first_token_at = None
+    in_token_line = False
+    message_streamed = False
+    streamed_answer = False
+
+    for mode, payload in agent.stream(inputs, history.config, stream_mode=stream_mode):
+        if mode == "messages":
+            chunk, metadata = payload
+            if metadata.get("langgraph_node") != "agent" or not isinstance(chunk, AIMessageChunk):
+                continue
+            text = _chunk_text(chunk)
+            if not text:
+                continue
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            if not in_token_line:
+                print("\n🤖 ", end="")
+                in_token_line = True
+            print(text, end="", flush=True)
+            message_streamed = True
+            continue
+
+        for node_name, output in payload.items():
+            if in_token_line:
+                print()
+                in_token_line = False
             if node_name == "agent":
                 for msg in output.get("messages", []):
                     new_messages.append(msg)
@@ -124,20 +269,35 @@ def run_streaming(agent, query: str, history: ConversationHistory) -> str:
                                 print(f"   🔧 도구 호출: {tc['name']}")
                         if msg.content:
                             final_content = msg.content
+                            streamed_answer = message_streamed
+                message_streamed = False
             elif node_name == "tools":
                 for msg in output.get("messages", []):
                     new_messages.append(msg)
                     if isinstance(msg, ToolMessage):
                         print("   📋 도구 결과 수신")
-
-    history.add_ai_messages(new_messages)
-    print(f"\n💬 [응답]\n{final_content}")
+            elif node_name == "summarize" and output:
+                print("   🗜️ 이전 대화 요약됨")
+
+    history.record_turn([*inputs["messages"], *new_messages])
+    if not streamed_answer:
+        print(f"\n💬 [응답]\n{final_content}")
+    if tokens:
+        total = time.perf_counter() - start
+        ttft = f"{first_token_at - start:.2f}s" if first_token_at is not None else "-"
+        print(f"\n⏱️ 첫 토큰: {ttft} | 전체: {total:.2f}s")
     return final_content
 
 
-def run_interactive(agent, verbose: bool = False, streaming: bool = False) -> None:
+def run_interactive(
+    agent,
+    verbose: bool = False,
+    streaming: bool = False,
+    tokens: bool = True,
+    history: ConversationHistory | None = None,
+) -> None:
     """Run the agent in interactive chat mode with conversation history."""
-    history = ConversationHistory()
+    history = history or ConversationHistory(agent)
 
     print("\n" + "=" * 60)
     print("  🤖 LangGraph ReAct Agent - 대화형 모드")
@@ -146,12 +306,16 @@ def run_interactive(agent, verbose: bool = False, streaming: bool = False) -> No
     print("   /help     - 도움말 표시")
     print("   /verbose  - 상세 모드 토글")
     print("   /stream   - 스트리밍 모드 토글")
+    print("   /tokens   - 토큰 단위 스트리밍 토글")
     print("   /clear    - 대화 기록 초기화")
     print("   /history  - 대화 기록 보기")
-    print("   /export   - 대화 내용 저장")
+    print("   /export   - 대화 내용 저장 (새 메시지만 추가)")
+    print("   /import   - 저장한 대화 불러오기")
+    print("   /stats    - 클라이언트/캐시 통계")
     print("   /quit     - 종료")
     print("-" * 60)
     print(f"스트리밍: {'켜짐' if streaming else '꺼짐'} | 상세 모드: {'켜짐' if verbose else '꺼짐'}")
+    print(f"세션 ID: {history.thread_id}")
     print("-" * 60)
 
     while True:
@@ -174,9 +338,12 @@ def run_interactive(agent, verbose: bool = False, streaming: bool = False) -> No
                     print("   /help     - 이 도움말 표시")
                     print("   /verbose  - 상세 모드 토글 (도구 호출 과정 표시)")
                     print("   /stream   - 스트리밍 모드 토글 (실시간 진행 표시)")
+                    print("   /tokens   - 토큰 단위 스트리밍 토글 (첫 토큰 시간 표시)")
                     print("   /clear    - 대화 기록 초기화")
                     print("   /history  - 현재 대화 기록 보기")
-                    print("   /export   - 대화 내용을 파일로 저장")
+                    print("   /export [파일] - 지난 저장 이후의 메시지를 NDJSON 파일에 추가 (.gz/.zst 압축)")
+                    print("   /import 파일   - 저장한 대화를 새 세션으로 불러오기")
+                    print("   /stats    - LLM 클라이언트 및 응답 캐시 통계")
                     print("   /quit     - 대화 종료")
                     continue
 
@@ -190,25 +357,43 @@ def run_interactive(agent, verbose: bool = False, streaming: bool = False) -> No
                     print(f"⏳ 스트리밍 모드: {'켜짐' if streaming else '꺼짐'}")
                     continue
 
+                elif cmd == "/tokens":
+                    tokens = not tokens
+                    print(f"⌨️ 토큰 스트리밍: {'켜짐' if tokens else '꺼짐'}")
+                    continue
+
                 elif cmd == "/clear":
                     history.clear()
-                    print("🗑️ 대화 기록이 초기화되었습니다.")
+                    print(f"🗑️ 대화 기록이 초기화되었습니다. (새 세션 ID: {history.thread_id})")
                     continue
 
                 elif cmd == "/history":
-                    if not history.messages:
+                    messages = history.messages
+                    if not messages:
                         print("📭 대화 기록이 비어있습니다.")
                     else:
-                        print(f"\n📜 대화 기록 ({len(history.messages)}개 메시지):")
+                        print(f"\n📜 대화 기록 ({len(messages)}개 메시지):")
                         print("-" * 40)
-                        for msg in history.messages:
+                        for msg in messages:
                             print_message(msg, verbose=True)
                     continue
 
+                elif cmd == "/stats":
+                    print_stats()
+                    continue
+
                 elif cmd.startswith("/export"):
-                    parts = cmd.split()
-                    filename = parts[1] if len(parts) > 1 else f"conversation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                    history.export_to_file(filename)
+                    parts = query.split(maxsplit=1)
+                    history.export_to_file(parts[1] if len(parts) > 1 else None)
+                    continue
+
+                elif cmd.startswith("/import"):
+                    parts = query.split(maxsplit=1)
+                    if len(parts) < 2:
+                        print("❓ 사용법: /import 파일")
+                        continue
+                    count = history.import_from_file(parts[1])
+                    print(f"📥 메시지 {count}개를 불러왔습니다. (새 세션 ID: {history.thread_id})")
                     continue
 
                 else:
@@ -218,7 +403,7 @@ def run_interactive(agent, verbose: bool = False, streaming: bool = False) -> No
 
             # Run query
             if streaming:
-                run_streaming(agent, query, history)
+                run_streaming(agent, query, history, tokens=tokens)
             else:
                 run_single_query(agent, query, history, verbose=verbose)
 
@@ -229,7 +414,7 @@ def run_interactive(agent, verbose: bool = False, streaming: bool = False) -> No
 
 def run_demo(agent) -> None:
     """Run demo queries to showcase agent capabilities."""
-    history = ConversationHistory()
+    history = ConversationHistory(agent)
 
     demo_queries = [
         ("🔍 웹 검색", "LangGraph에 대해 검색해줘"),
@@ -249,6 +434,62 @@ def run_demo(agent) -> None:
         print()
 
 
+def run_batch_file(agent, input_path: str, output_path: str, concurrency: int, timeout: float | None) -> None:
+    """Run a JSONL file of queries concurrently and append results to ``output_path``."""
+    import asyncio
+
+    from react_agent.batch import run_batch
+
+    def report(record: dict) -> None:
+        status = f"❌ {record['error']}" if "error" in record else f"✅ 도구 {len(record['tool_calls'])}회"
+        print(f"   [{record['line']}] {record['latency_s']:.2f}s {status}")
+
+    print(f"\n📦 배치 실행: {input_path} → {output_path} (동시 {concurrency}개)")
+    try:
+        stats = asyncio.run(run_batch(agent, input_path, output_path, concurrency, timeout, on_result=report))
+    except KeyboardInterrupt:
+        print("\n⏸️ 배치 중단됨 (같은 명령으로 남은 줄부터 이어서 실행)")
+        return
+    print(
+        f"\n📦 완료 {stats['completed']}개, 실패 {stats['errors']}개, 건너뜀 {stats['skipped']}개 "
+        f"({stats['seconds']:.1f}초)"
+    )
+
+
+def run_server(
+    agent, host: str, port: int, request_timeout: float, drain_timeout: float, coalesce_graph=None
+) -> None:
+    """Serve the graph over HTTP until SIGINT/SIGTERM, then drain in-flight requests."""
+    import asyncio
+    import signal
+
+    from react_agent.server import AgentServer
+
+    async def serve() -> dict:
+        server = AgentServer(
+            agent,
+            host,
+            port,
+            request_timeout=request_timeout,
+            drain_timeout=drain_timeout,
+            coalesce_graph=coalesce_graph,
+        )
+        await server.start()
+        print(f"\n🌐 서버 시작: http://{server.host}:{server.port} (POST /chat, /chat/stream · Ctrl+C로 종료)", flush=True)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await stop.wait()
+        print(f"\n⏳ 종료 중: 진행 중인 요청 {server.stats()['in_flight']}개 마무리 (최대 {drain_timeout:g}초)", flush=True)
+        return await server.shutdown()
+
+    stats = asyncio.run(serve())
+    print(f"👋 서버 종료: 요청 {stats['requests']}개, 오류 {stats['errors']}개, 시간 초과 {stats['timeouts']}개")
+    if "coalesce" in stats:
+        print(f"🔗 요청 병합: 실행 {stats['coalesce']['runs']}회, 합류 {stats['coalesce']['joined']}회")
+
+
 def main() -> None:
     """Run the ReAct agent."""
     parser = argparse.ArgumentParser(
@@ -261,6 +502,16 @@ def main() -> None:
   python main.py --demo               # 데모 실행
   python main.py -q "질문" --verbose  # 상세 출력
   python main.py --stream             # 스트리밍 모드로 대화
+  python main.py -s --no-tokens       # 노드 단위 스트리밍
+  python main.py --cache-db cache.db  # 응답 캐시 (디스크 저장)
+  python main.py --checkpoint-db sessions.db --thread-id ID  # 저장된 대화 이어가기
+  python main.py --export-dir logs/ --export-format gz  # 매 턴 대화 자동 저장
+  python main.py --semantic-cache idx.npz  # 유사 질문 캐시
+  python main.py --backend fake --demo     # 오프라인 가짜 모델
+  python main.py --serve --port 8000   # HTTP 서버 (SSE 스트리밍)
+  python main.py --batch queries.jsonl --concurrency 16 --out results.jsonl  # 배치 실행
+  python main.py --build-search-index corpus/ --search-index index/  # 검색 인덱스 생성
+  python main.py --search-index index/ --build-vector-index vectors/  # 벡터 인덱스 생성
         """,
     )
     parser.add_argument(
@@ -278,36 +529,315 @@ def main() -> None:
         action="store_true",
         help="스트리밍 모드 (실시간 진행 상황 표시)",
     )
+    parser.add_argument(
+        "--no-tokens",
+        action="store_true",
+        help="토큰 단위 스트리밍 끄기 (노드 단위 진행만 표시)",
+    )
     parser.add_argument(
         "--demo",
         action="store_true",
         help="데모 쿼리 실행",
     )
 
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="INPUT",
+        help="JSONL 파일의 질문들을 독립된 대화로 동시에 실행 (줄마다 {\"query\": ...} 또는 문자열)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="배치 모드에서 동시에 실행할 대화 수 (기본값: 8)",
+    )
+    parser.add_argument(
+        "--out",
+        type=str,
+        metavar="PATH",
+        help="배치 결과 JSONL 파일 (기본값: INPUT.results.jsonl, 이미 있으면 남은 줄부터 이어서 실행)",
+    )
+    parser.add_argument(
+        "--item-timeout",
+        type=float,
+        help="배치 항목 하나의 최대 실행 시간 (초)",
+    )
+
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="HTTP 서버로 실행 (POST /chat, POST /chat/stream SSE, GET /threads/ID, GET /health)",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="서버 주소 (기본값: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="서버 포트 (기본값: 8000)",
+    )
+    parser.add_argument(
+        "--coalesce",
+        action="store_true",
+        help="동시에 처리 중인 동일한 요청(같은 대화 기록 + 같은 질문)을 한 번만 실행하고 결과를 공유",
+    )
+    parser.add_argument(
+        "--request-timeout",
+        type=float,
+        default=60.0,
+        help="서버 요청 하나의 최대 처리 시간 (초, 기본값: 60)",
+    )
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=30.0,
+        help="종료 시 진행 중인 요청을 기다릴 최대 시간 (초, 기본값: 30)",
+    )
+
+    parser.add_argument(
+        "--backend",
+        help="모델 백엔드: gemini 또는 fake (기본값: REACT_AGENT_BACKEND 또는 gemini, fake는 네트워크 없이 동작)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="동일한 요청에 대한 LLM 응답 캐시 사용 (메모리)",
+    )
+    parser.add_argument(
+        "--cache-db",
+        type=str,
+        help="응답 캐시를 저장할 SQLite 파일 경로 (--cache 포함)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        help="디스크 캐시 항목 유효 시간 (초)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        help="디스크 캐시 최대 크기 (MB)",
+    )
+
+    parser.add_argument(
+        "--checkpoint-db",
+        type=str,
+        metavar="PATH",
+        help="대화 상태를 저장할 SQLite 파일 (지정하지 않으면 메모리에만 보관)",
+    )
+    parser.add_argument(
+        "--thread-id",
+        type=str,
+        help="이어갈 대화 세션 ID (지정하지 않으면 새 세션)",
+    )
+    parser.add_argument(
+        "--fsync",
+        choices=["full", "normal", "off"],
+        default="normal",
+        help="체크포인트 디스크 동기화 정책 (기본값: normal)",
+    )
+
+    parser.add_argument(
+        "--export-dir",
+        type=str,
+        metavar="DIR",
+        help="매 턴마다 대화를 DIR/conversation_<세션 ID>.ndjson에 추가 저장",
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=["ndjson", "gz", "zst"],
+        default="ndjson",
+        help="대화 저장 형식 (gz/zst는 압축, zst는 zstandard 패키지 필요)",
+    )
+
+    parser.add_argument(
+        "--semantic-cache",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="유사 질문에 대한 최종 답변 재사용 (PATH 지정 시 인덱스를 .npz로 저장)",
+    )
+    parser.add_argument(
+        "--semantic-threshold",
+        type=float,
+        default=0.8,
+        help="의미 캐시 유사도 임계값 (기본값: 0.8)",
+    )
+
+    parser.add_argument(
+        "--summarize-after",
+        type=int,
+        help="요약되지 않은 대화가 이 토큰 수를 넘으면 오래된 턴을 요약",
+    )
+    parser.add_argument(
+        "--max-context-tokens",
+        type=int,
+        help="모델에 전달할 대화 기록의 최대 토큰 수 (오래된 턴부터 제외)",
+    )
+
+    parser.add_argument(
+        "--search-index",
+        type=str,
+        metavar="DIR",
+        help="search_web이 사용할 로컬 BM25 인덱스 디렉터리",
+    )
+    parser.add_argument(
+        "--build-search-index",
+        type=str,
+        metavar="CORPUS",
+        help="CORPUS 디렉터리(.txt/.md/.jsonl)로 --search-index 위치에 인덱스를 만들고 종료",
+    )
+
+    parser.add_argument(
+        "--vector-index",
+        type=str,
+        metavar="DIR",
+        help="search_web에 의미 기반(밀집 벡터) 검색을 더할 벡터 인덱스 디렉터리",
+    )
+    parser.add_argument(
+        "--build-vector-index",
+        type=str,
+        metavar="DIR",
+        help="--search-index의 문서를 청크로 나눠 임베딩한 벡터 인덱스를 DIR에 만들고 종료",
+    )
+    parser.add_argument(
+        "--dense-weight",
+        type=float,
+        default=0.5,
+        help="하이브리드 검색에서 벡터 점수의 비중 (0=키워드만, 1=벡터만, 기본값: 0.5)",
+    )
+    parser.add_argument(
+        "--nprobe",
+        type=int,
+        help="근사 검색(IVF)에서 탐색할 클러스터 수 (지정하지 않으면 정확 검색)",
+    )
+
     args = parser.parse_args()
 
+    if args.build_search_index or args.build_vector_index:
+        if not args.search_index:
+            parser.error("인덱스를 만들려면 --search-index DIR이 필요합니다")
+        from react_agent.search_index import SearchIndex
+        from react_agent.vector_index import VectorIndex
+
+        if args.build_search_index:
+            index = SearchIndex.build(args.build_search_index, args.search_index)
+            stats = index.stats()
+            print(
+                f"✅ 검색 인덱스 생성: 문서 {stats['docs']}개, 단어 {stats['terms']}개, "
+                f"{stats['index_bytes'] / 1024 / 1024:.1f}MB, {index.meta['build_seconds']:.1f}초"
+            )
+        if args.build_vector_index:
+            vectors = VectorIndex.build(SearchIndex.open(args.search_index), args.build_vector_index)
+            stats = vectors.stats()
+            print(
+                f"✅ 벡터 인덱스 생성: 청크 {stats['chunks']}개, 클러스터 {stats['clusters']}개, "
+                f"{stats['index_bytes'] / 1024 / 1024:.1f}MB, {vectors.meta['build_seconds']:.1f}초"
+            )
+        return
+    if args.vector_index and not args.search_index:
+        parser.error("--vector-index에는 --search-index DIR이 필요합니다")
+    if args.serve and args.batch:
+        parser.error("--serve와 --batch는 함께 사용할 수 없습니다")
+    if args.batch and not Path(args.batch).is_file():
+        parser.error(f"배치 입력 파일이 없습니다: {args.batch}")
+    if args.batch and args.concurrency < 1:
+        parser.error("--concurrency는 1 이상이어야 합니다")
+
+    # The agent stack is only loaded once a mode needs it
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    from react_agent.agent import get_agent_graph, warm_up
+    from react_agent.cache import configure_response_cache
+    from react_agent.checkpoint import configure_checkpointer, get_checkpointer
+    from react_agent.context import configure_context_window
+    from react_agent.llm import BACKENDS
+    from react_agent.search_index import configure_search_index
+    from react_agent.semantic_cache import configure_semantic_cache
+    from react_agent.vector_index import configure_vector_index
+
+    if args.backend and args.backend not in BACKENDS:
+        parser.error(f"알 수 없는 백엔드: {args.backend} (사용 가능: {', '.join(sorted(BACKENDS))})")
+
     # Load environment variables
     load_dotenv()
-
-    # Create the agent graph
+    if args.backend:
+        os.environ["REACT_AGENT_BACKEND"] = args.backend
+
+    if args.cache or args.cache_db:
+        configure_response_cache(
+            path=args.cache_db,
+            ttl=args.cache_ttl,
+            max_bytes=int(args.cache_max_mb * 1024 * 1024) if args.cache_max_mb else None,
+        )
+    if args.max_context_tokens:
+        configure_context_window(args.max_context_tokens)
+    if args.search_index:
+        configure_search_index(args.search_index)
+    if args.vector_index:
+        try:
+            configure_vector_index(args.vector_index, alpha=args.dense_weight, nprobe=args.nprobe)
+        except ValueError as e:
+            print(f"❌ 오류: {e}")
+            print("💡 --search-index와 같은 인덱스로 --build-vector-index를 다시 실행하세요.")
+            sys.exit(1)
+    if args.checkpoint_db:
+        configure_checkpointer(args.checkpoint_db, fsync=args.fsync)
+    semantic_cache = None
+    if args.semantic_cache is not None:
+        semantic_cache = configure_semantic_cache(
+            threshold=args.semantic_threshold,
+            path=args.semantic_cache or None,
+        )
+
+    # Build the shared agent graph, model client and tool binding up front.
+    # Batch conversations are independent, so they only keep state with --checkpoint-db.
     try:
-        agent = create_agent_graph()
+        agent = warm_up(
+            async_mode=bool(args.batch or args.serve),
+            summarize_after_tokens=args.summarize_after,
+            checkpointer=get_checkpointer() or (None if args.batch else InMemorySaver()),
+        )
     except ValueError as e:
         print(f"❌ 오류: {e}")
         print("💡 GOOGLE_API_KEY가 .env 파일에 설정되어 있는지 확인하세요.")
         sys.exit(1)
 
+    suffix = {"ndjson": ".ndjson", "gz": ".ndjson.gz", "zst": ".ndjson.zst"}[args.export_format]
+    history = ConversationHistory(agent, args.thread_id, export_dir=args.export_dir, export_suffix=suffix)
+
     # Execute based on mode
-    if args.demo:
-        run_demo(agent)
-    elif args.query:
-        history = ConversationHistory()
-        if args.stream:
-            run_streaming(agent, args.query, history)
+    try:
+        if args.serve:
+            coalesce_graph = None
+            if args.coalesce:
+                coalesce_graph = get_agent_graph(async_mode=True, summarize_after_tokens=args.summarize_after)
+            run_server(agent, args.host, args.port, args.request_timeout, args.drain_timeout, coalesce_graph)
+        elif args.batch:
+            output = args.out or str(Path(args.batch).with_suffix(".results.jsonl"))
+            run_batch_file(agent, args.batch, output, args.concurrency, args.item_timeout)
+        elif args.demo:
+            run_demo(agent)
+        elif args.query:
+            if args.stream:
+                run_streaming(agent, args.query, history, tokens=not args.no_tokens)
+            else:
+                run_single_query(agent, args.query, history, verbose=args.verbose)
+            if args.checkpoint_db:
+                print(f"\n💾 세션 ID: {history.thread_id} (--thread-id로 이어가기)")
         else:
-            run_single_query(agent, args.query, history, verbose=args.verbose)
-    else:
-        run_interactive(agent, verbose=args.verbose, streaming=args.stream)
+            run_interactive(
+                agent, verbose=args.verbose, streaming=args.stream, tokens=not args.no_tokens, history=history
+            )
+    finally:
+        if get_checkpointer() is not None:
+            get_checkpointer().close()
+        if semantic_cache is not None and semantic_cache.path is not None:
+            semantic_cache.save()
 
 
 if __name__ == "__main__":
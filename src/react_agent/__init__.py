@@ -1,7 +1,42 @@
-"""ReAct Agent package using LangGraph and Google Gemini."""
+"""ReAct Agent package using LangGraph and Google Gemini.
 
-from react_agent.agent import create_agent_graph
-from react_agent.state import AgentState
-from react_agent.tools import calculator, search_web
+Public names are imported on first access, so ``import react_agent`` (and
+importing a light submodule) does not pay for LangGraph or the model client.
+"""
 
-__all__ = ["AgentState", "create_agent_graph", "calculator", "search_web"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from react_agent.agent import create_agent_graph, get_agent_graph, warm_up
+    from react_agent.llm import LLMClientManager, llm_manager
+    from react_agent.state import AgentState
+    from react_agent.tools import calculator, calculator_batch, search_web
+
+# Public name -> defining module
+_EXPORTS = {
+    "AgentState": "react_agent.state",
+    "LLMClientManager": "react_agent.llm",
+    "create_agent_graph": "react_agent.agent",
+    "get_agent_graph": "react_agent.agent",
+    "warm_up": "react_agent.agent",
+    "calculator": "react_agent.tools",
+    "calculator_batch": "react_agent.tools",
+    "llm_manager": "react_agent.llm",
+    "search_web": "react_agent.tools",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
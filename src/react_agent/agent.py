@@ -1,45 +1,131 @@
 """ReAct Agent implementation using LangGraph."""
 
-import os
+import functools
+import threading
+import time
+from collections.abc import Sequence
 from typing import Literal
 
-from langchain_core.messages import AIMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langgraph.graph import END, StateGraph
-from langgraph.prebuilt import ToolNode
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph import END, START, StateGraph
 
+from react_agent.cache import get_response_cache, make_cache_key
+from react_agent.context import get_context_window
+from react_agent.llm import LLMConfig, llm_manager
+from react_agent.semantic_cache import get_semantic_cache
 from react_agent.state import AgentState
-from react_agent.tools import calculator, get_current_time, search_web
+from react_agent.summarize import Summarizer, summarized_messages
+from react_agent.tool_executor import ParallelToolNode
+from react_agent.tools import CACHEABLE_TOOLS, calculator, calculator_batch, get_current_time, search_web
 
 # Define available tools
-tools = [search_web, calculator, get_current_time]
+tools = [search_web, calculator, calculator_batch, get_current_time]
 
 
-def create_llm() -> ChatGoogleGenerativeAI:
-    """Create and configure the LLM instance."""
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_API_KEY environment variable is not set")
+def _tool_list(selected: Sequence[BaseTool] | None) -> list[BaseTool]:
+    """Return ``selected`` as a list, or the built-in tools when None."""
+    return list(tools if selected is None else selected)
 
-    return ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash",
-        google_api_key=api_key,
-        temperature=0,
-    )
 
+def _model_input(state: AgentState) -> list:
+    """Select the messages sent to the model.
+
+    Summarized turns are replaced by the running summary, and the rest is
+    trimmed to the context budget if one is configured.
+    """
+    messages = summarized_messages(state)
+    window = get_context_window()
+    return window.select(messages) if window is not None else messages
+
+
+def _cache_lookup(
+    config: LLMConfig, messages: list, available_tools: Sequence[BaseTool] = tools
+) -> tuple[str | None, AIMessage | None]:
+    """Look up a cached response for ``messages``.
+
+    A fresh human turn is first matched against the semantic cache; otherwise
+    the exact-match cache is consulted. Only deterministic (temperature 0)
+    calls use the exact-match cache.
+
+    Returns:
+        The exact-match cache key (None if not cacheable) and the cached
+        response, if any.
+    """
+    semantic = get_semantic_cache()
+    if semantic is not None and isinstance(messages[-1], HumanMessage):
+        cached = semantic.lookup(messages[:-1], messages[-1].content, config.model)
+        if cached is not None:
+            return None, cached
+
+    cache = get_response_cache()
+    if cache is None or config.temperature != 0:
+        return None, None
+    key = make_cache_key(config, available_tools, messages)
+    return key, cache.get(key)
+
+
+def _cache_store(config: LLMConfig, key: str | None, messages: list, response: AIMessage) -> None:
+    """Record ``response`` in the enabled caches.
+
+    A final answer goes to the semantic cache only if every tool it used in
+    this turn is in ``CACHEABLE_TOOLS``: the cache skips the tools on a hit,
+    so an answer built from e.g. the current time would be served stale.
+    """
+    if key is not None:
+        get_response_cache().put(key, response)
+
+    semantic = get_semantic_cache()
+    if semantic is not None and not response.tool_calls:
+        for i in range(len(messages) - 1, -1, -1):
+            if isinstance(messages[i], HumanMessage):
+                if all(m.name in CACHEABLE_TOOLS for m in messages[i + 1 :] if isinstance(m, ToolMessage)):
+                    semantic.add(messages[:i], messages[i].content, response, config.model)
+                break
 
-def agent_node(state: AgentState) -> dict:
+
+def agent_node(state: AgentState, available_tools: Sequence[BaseTool] = tools) -> dict:
     """Process the current state and generate a response.
 
     Args:
         state: Current agent state containing messages.
+        available_tools: Tools bound to the model.
 
     Returns:
         Updated state with new AI message.
     """
-    llm = create_llm()
-    llm_with_tools = llm.bind_tools(tools)
-    response = llm_with_tools.invoke(state["messages"])
+    config = LLMConfig.from_env()
+    messages = _model_input(state)
+    key, cached = _cache_lookup(config, messages, available_tools)
+    if cached is not None:
+        return {"messages": [cached]}
+
+    llm_with_tools = llm_manager.get_bound(available_tools, config)
+    response = llm_with_tools.invoke(messages)
+    _cache_store(config, key, messages, response)
+    return {"messages": [response]}
+
+
+async def aagent_node(state: AgentState, available_tools: Sequence[BaseTool] = tools) -> dict:
+    """Async variant of :func:`agent_node` that awaits the model call.
+
+    Args:
+        state: Current agent state containing messages.
+        available_tools: Tools bound to the model.
+
+    Returns:
+        Updated state with new AI message.
+    """
+    config = LLMConfig.from_env()
+    messages = _model_input(state)
+    key, cached = _cache_lookup(config, messages, available_tools)
+    if cached is not None:
+        return {"messages": [cached]}
+
+    llm_with_tools = llm_manager.get_bound(available_tools, config)
+    response = await llm_with_tools.ainvoke(messages)
+    _cache_store(config, key, messages, response)
     return {"messages": [response]}
 
 
@@ -60,21 +146,57 @@ def should_continue(state: AgentState) -> Literal["tools", "__end__"]:
     return END
 
 
-def create_agent_graph() -> StateGraph:
+def create_agent_graph(
+    async_mode: bool = False,
+    summarize_after_tokens: int | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+    tools: Sequence[BaseTool] | None = None,
+) -> StateGraph:
     """Create the ReAct agent graph.
 
+    Every call builds a new graph with its own tool thread pool; servers and
+    batch harnesses should use :func:`get_agent_graph` instead.
+
+    Args:
+        async_mode: Use the native async agent node. The resulting graph must
+            be driven with ``ainvoke``/``astream``; the tool node then awaits
+            tool calls concurrently on the event loop.
+        summarize_after_tokens: If set, add a ``summarize`` node that folds
+            older turns into a running summary whenever the unsummarized
+            history exceeds this many estimated tokens.
+        checkpointer: Saver that persists state after every step (e.g.
+            :class:`~react_agent.checkpoint.SQLiteSaver`). The graph must then
+            be invoked with ``{"configurable": {"thread_id": ...}}`` and
+            resumes that thread's saved state on every call.
+        tools: Tools offered to the model (default: the built-in tools).
+
     Returns:
         Compiled StateGraph for the ReAct agent.
     """
+    tool_list = _tool_list(tools)
+
     # Create the graph
     graph = StateGraph(AgentState)
 
     # Add nodes
-    graph.add_node("agent", agent_node)
-    graph.add_node("tools", ToolNode(tools))
+    graph.add_node("agent", functools.partial(aagent_node if async_mode else agent_node, available_tools=tool_list))
+    graph.add_node("tools", ParallelToolNode(tool_list).as_runnable())
+
+    if summarize_after_tokens:
+        summarizer = Summarizer(trigger_tokens=summarize_after_tokens)
+        graph.add_node("summarize", summarizer.anode if async_mode else summarizer.node)
 
-    # Set entry point
-    graph.set_entry_point("agent")
+        # Check the history size before every agent step
+        routes = {"summarize": "summarize", "agent": "agent"}
+        graph.add_conditional_edges(START, summarizer.route, routes)
+        graph.add_conditional_edges("tools", summarizer.route, routes)
+        graph.add_edge("summarize", "agent")
+    else:
+        # Set entry point
+        graph.set_entry_point("agent")
+
+        # Add edge from tools back to agent
+        graph.add_edge("tools", "agent")
 
     # Add conditional edge from agent
     graph.add_conditional_edges(
@@ -86,7 +208,87 @@ def create_agent_graph() -> StateGraph:
         },
     )
 
-    # Add edge from tools back to agent
-    graph.add_edge("tools", "agent")
+    return graph.compile(checkpointer=checkpointer)
+
+
+# Compiled graphs shared by every caller, keyed by _graph_key
+_graphs: dict[tuple, StateGraph] = {}
+_graphs_lock = threading.Lock()
+_graph_stats = {"builds": 0, "hits": 0, "build_seconds": 0.0}
+
+
+def _graph_key(
+    async_mode: bool,
+    summarize_after_tokens: int | None,
+    checkpointer: BaseCheckpointSaver | None,
+    tool_list: Sequence[BaseTool],
+) -> tuple:
+    # Identity keys stay valid because the cached graph keeps the checkpointer and tools alive
+    return (
+        bool(async_mode),
+        summarize_after_tokens or None,
+        id(checkpointer) if checkpointer is not None else None,
+        tuple((t.name, id(t)) for t in tool_list),
+    )
+
+
+def get_agent_graph(
+    async_mode: bool = False,
+    summarize_after_tokens: int | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+    tools: Sequence[BaseTool] | None = None,
+) -> StateGraph:
+    """Return the shared compiled graph for this configuration, building it once.
+
+    Takes the same arguments as :func:`create_agent_graph`. The graph holds no
+    per-run state (that lives in the run config and the checkpointer), so one
+    instance serves any number of threads and event loops concurrently.
+    Treat it as read-only; use ``graph.with_config(...)`` for per-caller
+    settings. The model is not part of the key: nodes resolve it on every
+    call through ``llm_manager``, which caches one client per configuration.
+    """
+    tool_list = _tool_list(tools)
+    key = _graph_key(async_mode, summarize_after_tokens, checkpointer, tool_list)
+    with _graphs_lock:
+        graph = _graphs.get(key)
+        if graph is not None:
+            _graph_stats["hits"] += 1
+            return graph
+        start = time.perf_counter()
+        graph = create_agent_graph(async_mode, summarize_after_tokens, checkpointer, tool_list)
+        _graph_stats["build_seconds"] += time.perf_counter() - start
+        _graph_stats["builds"] += 1
+        _graphs[key] = graph
+        return graph
+
+
+def warm_up(
+    async_mode: bool = False,
+    summarize_after_tokens: int | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+    tools: Sequence[BaseTool] | None = None,
+) -> StateGraph:
+    """Pre-build a shared graph and the model client with its tool binding.
+
+    Call at process start so the first request does not pay for graph
+    compilation, client construction or tool schema conversion.
+
+    Raises:
+        ValueError: If the configured model backend cannot be built (e.g. a
+            missing API key).
+    """
+    graph = get_agent_graph(async_mode, summarize_after_tokens, checkpointer, tools)
+    llm_manager.get_bound(_tool_list(tools))
+    return graph
+
+
+def agent_graph_stats() -> dict:
+    """Return build/hit counters of the shared graph cache."""
+    with _graphs_lock:
+        return {**_graph_stats, "graphs": len(_graphs)}
+
 
-    return graph.compile()
+def clear_agent_graphs() -> None:
+    """Drop every shared graph (e.g. after replacing the tool list)."""
+    with _graphs_lock:
+        _graphs.clear()
@@ -0,0 +1,378 @@
+"""Safe, cost-bounded arithmetic evaluation.
+
+Expressions are parsed with :mod:`ast` once, validated against a small
+whitelist of numeric operations and compiled into a tree of closures that is
+cached by source text. Evaluation checks the size of every intermediate
+integer before performing an operation, so inputs such as ``9**9**9`` fail
+fast with :class:`BudgetExceeded` instead of pinning a CPU.
+
+Batches of bindings are evaluated with NumPy in float64; rows that float64
+cannot reproduce exactly (non-finite results, magnitudes of 2**53 and above)
+are recomputed with the scalar evaluator, so batch and scalar results agree.
+"""
+
+import ast
+import functools
+import math
+import operator
+import re
+from collections.abc import Callable, Mapping, Sequence
+
+import numpy as np
+
+Number = int | float
+
+MAX_EXPRESSION_LENGTH = 1000
+MAX_NODES = 1000
+MAX_DEPTH = 500
+# Largest integer operand or result, in bits (about 1200 decimal digits)
+MAX_INT_BITS = 4096
+MAX_BATCH_SIZE = 10000
+# float64 represents every integer below this exactly
+_EXACT_FLOAT_LIMIT = 2.0**53
+
+_BINARY_OPS: dict[type, Callable[[Number, Number], Number]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS: dict[type, Callable[[Number], Number]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_VECTOR_BINARY_OPS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+    ast.FloorDiv: np.floor_divide,
+    ast.Pow: np.power,
+}
+_VECTOR_UNARY_OPS = {ast.UAdd: np.positive, ast.USub: np.negative}
+
+_NUMBER_RE = re.compile(r"(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?")
+_NAME_RE = re.compile(r"[A-Za-z_\d.]")
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is malformed or uses unsupported syntax."""
+
+
+class BudgetExceeded(ExpressionError):
+    """Raised when an expression would exceed a size or cost limit."""
+
+
+def _bits(value: Number) -> int:
+    return value.bit_length() if isinstance(value, int) else 0
+
+
+def _check_operands(op: type, left: Number, right: Number) -> None:
+    """Reject operations whose integer result would exceed ``MAX_INT_BITS``."""
+    if not (isinstance(left, int) and isinstance(right, int)):
+        return
+    if op is ast.Mult:
+        estimate = _bits(left) + _bits(right)
+    elif op is ast.Pow:
+        # Lower bound on the result size; anything that passes is at most twice the limit
+        estimate = (_bits(left) - 1) * right + 1 if right > 0 and abs(left) > 1 else 0
+    else:
+        return
+    if estimate > MAX_INT_BITS:
+        raise BudgetExceeded(f"Result too large (about {estimate} bits, limit {MAX_INT_BITS})")
+
+
+def _to_float(value: Number) -> float:
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf
+
+
+def _check_result(value: Number) -> Number:
+    if isinstance(value, complex):
+        raise ExpressionError("Result is not a real number")
+    if isinstance(value, float) and not math.isfinite(value):
+        raise BudgetExceeded("Numeric overflow")
+    if _bits(value) > MAX_INT_BITS:
+        raise BudgetExceeded(f"Result too large (limit {MAX_INT_BITS} bits)")
+    return value
+
+
+class CompiledExpression:
+    """A validated expression, callable with variable bindings.
+
+    Attributes:
+        source: The original expression text.
+        variables: Names the expression reads from its bindings.
+        nodes: Number of AST nodes, a proxy for evaluation cost.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.nodes = 0
+        self._names: set[str] = set()
+        # Integer inputs give integer results unless the expression divides or has float literals
+        self._integral = True
+        self._vector_fn = None
+        if len(source) > MAX_EXPRESSION_LENGTH:
+            raise BudgetExceeded(f"Expression longer than {MAX_EXPRESSION_LENGTH} characters")
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
+            raise ExpressionError(f"Invalid expression: {e}") from None
+        try:
+            self._fn = self._compile(tree.body, 1)
+        except RecursionError:
+            raise BudgetExceeded("Expression nested too deeply") from None
+        self.variables = frozenset(self._names)
+        self._tree = tree.body
+
+    def _compile(self, node: ast.AST, depth: int) -> Callable[[Mapping[str, Number]], Number]:
+        self.nodes += 1
+        if self.nodes > MAX_NODES:
+            raise BudgetExceeded(f"Expression has more than {MAX_NODES} operations")
+        if depth > MAX_DEPTH:
+            raise BudgetExceeded(f"Expression nested deeper than {MAX_DEPTH} levels")
+
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            value = _check_result(node.value)
+            self._integral &= isinstance(value, int)
+            return lambda env: value
+
+        if isinstance(node, ast.Name):
+            name = node.id
+            self._names.add(name)
+
+            def lookup(env: Mapping[str, Number]) -> Number:
+                try:
+                    value = env[name]
+                except KeyError:
+                    raise ExpressionError(f"Unknown variable '{name}'") from None
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ExpressionError(f"Variable '{name}' is not a number")
+                return _check_result(value)
+
+            return lookup
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            unary = _UNARY_OPS[type(node.op)]
+            operand = self._compile(node.operand, depth + 1)
+            return lambda env: unary(operand(env))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            op_type = type(node.op)
+            binary = _BINARY_OPS[op_type]
+            self._integral &= op_type is not ast.Div
+            left = self._compile(node.left, depth + 1)
+            right = self._compile(node.right, depth + 1)
+
+            def apply(env: Mapping[str, Number]) -> Number:
+                a, b = left(env), right(env)
+                _check_operands(op_type, a, b)
+                return _check_result(binary(a, b))
+
+            return apply
+
+        raise ExpressionError(
+            f"Unsupported syntax '{ast.unparse(node)}'. Only numbers, variables and + - * / // ** are allowed."
+        )
+
+    def __call__(self, variables: Mapping[str, Number] | None = None) -> Number:
+        """Evaluate with ``variables`` bound to the expression's names.
+
+        Raises:
+            ExpressionError: A variable is missing or not a number.
+            BudgetExceeded: An intermediate result exceeds ``MAX_INT_BITS``.
+            ZeroDivisionError: Division by zero.
+        """
+        try:
+            return self._fn(variables or {})
+        except OverflowError:
+            raise BudgetExceeded("Numeric overflow") from None
+        except RecursionError:
+            raise BudgetExceeded("Expression nested too deeply") from None
+
+    def _compile_vector(self, node: ast.AST) -> Callable:
+        """Compile to a float64 function returning (values, peak magnitude, inexact mask)."""
+        if isinstance(node, ast.Constant):
+            value = _to_float(node.value)
+            return lambda env: (value, abs(value), False)
+
+        if isinstance(node, ast.Name):
+            name = node.id
+            return lambda env: (env[name], np.abs(env[name]), False)
+
+        if isinstance(node, ast.UnaryOp):
+            unary = _VECTOR_UNARY_OPS[type(node.op)]
+            operand = self._compile_vector(node.operand)
+
+            def apply_unary(env):
+                values, peak, inexact = operand(env)
+                return unary(values), peak, inexact
+
+            return apply_unary
+
+        op_type = type(node.op)
+        binary = _VECTOR_BINARY_OPS[op_type]
+        left = self._compile_vector(node.left)
+        right = self._compile_vector(node.right)
+
+        def apply(env):
+            a, peak_a, inexact_a = left(env)
+            b, peak_b, inexact_b = right(env)
+            values = binary(a, b)
+            inexact = inexact_a | inexact_b
+            if op_type is ast.Pow:
+                # An integer raised to a negative power is a float in Python
+                inexact = inexact | (np.asarray(b) < 0)
+            return values, np.maximum(np.maximum(peak_a, peak_b), np.abs(values)), inexact
+
+        return apply
+
+    def batch(self, columns: Mapping[str, Sequence[Number]]) -> list[Number | Exception]:
+        """Evaluate once per row of ``columns``, vectorized with NumPy.
+
+        Args:
+            columns: Variable name to a list of values; all lists have the same length.
+
+        Returns:
+            One result per row, or the ExpressionError / ZeroDivisionError the
+            scalar evaluator raises for that row.
+
+        Raises:
+            ExpressionError: A variable is missing, not numeric, or the lists differ in length.
+            BudgetExceeded: More than ``MAX_BATCH_SIZE`` rows.
+        """
+        missing = sorted(self.variables - columns.keys())
+        if missing:
+            raise ExpressionError(f"Unknown variable '{missing[0]}'")
+        lengths = {len(columns[name]) for name in self.variables}
+        if len(lengths) > 1:
+            raise ExpressionError("All variable lists must have the same length")
+        size = lengths.pop() if lengths else 1
+        if size > MAX_BATCH_SIZE:
+            raise BudgetExceeded(f"Batch larger than {MAX_BATCH_SIZE} rows")
+
+        integral = np.full(size, self._integral)
+        arrays = {}
+        for name in self.variables:
+            values = columns[name]
+            if any(isinstance(v, bool) or not isinstance(v, (int, float)) for v in values):
+                raise ExpressionError(f"Variable '{name}' is not a list of numbers")
+            integral &= np.fromiter((isinstance(v, int) for v in values), bool, size)
+            arrays[name] = np.fromiter(map(_to_float, values), np.float64, size)
+
+        if self._vector_fn is None:
+            self._vector_fn = self._compile_vector(self._tree)
+        with np.errstate(all="ignore"):
+            values, peak, inexact = self._vector_fn(arrays)
+        values = np.broadcast_to(np.asarray(values, dtype=np.float64), (size,))
+        peak = np.broadcast_to(peak, (size,))
+        inexact = np.broadcast_to(inexact, (size,))
+        fallback = ~np.isfinite(values) | ~(peak < _EXACT_FLOAT_LIMIT)
+        exact_int = integral & ~inexact
+
+        results: list[Number | Exception] = values.tolist()
+        for i in np.flatnonzero(exact_int & ~fallback):
+            results[i] = int(results[i])
+        for i in np.flatnonzero(fallback):
+            try:
+                results[i] = self({name: columns[name][i] for name in self.variables})
+            except (ExpressionError, ZeroDivisionError) as e:
+                results[i] = e
+        return results
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({self.source!r})"
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_expression(expression: str) -> CompiledExpression:
+    """Parse and validate ``expression``, reusing earlier compilations."""
+    return CompiledExpression(expression)
+
+
+def evaluate(expression: str, variables: Mapping[str, Number] | None = None) -> Number:
+    """Evaluate an arithmetic expression within the module's cost limits."""
+    return compile_expression(expression)(variables)
+
+
+def evaluate_batch(expression: str, variables: Mapping[str, Sequence[Number]]) -> list[Number | Exception]:
+    """Evaluate ``expression`` once per row of ``variables`` (see ``CompiledExpression.batch``)."""
+    return compile_expression(expression).batch(variables)
+
+
+def _parametrize(expression: str) -> tuple[str, list[Number]] | None:
+    """Split ``expression`` into a literal-free template and its literals.
+
+    A regex scan rather than an AST pass, since templating must cost less
+    than the parse it saves. Anything unusual (names, hex or complex literals,
+    leading zeros) returns None and is left to the scalar evaluator.
+    """
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        return None
+    constants: list[Number] = []
+    parts: list[str] = []
+    position = 0
+    for match in _NUMBER_RE.finditer(expression):
+        literal = match.group()
+        if len(literal) > 1 and literal[0] == "0" and literal[1].isdigit():
+            return None
+        try:
+            value = int(literal) if literal.replace("_", "").isdigit() else float(literal)
+        except ValueError:
+            return None
+        parts.append(expression[position : match.start()])
+        parts.append(f"_{len(constants)}")
+        constants.append(value)
+        position = match.end()
+    parts.append(expression[position:])
+    if not constants or _NAME_RE.search("".join(parts[::2])):
+        return None
+    return "".join(parts), constants
+
+
+def evaluate_many(expressions: Sequence[str]) -> list[Number | Exception]:
+    """Evaluate independent expressions, vectorizing those of the same shape.
+
+    Expressions that differ only in their numeric literals (``"3 * 1.1"`` and
+    ``"5 * 1.1"``) share one template and are evaluated as a single batch;
+    anything else falls back to :func:`evaluate`.
+
+    Returns:
+        One result or ExpressionError / ZeroDivisionError per expression.
+    """
+    if len(expressions) > MAX_BATCH_SIZE:
+        raise BudgetExceeded(f"Batch larger than {MAX_BATCH_SIZE} expressions")
+
+    def scalar(expression: str) -> Number | Exception:
+        try:
+            return evaluate(expression)
+        except (ExpressionError, ZeroDivisionError) as e:
+            return e
+
+    results: list[Number | Exception | None] = [None] * len(expressions)
+    groups: dict[str, list[tuple[int, list[Number]]]] = {}
+    for i, expression in enumerate(expressions):
+        parametrized = _parametrize(expression)
+        if parametrized is None:
+            results[i] = scalar(expression)
+        else:
+            template, constants = parametrized
+            groups.setdefault(template, []).append((i, constants))
+
+    for template, members in groups.items():
+        try:
+            compiled = compile_expression(template)
+        except ExpressionError:
+            # Report errors against the caller's text, not the template
+            for i, _ in members:
+                results[i] = scalar(expressions[i])
+            continue
+        columns = {f"_{k}": [constants[k] for _, constants in members] for k in range(len(members[0][1]))}
+        for (i, _), value in zip(members, compiled.batch(columns)):
+            results[i] = scalar(expressions[i]) if isinstance(value, ExpressionError) else value
+    return results
@@ -0,0 +1,178 @@
+"""Concurrent batch runs over a JSONL file of queries.
+
+Each input line is one independent conversation: either a JSON object with
+a ``query`` field (an optional ``id`` is copied to the result) or a bare
+JSON string. Lines are read lazily, at most ``concurrency`` conversations
+run at once on the async graph, and one result line is appended to the
+output as soon as its conversation finishes, so results are in completion
+order and carry the input ``line`` number.
+
+Runs are resumable: lines that already have a successful result in the
+output file are skipped, and failed lines are retried (their new result is
+appended after the old one).
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+USAGE_KEYS = ("input_tokens", "output_tokens", "total_tokens")
+
+
+def iter_lines(path: str | Path) -> Iterator[tuple[int, str]]:
+    """Yield ``(line number, text)`` for every non-blank input line, from 1."""
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                yield number, line
+
+
+def _repair_tail(path: Path) -> None:
+    """Cut a torn last line left by a run that died mid-write."""
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def completed_lines(path: str | Path) -> set[int]:
+    """Return the input line numbers that have a successful result in ``path``."""
+    path = Path(path)
+    if not path.exists():
+        return set()
+    _repair_tail(path)
+    done = set()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if "error" in record:
+                done.discard(record["line"])
+            else:
+                done.add(record["line"])
+    return done
+
+
+def parse_item(text: str) -> dict:
+    """Parse one input line into a dict with at least ``query``.
+
+    Raises:
+        ValueError: If the line is not a JSON string or an object with a
+            non-empty ``query``.
+    """
+    item = json.loads(text)
+    if isinstance(item, str):
+        item = {"query": item}
+    if not isinstance(item, dict) or not isinstance(item.get("query"), str) or not item["query"].strip():
+        raise ValueError("expected a JSON string or an object with a 'query' field")
+    return item
+
+
+def summarize_messages(messages: list) -> dict:
+    """Return the answer, tool calls and summed token usage of a finished run."""
+    usage = dict.fromkeys(USAGE_KEYS, 0)
+    tool_calls, answer = [], ""
+    for msg in messages:
+        if not isinstance(msg, AIMessage):
+            continue
+        tool_calls.extend(tc["name"] for tc in msg.tool_calls)
+        for key in USAGE_KEYS:
+            usage[key] += (msg.usage_metadata or {}).get(key, 0)
+        if msg.content and not msg.tool_calls:
+            answer = msg.content
+    return {"answer": answer, "tool_calls": tool_calls, "usage": usage}
+
+
+async def run_item(agent, number: int, text: str, timeout: float | None = None) -> dict:
+    """Run one input line as a new conversation and return its result record."""
+    record: dict = {"line": number}
+    start = time.perf_counter()
+    try:
+        item = parse_item(text)
+        record.update({"id": item.get("id"), "query": item["query"]})
+        config = {}
+        if agent.checkpointer is not None:
+            record["thread_id"] = f"batch-{uuid.uuid4().hex}"
+            config = {"configurable": {"thread_id": record["thread_id"]}}
+        result = await asyncio.wait_for(
+            agent.ainvoke({"messages": [HumanMessage(content=item["query"])]}, config), timeout
+        )
+        record.update(summarize_messages(result["messages"]))
+    except asyncio.TimeoutError:
+        record["error"] = f"timeout after {timeout}s"
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["latency_s"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+async def run_batch(
+    agent,
+    input_path: str | Path,
+    output_path: str | Path,
+    concurrency: int = 8,
+    timeout: float | None = None,
+    on_result=None,
+) -> dict:
+    """Run every pending line of ``input_path`` and append results to ``output_path``.
+
+    Args:
+        agent: Graph compiled with ``async_mode=True``.
+        input_path: JSONL file of queries.
+        output_path: JSONL result file; existing successful lines are skipped.
+        concurrency: Maximum conversations in flight.
+        timeout: Per-conversation timeout in seconds.
+        on_result: Optional callback called with each result record.
+
+    Returns:
+        Counts of completed, failed and skipped lines and the wall time.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    output_path = Path(output_path)
+    done = completed_lines(output_path)
+    stats = {"completed": 0, "errors": 0, "skipped": 0, "seconds": 0.0}
+    semaphore = asyncio.Semaphore(concurrency)
+    pending: set[asyncio.Task] = set()
+    start = time.perf_counter()
+
+    with open(output_path, "a", encoding="utf-8") as out:
+
+        async def one(number: int, text: str) -> None:
+            try:
+                record = await run_item(agent, number, text, timeout)
+            finally:
+                semaphore.release()
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+            stats["errors" if "error" in record else "completed"] += 1
+            if on_result is not None:
+                on_result(record)
+
+        try:
+            for number, text in iter_lines(input_path):
+                if number in done:
+                    stats["skipped"] += 1
+                    continue
+                # Back-pressure: read the next line only once a slot is free
+                await semaphore.acquire()
+                task = asyncio.create_task(one(number, text))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            out.flush()
+            os.fsync(out.fileno())
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,228 @@
+"""Exact-match LLM response cache with an in-memory LRU and optional SQLite tier."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, BaseMessage, message_to_dict, messages_from_dict
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from react_agent.llm import LLMConfig
+
+_tool_schema_hashes: dict[tuple, str] = {}
+
+
+def _canonical_message(msg: BaseMessage) -> dict:
+    data = {"type": msg.type, "content": msg.content}
+    if getattr(msg, "tool_calls", None):
+        data["tool_calls"] = [
+            {"name": tc["name"], "args": tc["args"], "id": tc.get("id")} for tc in msg.tool_calls
+        ]
+    if getattr(msg, "tool_call_id", None):
+        data["tool_call_id"] = msg.tool_call_id
+    return data
+
+
+def _tool_schema_hash(tools: Sequence[BaseTool]) -> str:
+    key = tuple(id(t) for t in tools)
+    digest = _tool_schema_hashes.get(key)
+    if digest is None:
+        schemas = [convert_to_openai_tool(t) for t in tools]
+        digest = hashlib.sha256(json.dumps(schemas, sort_keys=True).encode()).hexdigest()
+        _tool_schema_hashes[key] = digest
+    return digest
+
+
+def _digest(payload: dict) -> str:
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def hash_messages(messages: Sequence[BaseMessage], model: str = "") -> str:
+    """Hash a message list canonically, ignoring message ids."""
+    return _digest({"model": model, "messages": [_canonical_message(m) for m in messages]})
+
+
+def make_cache_key(config: LLMConfig, tools: Sequence[BaseTool], messages: Sequence[BaseMessage]) -> str:
+    """Build a canonical hash of everything that determines the model response.
+
+    Message ids are ignored, so replaying the same conversation in a new
+    session maps to the same key.
+
+    Args:
+        config: Model configuration (model id and temperature are hashed).
+        tools: Tools bound to the model.
+        messages: Conversation sent to the model.
+
+    Returns:
+        Hex digest identifying the request.
+    """
+    return _digest(
+        {
+            "model": config.model,
+            "temperature": config.temperature,
+            "tools": _tool_schema_hash(tools),
+            "messages": [_canonical_message(m) for m in messages],
+        }
+    )
+
+
+class ResponseCache:
+    """Two-tier cache of model responses.
+
+    The memory tier is an LRU bounded by entry count. The optional disk tier is
+    a SQLite table with a time-to-live and a total size cap; on a disk hit the
+    entry is promoted to memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        path: str | Path | None = None,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "memory_bytes": 0,
+            "bytes_served": 0,
+        }
+
+        if path is not None:
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._db.commit()
+
+    def get(self, key: str) -> AIMessage | None:
+        """Return the cached response for ``key``, or None on a miss."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+            else:
+                value = self._disk_get(key)
+                if value is None:
+                    self._stats["misses"] += 1
+                    return None
+                self._stats["disk_hits"] += 1
+                self._memory_put(key, value)
+            self._stats["bytes_served"] += len(value)
+
+        return messages_from_dict([json.loads(value)])[0]
+
+    def put(self, key: str, message: AIMessage) -> None:
+        """Store ``message`` as the response for ``key``."""
+        data = message_to_dict(message)
+        # Drop the id so a reused response is appended, not merged, by add_messages
+        data["data"]["id"] = None
+        value = json.dumps(data, ensure_ascii=False, default=str).encode()
+        with self._lock:
+            self._memory_put(key, value)
+            self._disk_put(key, value)
+            self._stats["stores"] += 1
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._stats["memory_bytes"] = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and byte metrics."""
+        with self._lock:
+            stats = {**self._stats, "memory_entries": len(self._memory)}
+            if self._db is not None:
+                count, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+                stats.update(disk_entries=count, disk_bytes=size)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def _memory_put(self, key: str, value: bytes) -> None:
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._stats["memory_bytes"] -= len(old)
+        self._memory[key] = value
+        self._stats["memory_bytes"] += len(value)
+        while len(self._memory) > self.max_entries:
+            _, evicted = self._memory.popitem(last=False)
+            self._stats["memory_bytes"] -= len(evicted)
+            self._stats["evictions"] += 1
+
+    def _disk_get(self, key: str) -> bytes | None:
+        if self._db is None:
+            return None
+        row = self._db.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if self.ttl is not None and now - row[1] > self.ttl:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+            return None
+        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        return row[0]
+
+    def _disk_put(self, key: str, value: bytes) -> None:
+        if self._db is None:
+            return
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, value, len(value), now, now),
+        )
+        if self.ttl is not None:
+            self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        if self.max_bytes is not None:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                # Evict least recently accessed rows until under the cap
+                for row_key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+                    if total <= self.max_bytes:
+                        break
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (row_key,))
+                    total -= size
+                    self._stats["evictions"] += 1
+        self._db.commit()
+
+
+_response_cache: ResponseCache | None = None
+
+
+def configure_response_cache(**kwargs) -> ResponseCache:
+    """Enable the process-wide response cache; kwargs go to :class:`ResponseCache`."""
+    global _response_cache
+    _response_cache = ResponseCache(**kwargs)
+    return _response_cache
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the process-wide response cache, or None when caching is disabled."""
+    return _response_cache
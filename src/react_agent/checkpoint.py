@@ -0,0 +1,673 @@
+"""SQLite checkpointer for persisting agent sessions across restarts.
+
+:class:`SQLiteSaver` stores LangGraph checkpoints in one SQLite file in WAL
+mode, so a conversation can be resumed after a crash by invoking the graph
+with the same ``thread_id``. The layout mirrors LangGraph's in-memory saver:
+one row per checkpoint, one row per channel *version* (unchanged channels
+are not rewritten) and one row per pending task write.
+
+Writes are group-committed: every ``put``/``put_writes`` call hands its rows
+to a single writer thread and waits for the commit. The writer drains
+whatever has queued up while the previous transaction was committing and
+writes it as one transaction, so concurrent sessions share fsyncs instead of
+paying one each. Reads use per-thread connections and never block on the
+writer.
+
+List-valued channels such as ``messages`` are delta-encoded: a new version
+is stored as "the first ``keep`` items of the previous version plus these
+new items", so appending a message writes one message instead of the whole
+history. Every ``snapshot_every`` versions a full snapshot bounds the
+replay chain, and :meth:`SQLiteSaver.compact` drops old checkpoints and the
+blobs only they needed.
+"""
+
+import asyncio
+import queue
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+# fsync policy -> PRAGMA synchronous. In WAL mode "normal" survives process
+# crashes but may lose the last commits on power loss; "off" leaves flushing
+# to the OS entirely.
+FSYNC_POLICIES = {"full": "FULL", "normal": "NORMAL", "off": "OFF"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    blob BLOB NOT NULL,
+    base TEXT,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    blob BLOB NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+# Rebuilds a delta-encoded value: the chain from ``version`` back to its snapshot
+_CHAIN_SQL = """
+WITH RECURSIVE chain(version, type, blob, base, depth) AS (
+    SELECT version, type, blob, base, 0 FROM blobs
+    WHERE thread_id = ?1 AND checkpoint_ns = ?2 AND channel = ?3 AND version = ?4
+    UNION ALL
+    SELECT b.version, b.type, b.blob, b.base, c.depth + 1 FROM blobs b JOIN chain c
+    ON b.thread_id = ?1 AND b.checkpoint_ns = ?2 AND b.channel = ?3 AND b.version = c.base
+)
+SELECT type, blob, base FROM chain ORDER BY depth DESC
+"""
+
+_STOP = object()
+_EMPTY = object()
+
+# A unit of work for the writer: (sql, rows) pairs run with executemany, or
+# callables run with the writer's connection inside the same transaction
+_Ops = list[tuple[str, list[tuple]] | Callable[[sqlite3.Connection], None]]
+
+
+def _shared_prefix(old: list, new: list) -> int:
+    """Length of the common prefix of two lists, comparing by identity first."""
+    n = min(len(old), len(new))
+    i = 0
+    while i < n and (old[i] is new[i] or old[i] == new[i]):
+        i += 1
+    return i
+
+
+class SQLiteSaver(BaseCheckpointSaver[str]):
+    """Checkpoint saver backed by a SQLite database in WAL mode.
+
+    Args:
+        path: Database file; created with its tables if missing.
+        fsync: ``"full"`` (fsync every commit), ``"normal"`` (fsync on WAL
+            checkpoints only) or ``"off"``.
+        max_batch: Most queued calls committed in one transaction.
+        commit_delay: Seconds the writer waits for more calls to join a
+            batch before committing. 0 batches only what queued up during
+            the previous commit, which adds no latency.
+        snapshot_every: Store a full copy of a list channel after this many
+            deltas; 0 disables delta encoding.
+        max_cached_threads: Most (thread, channel) pairs whose last written
+            list is kept in memory as a delta base; evicted pairs restart
+            with a snapshot.
+
+    Use one instance per process and :meth:`close` it (or use it as a
+    context manager) to stop the writer thread.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        fsync: str = "normal",
+        max_batch: int = 256,
+        commit_delay: float = 0.0,
+        snapshot_every: int = 32,
+        max_cached_threads: int = 1024,
+    ):
+        super().__init__()
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_POLICIES)}")
+        self.path = Path(path)
+        self.fsync = fsync
+        self.max_batch = max(max_batch, 1)
+        self.commit_delay = commit_delay
+        self.snapshot_every = snapshot_every
+        self.max_cached_threads = max_cached_threads
+        self.commits = 0
+        self.batched_calls = 0
+        self.commit_seconds = 0.0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        if "base" not in {row[1] for row in conn.execute("PRAGMA table_info(blobs)")}:
+            conn.execute("ALTER TABLE blobs ADD COLUMN base TEXT")
+        conn.close()
+
+        # (thread_id, checkpoint_ns, channel) -> (version, items, deltas since snapshot)
+        self._bases: OrderedDict[tuple[str, str, str], tuple[str, list, int]] = OrderedDict()
+        self._bases_lock = threading.Lock()
+
+        self._local = threading.local()
+        # Every thread's reader connection, so close() can close them all
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, name="sqlite-checkpoint-writer", daemon=True)
+        self._writer.start()
+
+    def __enter__(self) -> "SQLiteSaver":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={FSYNC_POLICIES[self.fsync]}")
+        return conn
+
+    @property
+    def _reader(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("SQLiteSaver is closed")
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            with self._readers_lock:
+                if self._closed:
+                    raise RuntimeError("SQLiteSaver is closed")
+                conn = self._local.conn = self._connect()
+                self._readers.append(conn)
+        return conn
+
+    # -- writer ------------------------------------------------------------
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.commit_delay
+            while len(batch) < self.max_batch:
+                try:
+                    remaining = deadline - time.monotonic()
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            # Calls cancelled while queued (e.g. an abandoned aput) are dropped
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if batch:
+                self._commit(conn, batch)
+        conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: list[tuple[_Ops, Future]]) -> None:
+        started = time.perf_counter()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for ops, _ in batch:
+                for op in ops:
+                    op(conn) if callable(op) else conn.executemany(*op)
+            conn.execute("COMMIT")
+        except Exception as exc:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            if len(batch) > 1:
+                # Retry one call per transaction so a bad call fails alone
+                for item in batch:
+                    self._commit(conn, [item])
+            else:
+                batch[0][1].set_exception(exc)
+            return
+        self.commits += 1
+        self.batched_calls += len(batch)
+        self.commit_seconds += time.perf_counter() - started
+        for _, future in batch:
+            future.set_result(None)
+
+    def _submit(self, ops: _Ops) -> Future:
+        if self._closed:
+            raise RuntimeError("SQLiteSaver is closed")
+        future: Future = Future()
+        self._queue.put((ops, future))
+        return future
+
+    def close(self) -> None:
+        """Commit queued writes, stop the writer thread and close every reader connection."""
+        if not self._closed:
+            with self._readers_lock:
+                self._closed = True
+            self._queue.put(_STOP)
+            self._writer.join()
+            with self._readers_lock:
+                readers, self._readers = self._readers, []
+            for conn in readers:
+                conn.close()
+
+    # -- row builders --------------------------------------------------------
+
+    def _encode(self, thread_id: str, checkpoint_ns: str, channel: str, version: str, value: Any) -> tuple:
+        """Return ``(type, blob, base)`` for a channel value, as a delta when possible."""
+        key = (thread_id, checkpoint_ns, channel)
+        if not isinstance(value, list) or self.snapshot_every <= 0:
+            return (*self.serde.dumps_typed(value), None)
+        with self._bases_lock:
+            previous = self._bases.get(key)
+            if previous is not None and previous[2] < self.snapshot_every:
+                base, items, depth = previous
+                keep = _shared_prefix(items, value)
+                encoded = (*self.serde.dumps_typed([keep, value[keep:]]), base)
+                depth += 1
+            else:
+                encoded, depth = (*self.serde.dumps_typed(value), None), 0
+            self._bases[key] = (version, list(value), depth)
+            self._bases.move_to_end(key)
+            while len(self._bases) > self.max_cached_threads:
+                self._bases.popitem(last=False)
+        return encoded
+
+    def _forget(self, thread_id: str) -> None:
+        """Drop cached delta bases of ``thread_id`` so its next write is a snapshot."""
+        with self._bases_lock:
+            for key in [key for key in self._bases if key[0] == thread_id]:
+                del self._bases[key]
+
+    def _put_ops(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> tuple[_Ops, RunnableConfig]:
+        c = checkpoint.copy()
+        values = c.pop("channel_values")
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        blob_rows = [
+            (
+                thread_id,
+                checkpoint_ns,
+                channel,
+                str(version),
+                *(
+                    self._encode(thread_id, checkpoint_ns, channel, str(version), values[channel])
+                    if channel in values
+                    else ("empty", b"", None)
+                ),
+            )
+            for channel, version in new_versions.items()
+        ]
+        checkpoint_row = (
+            thread_id,
+            checkpoint_ns,
+            checkpoint["id"],
+            config["configurable"].get("checkpoint_id"),
+            *self.serde.dumps_typed(c),
+            *self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+        )
+        ops = [
+            ("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?, ?)", blob_rows),
+            ("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [checkpoint_row]),
+        ]
+        next_config = {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint["id"]}
+        }
+        return ops, next_config
+
+    def _writes_ops(self, config: RunnableConfig, writes: Sequence[tuple[str, Any]], task_id: str, task_path: str) -> _Ops:
+        configurable = config["configurable"]
+        key = (configurable["thread_id"], configurable.get("checkpoint_ns", ""), configurable["checkpoint_id"])
+        # Regular writes keep the first value stored; special channels (errors, interrupts) overwrite
+        ignore, replace = [], []
+        for idx, (channel, value) in enumerate(writes):
+            slot = WRITES_IDX_MAP.get(channel, idx)
+            row = (*key, task_id, slot, channel, *self.serde.dumps_typed(value), task_path)
+            (ignore if slot >= 0 else replace).append(row)
+        return [
+            ("INSERT OR IGNORE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", ignore),
+            ("INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", replace),
+        ]
+
+    # -- sync API ----------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint and the channel versions it introduced."""
+        ops, next_config = self._put_ops(config, checkpoint, metadata, new_versions)
+        try:
+            self._submit(ops).result()
+        except BaseException:
+            # Later deltas must not build on a version that was never stored
+            self._forget(config["configurable"]["thread_id"])
+            raise
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes of a task for the checkpoint in ``config``."""
+        self._submit(self._writes_ops(config, writes, task_id, task_path)).result()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete every checkpoint and write of ``thread_id``."""
+        ops = [(f"DELETE FROM {table} WHERE thread_id = ?", [(thread_id,)]) for table in ("checkpoints", "blobs", "writes")]
+        self._forget(thread_id)
+        self._submit(ops).result()
+
+    def compact(self, thread_id: str, keep: int = 1) -> dict:
+        """Delete all but the newest ``keep`` checkpoints of a thread.
+
+        The oldest kept checkpoint's list channels are rewritten as snapshots,
+        and every blob no kept checkpoint can reach is deleted. Runs as one
+        transaction on the writer thread.
+
+        Returns:
+            Counts of deleted checkpoints and blobs.
+        """
+        result = {"checkpoints": 0, "blobs": 0}
+        self._forget(thread_id)
+        self._submit([lambda conn: self._compact(conn, thread_id, max(keep, 1), result)]).result()
+        return result
+
+    def _compact(self, conn: sqlite3.Connection, thread_id: str, keep: int, result: dict) -> None:
+        rows = conn.execute(
+            "SELECT checkpoint_ns, checkpoint_id, type, checkpoint FROM checkpoints "
+            "WHERE thread_id = ? ORDER BY checkpoint_ns, checkpoint_id DESC",
+            (thread_id,),
+        ).fetchall()
+        kept: dict[str, list[tuple[str, dict]]] = {}
+        dropped = []
+        for checkpoint_ns, checkpoint_id, ctype, cblob in rows:
+            items = kept.setdefault(checkpoint_ns, [])
+            if len(items) < keep:
+                items.append((checkpoint_id, self.serde.loads_typed((ctype, cblob))))
+            else:
+                dropped.append((thread_id, checkpoint_ns, checkpoint_id))
+        for table in ("checkpoints", "writes"):
+            conn.executemany(
+                f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", dropped
+            )
+        result["checkpoints"] = len(dropped)
+
+        for checkpoint_ns, items in kept.items():
+            oldest_id, oldest = items[-1]
+            conn.execute(
+                "UPDATE checkpoints SET parent_checkpoint_id = NULL "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, oldest_id),
+            )
+            for channel, version in oldest["channel_versions"].items():
+                value = self._channel_value(conn, thread_id, checkpoint_ns, channel, str(version))
+                if isinstance(value, list):
+                    conn.execute(
+                        "UPDATE blobs SET type = ?, blob = ?, base = NULL "
+                        "WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ? AND base IS NOT NULL",
+                        (*self.serde.dumps_typed(value), thread_id, checkpoint_ns, channel, str(version)),
+                    )
+
+            bases = {
+                (channel, version): base
+                for channel, version, base in conn.execute(
+                    "SELECT channel, version, base FROM blobs WHERE thread_id = ? AND checkpoint_ns = ?",
+                    (thread_id, checkpoint_ns),
+                )
+            }
+            reachable = set()
+            for _, checkpoint in items:
+                for channel, version in checkpoint["channel_versions"].items():
+                    key = (channel, str(version))
+                    while key in bases and key not in reachable:
+                        reachable.add(key)
+                        key = (channel, bases[key])
+            unreachable = [(thread_id, checkpoint_ns, *key) for key in bases if key not in reachable]
+            conn.executemany(
+                "DELETE FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                unreachable,
+            )
+            result["blobs"] += len(unreachable)
+
+    def vacuum(self) -> None:
+        """Return free pages left by :meth:`compact` or deletes to the file system."""
+        conn = self._connect()
+        try:
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+
+    def _channel_value(self, conn: sqlite3.Connection, thread_id: str, checkpoint_ns: str, channel: str, version: str) -> Any:
+        """Load one channel version, replaying deltas from the nearest snapshot.
+
+        Returns ``_EMPTY`` when the channel has no value at that version.
+
+        Raises:
+            ValueError: If the delta chain does not reach a snapshot, i.e. the
+                database lost rows (corruption or a bad :meth:`compact`).
+                Treating it as empty would make the next turn overwrite the
+                history.
+        """
+        chain = conn.execute(_CHAIN_SQL, (thread_id, checkpoint_ns, channel, version)).fetchall()
+        if not chain or chain[0][0] == "empty":
+            return _EMPTY
+        if chain[0][2] is not None:
+            raise ValueError(
+                f"Broken delta chain for thread {thread_id!r}, channel {channel!r}, version {version}: "
+                f"base version {chain[0][2]} is missing from {self.path}"
+            )
+        value = self.serde.loads_typed(chain[0][:2])
+        for dtype, blob, _ in chain[1:]:
+            keep, tail = self.serde.loads_typed((dtype, blob))
+            value = value[:keep] + list(tail)
+        return value
+
+    def _load(self, row: tuple) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, ctype, cblob, mtype, mblob = row
+        conn = self._reader
+        checkpoint = self.serde.loads_typed((ctype, cblob))
+        channel_values = {}
+        for channel, version in checkpoint["channel_versions"].items():
+            value = self._channel_value(conn, thread_id, checkpoint_ns, channel, str(version))
+            if value is not _EMPTY:
+                channel_values[channel] = value
+        writes = conn.execute(
+            "SELECT task_id, channel, type, blob FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return CheckpointTuple(
+            config={"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": checkpoint_id}},
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self.serde.loads_typed((mtype, mblob)),
+            parent_config=(
+                {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": parent_id}}
+                if parent_id
+                else None
+            ),
+            pending_writes=[(task_id, channel, self.serde.loads_typed((t, b))) for task_id, channel, t, b in writes],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Return the checkpoint in ``config``, or the thread's latest one."""
+        configurable = config["configurable"]
+        params = [configurable["thread_id"], configurable.get("checkpoint_ns", "")]
+        sql = "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        if checkpoint_id := get_checkpoint_id(config):
+            sql += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        # Checkpoint ids are time-ordered UUIDv6 strings, so the largest is the latest
+        row = self._reader.execute(sql + " ORDER BY checkpoint_id DESC LIMIT 1", params).fetchone()
+        return self._load(row) if row is not None else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints newest first, optionally filtered by metadata."""
+        clauses, params = [], []
+        if config is not None:
+            configurable = config["configurable"]
+            clauses.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            if (checkpoint_ns := configurable.get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        sql = "SELECT * FROM checkpoints"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        rows = self._reader.execute(sql + " ORDER BY checkpoint_id DESC", params).fetchall()
+
+        for row in rows:
+            if limit is not None and limit <= 0:
+                break
+            if filter:
+                metadata = self.serde.loads_typed((row[6], row[7]))
+                if not all(metadata.get(k) == v for k, v in filter.items()):
+                    continue
+            if limit is not None:
+                limit -= 1
+            yield self._load(row)
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        """Return a version string that sorts after ``current``.
+
+        The random suffix keeps versions unique when threads are forked.
+        """
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    def stats(self) -> dict:
+        """Return group-commit counters, blob counts and the database size."""
+        size = sum(p.stat().st_size for p in self.path.parent.glob(self.path.name + "*") if p.is_file())
+        blobs, deltas, blob_bytes = self._reader.execute(
+            "SELECT COUNT(*), COUNT(base), COALESCE(SUM(LENGTH(blob)), 0) FROM blobs"
+        ).fetchone()
+        return {
+            "blobs": blobs,
+            "delta_blobs": deltas,
+            "blob_bytes": blob_bytes,
+            "commits": self.commits,
+            "calls": self.batched_calls,
+            "calls_per_commit": self.batched_calls / self.commits if self.commits else 0.0,
+            "commit_ms": self.commit_seconds / self.commits * 1000 if self.commits else 0.0,
+            "db_bytes": size,
+        }
+
+    # -- async API -----------------------------------------------------------
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async :meth:`put`; awaits the group commit without blocking the loop."""
+        ops, next_config = self._put_ops(config, checkpoint, metadata, new_versions)
+        try:
+            await asyncio.wrap_future(self._submit(ops))
+        except BaseException:
+            self._forget(config["configurable"]["thread_id"])
+            raise
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async :meth:`put_writes`."""
+        await asyncio.wrap_future(self._submit(self._writes_ops(config, writes, task_id, task_path)))
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Async :meth:`delete_thread`."""
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Async :meth:`get_tuple`, run on a worker thread."""
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async :meth:`list`, run on a worker thread."""
+        items = await asyncio.to_thread(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))
+        for item in items:
+            yield item
+
+
+# Process-wide checkpointer; None compiles graphs without persistence
+_checkpointer: SQLiteSaver | None = None
+
+
+def configure_checkpointer(path: str | Path, fsync: str = "normal", commit_delay: float = 0.0) -> SQLiteSaver:
+    """Open the SQLite checkpointer at ``path`` for graphs created afterwards."""
+    global _checkpointer
+    if _checkpointer is not None:
+        _checkpointer.close()
+    _checkpointer = SQLiteSaver(path, fsync=fsync, commit_delay=commit_delay)
+    return _checkpointer
+
+
+def get_checkpointer() -> SQLiteSaver | None:
+    """Return the process-wide checkpointer, or None when none is configured."""
+    return _checkpointer
@@ -0,0 +1,151 @@
+"""Token-budgeted context window selection for long conversations."""
+
+import json
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+# Fixed per-message overhead for role markers and separators
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimate the token count of ``text`` without a tokenizer.
+
+    ASCII text averages about four characters per token, while Hangul and
+    other multi-byte scripts are closer to one token per character. The
+    number of multi-byte characters is derived from the UTF-8 length, so the
+    estimate costs a single encode.
+    """
+    chars = len(text)
+    wide = (len(text.encode()) - chars) // 2
+    return (chars - wide + 3) // 4 + wide
+
+
+def estimate_message_tokens(msg: BaseMessage) -> int:
+    """Estimate the tokens a message contributes to the prompt."""
+    content = msg.content if isinstance(msg.content, str) else json.dumps(msg.content, ensure_ascii=False)
+    tokens = estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+    for tc in getattr(msg, "tool_calls", None) or []:
+        tokens += estimate_tokens(tc["name"]) + estimate_tokens(json.dumps(tc["args"], ensure_ascii=False))
+    return tokens
+
+
+@dataclass
+class _ConversationIndex:
+    """Incrementally maintained token prefix sums for one conversation."""
+
+    ids: list = field(default_factory=list)
+    prefix: list[int] = field(default_factory=lambda: [0])
+    turn_starts: list[int] = field(default_factory=list)
+    pinned: int = 0
+
+
+class ContextWindow:
+    """Select the newest turns of a conversation that fit a token budget.
+
+    Leading system messages are always kept. Older messages are dropped a
+    whole human turn at a time, so an AIMessage with tool calls is never
+    separated from its ToolMessages, and the current turn is always kept even
+    if it alone exceeds the budget.
+
+    Token counts are computed once per message and kept as prefix sums per
+    conversation (identified by the id of its first message), so each call
+    only processes newly appended messages and finds the cut with a binary
+    search.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        estimator: Callable[[BaseMessage], int] = estimate_message_tokens,
+        max_conversations: int = 1024,
+    ):
+        self.max_tokens = max_tokens
+        self.estimator = estimator
+        self.max_conversations = max_conversations
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[str, _ConversationIndex] = OrderedDict()
+        self._stats = {"calls": 0, "trimmed_calls": 0, "messages_dropped": 0, "tokens_dropped": 0}
+
+    def select(self, messages: Sequence[BaseMessage]) -> list[BaseMessage]:
+        """Return the messages to send to the model.
+
+        Args:
+            messages: Full conversation history.
+
+        Returns:
+            Pinned system messages followed by the newest whole turns that
+            fit within ``max_tokens``.
+        """
+        if not messages:
+            return list(messages)
+
+        with self._lock:
+            index = self._sync(messages)
+            self._stats["calls"] += 1
+            total = index.prefix[-1]
+            if total <= self.max_tokens or not index.turn_starts:
+                return list(messages)
+
+            pinned = index.pinned
+            # Smallest i with tokens(messages[i:]) fitting the unpinned budget
+            budget = self.max_tokens - index.prefix[pinned]
+            i = bisect_left(index.prefix, total - budget)
+            j = bisect_left(index.turn_starts, i)
+            start = index.turn_starts[min(j, len(index.turn_starts) - 1)]
+            if start <= pinned:
+                return list(messages)
+
+            self._stats["trimmed_calls"] += 1
+            self._stats["messages_dropped"] += start - pinned
+            self._stats["tokens_dropped"] += index.prefix[start] - index.prefix[pinned]
+
+        return [*messages[:pinned], *messages[start:]]
+
+    def stats(self) -> dict:
+        """Return selection counters."""
+        with self._lock:
+            return {**self._stats, "conversations": len(self._indexes)}
+
+    def _sync(self, messages: Sequence[BaseMessage]) -> _ConversationIndex:
+        key = messages[0].id or str(id(messages[0]))
+        index = self._indexes.get(key)
+        known = len(index.ids) if index is not None else 0
+        # History was rewritten (removed or replaced messages); start over
+        if index is None or known > len(messages) or (known and messages[known - 1].id != index.ids[-1]):
+            index = _ConversationIndex()
+            known = 0
+        self._indexes[key] = index
+        self._indexes.move_to_end(key)
+        while len(self._indexes) > self.max_conversations:
+            self._indexes.popitem(last=False)
+
+        for i in range(known, len(messages)):
+            msg = messages[i]
+            if i == index.pinned and isinstance(msg, SystemMessage):
+                index.pinned += 1
+            elif isinstance(msg, HumanMessage):
+                index.turn_starts.append(i)
+            index.ids.append(msg.id)
+            index.prefix.append(index.prefix[-1] + self.estimator(msg))
+        return index
+
+
+_context_window: ContextWindow | None = None
+
+
+def configure_context_window(max_tokens: int, **kwargs) -> ContextWindow:
+    """Enable token-budgeted context selection ahead of the agent node."""
+    global _context_window
+    _context_window = ContextWindow(max_tokens, **kwargs)
+    return _context_window
+
+
+def get_context_window() -> ContextWindow | None:
+    """Return the process-wide context window, or None when disabled."""
+    return _context_window
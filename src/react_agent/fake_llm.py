@@ -0,0 +1,194 @@
+"""Deterministic offline chat model for benchmarking the agent graph.
+
+The fake model follows a tool plan: the n-th model call of a turn emits the
+tool calls of step n (several calls in one step run as parallel calls), and
+once the plan is exhausted it answers with a fixed number of tokens. Latency
+before the first token and between tokens is drawn from configurable
+distributions, so graph, tool and concurrency overhead can be measured
+without a network.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, Field, PrivateAttr
+
+from react_agent.context import estimate_message_tokens
+
+# Arguments used when the plan names a tool without explicit arguments
+DEFAULT_TOOL_ARGS = {
+    "calculator": {"expression": "157 * 23 + 89"},
+    "calculator_batch": {"template": "price * qty", "variables": {"price": [12.5, 8, 30], "qty": [4, 10, 2]}},
+    "search_web": {"query": "LangGraph"},
+    "get_current_time": {},
+}
+
+
+@dataclass(frozen=True)
+class Latency:
+    """A latency distribution in seconds.
+
+    Attributes:
+        kind: One of ``constant``, ``uniform``, ``normal`` or ``lognormal``.
+        a: Value (constant), lower bound (uniform), mean (normal) or median (lognormal).
+        b: Upper bound (uniform), standard deviation (normal) or sigma (lognormal).
+    """
+
+    kind: str = "constant"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """Parse ``"0.05"``, ``"uniform:0.01,0.1"`` or ``"lognormal:0.2,0.5"``."""
+        kind, _, params = spec.partition(":")
+        if not params:
+            return cls("constant", float(kind))
+        values = [float(v) for v in params.split(",")]
+        if kind not in ("constant", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {kind}")
+        return cls(kind, *values)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency value."""
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "normal":
+            return max(rng.gauss(self.a, self.b), 0.0)
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(self.a), self.b) if self.a > 0 else 0.0
+        return self.a
+
+
+def parse_tool_plan(spec: str) -> list[list[str]]:
+    """Parse a tool plan such as ``"search_web+calculator,calculator"``.
+
+    Commas separate model steps and ``+`` joins calls issued in one step.
+    """
+    return [[name.strip() for name in step.split("+") if name.strip()] for step in spec.split(",") if step.strip()]
+
+
+class FakeChatModel(BaseChatModel):
+    """Scripted chat model with synthetic latency and token streaming."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    tool_plan: list[list[str]] = Field(default_factory=lambda: [["calculator"]])
+    tool_args: dict[str, dict] = Field(default_factory=lambda: dict(DEFAULT_TOOL_ARGS))
+    answer_tokens: int = 20
+    first_token_latency: Latency = Latency()
+    token_latency: Latency = Latency()
+    prefill_seconds_per_1k_tokens: float = 0.0
+    seed: int = 0
+    tools_bound: bool = False
+
+    _rng: random.Random = PrivateAttr()
+    _rng_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context) -> None:
+        self._rng = random.Random(self.seed)
+
+    @classmethod
+    def from_env(cls) -> "FakeChatModel":
+        """Build a fake model from ``FAKE_LLM_*`` environment variables."""
+        return cls(
+            tool_plan=parse_tool_plan(os.getenv("FAKE_LLM_TOOLS", "calculator")),
+            answer_tokens=int(os.getenv("FAKE_LLM_TOKENS", "20")),
+            first_token_latency=Latency.parse(os.getenv("FAKE_LLM_LATENCY", "0")),
+            token_latency=Latency.parse(os.getenv("FAKE_LLM_TOKEN_LATENCY", "0")),
+            prefill_seconds_per_1k_tokens=float(os.getenv("FAKE_LLM_PREFILL_PER_1K", "0")),
+            seed=int(os.getenv("FAKE_LLM_SEED", "0")),
+        )
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.model_copy(update={"tools_bound": True})
+
+    def _plan(self, messages: list[BaseMessage]) -> tuple[list[dict], list[str], dict]:
+        """Return the tool calls, answer tokens and usage for the next reply."""
+        turn_start = max((i for i, m in enumerate(messages) if isinstance(m, HumanMessage)), default=0)
+        step = sum(isinstance(m, AIMessage) for m in messages[turn_start:])
+        digest = hashlib.sha1(f"{len(messages)}:{messages[turn_start].content}".encode()).hexdigest()[:12]
+
+        tool_calls = []
+        if self.tools_bound and step < len(self.tool_plan):
+            for i, name in enumerate(self.tool_plan[step]):
+                args = dict(self.tool_args.get(name, {}))
+                tool_calls.append({"name": name, "args": args, "id": f"call_{digest}_{step}_{i}", "type": "tool_call"})
+
+        if tool_calls:
+            tokens = []
+        elif self.tools_bound:
+            tokens = [f"tok{i} " for i in range(self.answer_tokens)]
+        else:
+            tokens = ["Summary ", f"of {len(messages)} messages."]
+
+        input_tokens = sum(estimate_message_tokens(m) for m in messages)
+        usage = {"input_tokens": input_tokens, "output_tokens": len(tokens), "total_tokens": input_tokens + len(tokens)}
+        return tool_calls, tokens, usage
+
+    def _delays(self, input_tokens: int, count: int) -> tuple[float, list[float]]:
+        with self._rng_lock:
+            first = self.first_token_latency.sample(self._rng)
+            between = [self.token_latency.sample(self._rng) for _ in range(max(count - 1, 0))]
+        return first + input_tokens / 1000 * self.prefill_seconds_per_1k_tokens, between
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        tool_calls, tokens, usage = self._plan(messages)
+        first, between = self._delays(usage["input_tokens"], len(tokens))
+        time.sleep(first + sum(between))
+        message = AIMessage(content="".join(tokens), tool_calls=tool_calls, usage_metadata=usage)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        tool_calls, tokens, usage = self._plan(messages)
+        first, between = self._delays(usage["input_tokens"], len(tokens))
+        await asyncio.sleep(first + sum(between))
+        message = AIMessage(content="".join(tokens), tool_calls=tool_calls, usage_metadata=usage)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _chunks(self, tokens: list[str], tool_calls: list[dict], usage: dict) -> list[AIMessageChunk]:
+        chunks = [AIMessageChunk(content=tok) for tok in tokens]
+        tool_call_chunks = [
+            {"name": tc["name"], "args": json.dumps(tc["args"], ensure_ascii=False), "id": tc["id"], "index": i}
+            for i, tc in enumerate(tool_calls)
+        ]
+        chunks.append(AIMessageChunk(content="", tool_call_chunks=tool_call_chunks, usage_metadata=usage))
+        return chunks
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        tool_calls, tokens, usage = self._plan(messages)
+        first, between = self._delays(usage["input_tokens"], len(tokens))
+        time.sleep(first)
+        for i, chunk in enumerate(self._chunks(tokens, tool_calls, usage)):
+            if 0 < i < len(tokens):
+                time.sleep(between[i - 1])
+            if run_manager and chunk.content:
+                run_manager.on_llm_new_token(chunk.content, chunk=ChatGenerationChunk(message=chunk))
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        tool_calls, tokens, usage = self._plan(messages)
+        first, between = self._delays(usage["input_tokens"], len(tokens))
+        await asyncio.sleep(first)
+        for i, chunk in enumerate(self._chunks(tokens, tool_calls, usage)):
+            if 0 < i < len(tokens):
+                await asyncio.sleep(between[i - 1])
+            if run_manager and chunk.content:
+                await run_manager.on_llm_new_token(chunk.content, chunk=ChatGenerationChunk(message=chunk))
+            yield ChatGenerationChunk(message=chunk)
+
@@ -0,0 +1,148 @@
+"""Aho-Corasick multi-keyword matching for ``search_web``'s keyword table."""
+
+import threading
+import unicodedata
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from dataclasses import dataclass
+
+
+def normalize_keyword(text: str) -> str:
+    """Case- and width-fold text so keywords match regardless of spelling."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """One keyword occurrence in normalized query text."""
+
+    keyword: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a fixed set of keywords.
+
+    Matching is a single left-to-right pass over the text, so its cost
+    depends on the text length and the number of matches, not on how many
+    keywords the automaton holds. Keywords and text are normalized with
+    :func:`normalize_keyword`; matches are substring matches.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(dict.fromkeys(k for k in map(normalize_keyword, keywords) if k))
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (index,)
+
+        # Breadth-first fail links; each state's output absorbs its fail state's
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def iter_matches(self, text: str) -> Iterator[KeywordMatch]:
+        """Yield every keyword occurrence in ``text`` in order of match end."""
+        goto, fail, out, keywords = self._goto, self._fail, self._out, self.keywords
+        state = 0
+        for position, ch in enumerate(normalize_keyword(text)):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                keyword = keywords[index]
+                yield KeywordMatch(keyword, position + 1 - len(keyword), position + 1)
+
+    def match(self, text: str) -> list[str]:
+        """Return the distinct keywords found in ``text``, best first.
+
+        Keywords are ranked by their first occurrence, and longer keywords
+        win ties (``"react agent"`` before ``"react"``).
+        """
+        first: dict[str, int] = {}
+        for m in self.iter_matches(text):
+            if m.keyword not in first or m.start < first[m.keyword]:
+                first[m.keyword] = m.start
+        return sorted(first, key=lambda k: (first[k], -len(k)))
+
+
+class KeywordTable(MutableMapping):
+    """Keyword-to-value mapping with a lazily rebuilt :class:`KeywordMatcher`.
+
+    Any mutation discards the automaton; the next lookup rebuilds it once,
+    so a stable table pays the build cost only once.
+
+    Args:
+        entries: Initial keyword-to-value entries.
+        on_change: Called after every mutation (e.g. to clear result caches).
+    """
+
+    def __init__(self, entries: Mapping[str, str] | None = None, on_change: Callable[[], None] | None = None):
+        self._entries: dict[str, str] = {}
+        self._matcher: KeywordMatcher | None = None
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.on_change = None
+        self.update(entries or {})
+        self.on_change = on_change
+
+    def __getitem__(self, keyword: str) -> str:
+        return self._entries[normalize_keyword(keyword)]
+
+    def __setitem__(self, keyword: str, value: str) -> None:
+        with self._lock:
+            self._entries[normalize_keyword(keyword)] = value
+            self._matcher = None
+        if self.on_change:
+            self.on_change()
+
+    def __delitem__(self, keyword: str) -> None:
+        with self._lock:
+            del self._entries[normalize_keyword(keyword)]
+            self._matcher = None
+        if self.on_change:
+            self.on_change()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        """The automaton for the current keywords, rebuilt after changes."""
+        with self._lock:
+            if self._matcher is None:
+                self._matcher = KeywordMatcher(self._entries)
+                self.builds += 1
+            return self._matcher
+
+    def lookup(self, text: str) -> list[tuple[str, str]]:
+        """Return ``(keyword, value)`` for every keyword in ``text``, best first."""
+        entries = self._entries
+        return [(k, value) for k in self.matcher.match(text) if (value := entries.get(k)) is not None]
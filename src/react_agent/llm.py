@@ -0,0 +1,196 @@
+"""Shared LLM client and tool-binding management for the ReAct agent."""
+
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+
+DEFAULT_MODEL = "gemini-2.5-flash"
+DEFAULT_TEMPERATURE = 0.0
+DEFAULT_BACKEND = "gemini"
+
+
+@dataclass(frozen=True)
+class LLMConfig:
+    """Configuration that identifies a distinct LLM client.
+
+    Attributes:
+        model: Model name.
+        temperature: Sampling temperature.
+        api_key_fingerprint: Short hash of the API key, so a rotated key
+            yields a new client without keeping the secret in the key.
+        backend: Name of the registered model backend.
+        options: Backend-specific settings (``FAKE_LLM_*`` for the fake backend).
+    """
+
+    model: str = DEFAULT_MODEL
+    temperature: float = DEFAULT_TEMPERATURE
+    api_key_fingerprint: str = ""
+    backend: str = DEFAULT_BACKEND
+    options: tuple = ()
+
+    @classmethod
+    def from_env(cls) -> "LLMConfig":
+        """Build the configuration from environment variables."""
+        backend = os.getenv("REACT_AGENT_BACKEND", DEFAULT_BACKEND)
+        if backend == "fake":
+            options = tuple(sorted((k, v) for k, v in os.environ.items() if k.startswith("FAKE_LLM_")))
+            return cls(model="fake", temperature=0.0, backend=backend, options=options)
+
+        api_key = os.getenv("GOOGLE_API_KEY", "")
+        return cls(
+            model=os.getenv("GEMINI_MODEL", DEFAULT_MODEL),
+            temperature=float(os.getenv("GEMINI_TEMPERATURE", DEFAULT_TEMPERATURE)),
+            api_key_fingerprint=hashlib.sha256(api_key.encode()).hexdigest()[:12] if api_key else "",
+            backend=backend,
+        )
+
+
+def create_gemini_llm(config: LLMConfig) -> BaseChatModel:
+    """Create a Gemini chat model."""
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if not api_key:
+        raise ValueError("GOOGLE_API_KEY environment variable is not set")
+
+    # Imported on first use: the Google client is the slowest import in the package
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=config.model,
+        google_api_key=api_key,
+        temperature=config.temperature,
+    )
+
+
+def create_fake_llm(config: LLMConfig) -> BaseChatModel:
+    """Create the offline fake chat model configured by ``FAKE_LLM_*`` variables."""
+    from react_agent.fake_llm import FakeChatModel
+
+    return FakeChatModel.from_env()
+
+
+# Registered model backends, selectable with REACT_AGENT_BACKEND or --backend
+BACKENDS: dict[str, Callable[[LLMConfig], BaseChatModel]] = {
+    "gemini": create_gemini_llm,
+    "fake": create_fake_llm,
+}
+
+
+def register_backend(name: str, factory: Callable[[LLMConfig], BaseChatModel]) -> None:
+    """Register a model backend under ``name``."""
+    BACKENDS[name] = factory
+
+
+def create_llm(config: LLMConfig | None = None) -> BaseChatModel:
+    """Create and configure the LLM instance for the configured backend."""
+    config = config or LLMConfig.from_env()
+    factory = BACKENDS.get(config.backend)
+    if factory is None:
+        raise ValueError(f"Unknown model backend: {config.backend} (available: {', '.join(BACKENDS)})")
+    return factory(config)
+
+
+def _tools_key(tools: Sequence[BaseTool]) -> tuple:
+    return tuple((t.name, id(t)) for t in tools)
+
+
+class LLMClientManager:
+    """Process-wide cache of LLM clients and their tool bindings.
+
+    A client is built once per configuration and each distinct tool set is
+    bound to it once. Lookups are thread-safe, and whenever the active
+    configuration changes (backend, model, temperature, API key or backend
+    options) every
+    cached client and binding is dropped and rebuilt on demand.
+    """
+
+    def __init__(self, factory: Callable[[LLMConfig], BaseChatModel] = create_llm):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._config: LLMConfig | None = None
+        self._llm: BaseChatModel | None = None
+        self._bindings: dict[tuple, Runnable] = {}
+        self._stats = {
+            "client_builds": 0,
+            "binding_builds": 0,
+            "hits": 0,
+            "invalidations": 0,
+            "build_seconds": 0.0,
+        }
+
+    def set_factory(self, factory: Callable[[LLMConfig], BaseChatModel]) -> None:
+        """Replace the client factory and drop everything built by the old one."""
+        with self._lock:
+            self._factory = factory
+            self._clear()
+
+    def invalidate(self) -> None:
+        """Drop the cached client and all tool bindings."""
+        with self._lock:
+            self._clear()
+
+    def get_llm(self, config: LLMConfig | None = None) -> BaseChatModel:
+        """Return the shared client for the given (or environment) configuration."""
+        config = config or LLMConfig.from_env()
+        with self._lock:
+            return self._get_llm_locked(config)
+
+    def get_bound(self, tools: Sequence[BaseTool], config: LLMConfig | None = None) -> Runnable:
+        """Return the shared client with ``tools`` bound to it.
+
+        Args:
+            tools: Tools to expose to the model.
+            config: Client configuration; read from the environment if omitted.
+
+        Returns:
+            The cached tool-bound runnable for this configuration and tool set.
+        """
+        config = config or LLMConfig.from_env()
+        key = _tools_key(tools)
+        with self._lock:
+            if config == self._config and key in self._bindings:
+                self._stats["hits"] += 1
+                return self._bindings[key]
+
+            llm = self._get_llm_locked(config)
+            start = time.perf_counter()
+            bound = llm.bind_tools(list(tools))
+            self._stats["build_seconds"] += time.perf_counter() - start
+            self._stats["binding_builds"] += 1
+            self._bindings[key] = bound
+            return bound
+
+    def stats(self) -> dict:
+        """Return build/hit counters and cumulative build time."""
+        with self._lock:
+            return {**self._stats, "model": self._config.model if self._config else None}
+
+    def _get_llm_locked(self, config: LLMConfig) -> BaseChatModel:
+        if config != self._config:
+            if self._config is not None:
+                self._stats["invalidations"] += 1
+            self._clear()
+
+        if self._llm is None:
+            start = time.perf_counter()
+            self._llm = self._factory(config)
+            self._stats["build_seconds"] += time.perf_counter() - start
+            self._stats["client_builds"] += 1
+            self._config = config
+
+        return self._llm
+
+    def _clear(self) -> None:
+        self._config = None
+        self._llm = None
+        self._bindings.clear()
+
+
+# Process-wide manager used by the graph nodes
+llm_manager = LLMClientManager()
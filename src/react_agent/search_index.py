@@ -0,0 +1,314 @@
+"""Local BM25 search index backing the ``search_web`` tool.
+
+An index is built once from a corpus directory and written as a set of NumPy
+arrays that are memory-mapped when opened, so startup cost does not grow
+with the corpus. Terms are looked up by a 64-bit hash in a sorted table,
+and postings store precomputed BM25 term weights, so a query is a few
+array slices, one weighted accumulation and a partial sort.
+
+Corpus layout: every ``*.txt`` / ``*.md`` file is one document (the file
+name is its title) and every line of a ``*.jsonl`` file is a document with
+``text`` and optional ``title`` fields.
+"""
+
+import bisect
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from react_agent.tool_cache import clear_tool_cache
+
+INDEX_VERSION = 1
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+SNIPPET_CHARS = 160
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_token(token: str) -> str:
+    """Normalize one token for indexing and querying."""
+    return unicodedata.normalize("NFKC", token).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    """Split ``text`` into normalized word tokens."""
+    return [normalize_token(t) for t in _TOKEN_RE.findall(text)]
+
+
+def term_hash(term: str) -> int:
+    """Stable 64-bit hash of a normalized term (``hash()`` is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(term.encode(), digest_size=8).digest(), "little")
+
+
+def iter_corpus(path: str | Path) -> Iterator[tuple[str, str]]:
+    """Yield ``(title, text)`` for every document under ``path`` in a stable order."""
+    root = Path(path)
+    files = [root] if root.is_file() else sorted(p for p in root.rglob("*") if p.is_file())
+    for file in files:
+        if file.suffix == ".jsonl":
+            with open(file, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        yield record.get("title", file.stem), record["text"]
+        elif file.suffix in (".txt", ".md"):
+            yield file.stem, file.read_text(encoding="utf-8")
+
+
+def _snippet(text: str, terms: set[str], width: int = SNIPPET_CHARS, anchor: int = 0) -> str:
+    """Return the ``width``-character window of ``text`` with the most query terms.
+
+    Without any query term in ``text`` the window opens at ``anchor``.
+    """
+    positions = [m.start() for m in _TOKEN_RE.finditer(text) if normalize_token(m.group()) in terms]
+    best, best_count = anchor, 0
+    for i, start in enumerate(positions):
+        count = bisect.bisect_left(positions, start + width, lo=i) - i
+        if count > best_count:
+            best, best_count = start, count
+    # Open a little before the best match and cut on word boundaries
+    start = max(best - width // 8, 0)
+    if start > 0:
+        start = max(text.rfind(" ", 0, start), -1) + 1
+    end = start + width
+    if end < len(text) and text.rfind(" ", start, end) > start:
+        end = text.rfind(" ", start, end)
+    snippet = " ".join(text[start:end].split())
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One ranked search result."""
+
+    doc_id: int
+    title: str
+    score: float
+    snippet: str
+
+
+class _BlobWriter:
+    """Append UTF-8 strings to a file and record their byte offsets."""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "wb")
+        self.offsets = array("q", [0])
+
+    def add(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self._file.write(data)
+        self.offsets.append(self.offsets[-1] + len(data))
+
+    def close(self) -> np.ndarray:
+        self._file.close()
+        return np.frombuffer(self.offsets, dtype=np.int64)
+
+
+class SearchIndex:
+    """Read-only BM25 index over memory-mapped arrays.
+
+    Use :meth:`build` to create an index directory and :meth:`open` to load
+    one. Instances are safe to share between threads.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.meta = json.loads((self.path / "meta.json").read_text())
+        if self.meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version in {self.path}")
+
+        def load(name: str) -> np.ndarray:
+            return np.load(self.path / f"{name}.npy", mmap_mode="r")
+
+        self.term_hashes = load("term_hashes")
+        self.term_starts = load("term_starts")
+        self.term_ends = load("term_ends")
+        self.term_idf = load("term_idf")
+        self.postings_docs = load("postings_docs")
+        self.postings_weights = load("postings_weights")
+        self.doc_offsets = load("doc_offsets")
+        self.title_offsets = load("title_offsets")
+        self._docs = np.memmap(self.path / "docs.bin", dtype=np.uint8, mode="r") if self.doc_offsets[-1] else None
+        self._titles = np.memmap(self.path / "titles.bin", dtype=np.uint8, mode="r") if self.title_offsets[-1] else None
+
+    @classmethod
+    def open(cls, path: str | Path) -> "SearchIndex":
+        """Memory-map an index written by :meth:`build`."""
+        return cls(path)
+
+    @property
+    def num_docs(self) -> int:
+        return self.meta["num_docs"]
+
+    @classmethod
+    def build(
+        cls,
+        corpus: str | Path,
+        path: str | Path,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B,
+    ) -> "SearchIndex":
+        """Index every document under ``corpus`` and write the index to ``path``.
+
+        Args:
+            corpus: Corpus directory or a single ``.jsonl`` file.
+            path: Output directory; existing index files are overwritten.
+            k1: BM25 term-frequency saturation.
+            b: BM25 length normalization.
+        """
+        started = time.perf_counter()
+        out = Path(path)
+        out.mkdir(parents=True, exist_ok=True)
+        (out / "meta.json").unlink(missing_ok=True)
+
+        vocab: dict[str, int] = {}
+        term_ids, doc_ids, tfs, lengths = array("i"), array("i"), array("i"), array("i")
+        docs, titles = _BlobWriter(out / "docs.bin"), _BlobWriter(out / "titles.bin")
+        for doc_id, (title, text) in enumerate(iter_corpus(corpus)):
+            counts = Counter(tokenize(f"{title}\n{text}"))
+            lengths.append(sum(counts.values()))
+            for term, tf in counts.items():
+                term_ids.append(vocab.setdefault(term, len(vocab)))
+                doc_ids.append(doc_id)
+                tfs.append(tf)
+            docs.add(text)
+            titles.add(title)
+
+        num_docs = len(lengths)
+        doc_len = np.frombuffer(lengths, dtype=np.int32).astype(np.float32)
+        avgdl = float(doc_len.mean()) if num_docs else 0.0
+        term_ids_np = np.frombuffer(term_ids, dtype=np.int32)
+        doc_ids_np = np.frombuffer(doc_ids, dtype=np.int32)
+        tf_np = np.frombuffer(tfs, dtype=np.int32).astype(np.float32)
+
+        # Group postings by term; documents stay in ascending order within a term
+        order = np.argsort(term_ids_np, kind="stable")
+        df = np.bincount(term_ids_np, minlength=len(vocab))
+        ends = np.cumsum(df)
+        norm = k1 * (1 - b + b * doc_len / avgdl) if num_docs else doc_len
+        weights = tf_np * (k1 + 1) / (tf_np + norm[doc_ids_np])
+        idf = np.log1p((num_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        hashes = np.fromiter((term_hash(t) for t in vocab), dtype=np.uint64, count=len(vocab))
+        by_hash = np.argsort(hashes)
+        if len(hashes) and np.any(np.diff(hashes[by_hash]) == 0):
+            raise ValueError("64-bit term hash collision in the vocabulary")
+
+        arrays = {
+            "term_hashes": hashes[by_hash],
+            "term_starts": (ends - df)[by_hash].astype(np.int64),
+            "term_ends": ends[by_hash].astype(np.int64),
+            "term_idf": idf[by_hash],
+            "postings_docs": doc_ids_np[order],
+            "postings_weights": weights[order].astype(np.float32),
+            "doc_offsets": docs.close(),
+            "title_offsets": titles.close(),
+        }
+        for name, values in arrays.items():
+            np.save(out / f"{name}.npy", values)
+        meta = {
+            "version": INDEX_VERSION,
+            "num_docs": num_docs,
+            "num_terms": len(vocab),
+            "num_postings": len(doc_ids),
+            "avgdl": avgdl,
+            "k1": k1,
+            "b": b,
+            "build_seconds": time.perf_counter() - started,
+        }
+        # meta.json is written last so a partially built index never opens
+        (out / "meta.json").write_text(json.dumps(meta, indent=2))
+        return cls(out)
+
+    def _text(self, blob: np.ndarray | None, offsets: np.ndarray, i: int) -> str:
+        if blob is None:
+            return ""
+        return bytes(blob[offsets[i] : offsets[i + 1]]).decode("utf-8")
+
+    def document(self, doc_id: int) -> tuple[str, str]:
+        """Return ``(title, text)`` of a document."""
+        return self._text(self._titles, self.title_offsets, doc_id), self._text(self._docs, self.doc_offsets, doc_id)
+
+    def scores(self, query: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return the ids and BM25 scores of every document matching ``query``."""
+        docs, weights = [], []
+        for term in set(tokenize(query)):
+            h = np.uint64(term_hash(term))
+            i = int(np.searchsorted(self.term_hashes, h))
+            if i < len(self.term_hashes) and self.term_hashes[i] == h:
+                start, end = self.term_starts[i], self.term_ends[i]
+                docs.append(self.postings_docs[start:end])
+                weights.append(self.postings_weights[start:end] * self.term_idf[i])
+        if not docs:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        if len(docs) == 1:
+            return np.asarray(docs[0]), weights[0]
+
+        all_docs, all_weights = np.concatenate(docs), np.concatenate(weights)
+        if len(all_docs) * 16 > self.num_docs:
+            # Dense accumulation is cheaper once postings cover a sizable share of the corpus
+            totals = np.bincount(all_docs, weights=all_weights, minlength=self.num_docs)
+            ids = np.flatnonzero(totals)
+            return ids, totals[ids].astype(np.float32)
+        ids, inverse = np.unique(all_docs, return_inverse=True)
+        return ids, np.bincount(inverse, weights=all_weights).astype(np.float32)
+
+    def top(self, query: str, k: int) -> list[tuple[int, float]]:
+        """Return ``(doc_id, score)`` of the ``k`` best BM25 matches, best first."""
+        ids, scores = self.scores(query)
+        if len(ids) == 0 or k <= 0:
+            return []
+        if len(ids) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[top], scores[top]
+        return sorted(zip(ids.tolist(), scores.tolist()), key=lambda item: (-item[1], item[0]))
+
+    def hit(self, doc_id: int, score: float, query: str, snippet: bool = True, anchor: int = 0) -> SearchHit:
+        """Build a :class:`SearchHit` for a document, with a snippet for ``query``.
+
+        ``anchor`` is the character offset the snippet falls back to when the
+        document contains none of the query terms.
+        """
+        title, text = self.document(doc_id)
+        return SearchHit(doc_id, title, score, _snippet(text, set(tokenize(query)), anchor=anchor) if snippet else "")
+
+    def search(self, query: str, k: int = 5, snippets: bool = True) -> list[SearchHit]:
+        """Return the top ``k`` documents for ``query`` by BM25 score."""
+        return [self.hit(doc_id, score, query, snippets) for doc_id, score in self.top(query, k)]
+
+    def stats(self) -> dict:
+        """Return corpus and index sizes."""
+        size = sum(p.stat().st_size for p in self.path.iterdir() if p.is_file())
+        return {
+            "docs": self.num_docs,
+            "terms": self.meta["num_terms"],
+            "postings": self.meta["num_postings"],
+            "index_bytes": size,
+        }
+
+
+# Process-wide index; None keeps search_web on its built-in table
+_search_index: SearchIndex | None = None
+
+
+def configure_search_index(path: str | Path) -> SearchIndex:
+    """Open the index at ``path`` for ``search_web`` and drop stale cached results."""
+    global _search_index
+    _search_index = SearchIndex.open(path)
+    clear_tool_cache("search_web")
+    return _search_index
+
+
+def get_search_index() -> SearchIndex | None:
+    """Return the process-wide search index, or None when none is configured."""
+    return _search_index
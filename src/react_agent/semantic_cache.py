@@ -0,0 +1,242 @@
+"""Semantic near-duplicate cache for final answers, backed by a NumPy index."""
+
+import json
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+from langchain_core.messages import AIMessage, BaseMessage, message_to_dict, messages_from_dict
+
+from react_agent.cache import hash_messages
+
+# Spelled-out operators and filler phrases that do not change the meaning of a query
+DEFAULT_SYNONYMS = {
+    "곱하기": "*",
+    "더하기": "+",
+    "빼기": "-",
+    "나누기": "/",
+    "times": "*",
+    "plus": "+",
+    "minus": "-",
+    "divided by": "/",
+}
+DEFAULT_STOPWORDS = frozenset(
+    {
+        "계산해줘", "계산해", "알려줘", "해줘", "좀", "에", "대해", "대해서", "관해", "는", "은", "를", "을",
+        "please", "what", "is", "the", "a", "an", "of", "about", "for", "me", "calculate", "tell",
+    }
+)
+
+_TOKEN_RE = re.compile(r"\d+(?:\.\d+)?|[^\W\d_]+|[^\s\w]", re.UNICODE)
+_LATIN_RE = re.compile(r"[a-z]+")
+OPERATORS = frozenset("+-*/%^()")
+
+
+class HashingEmbedder:
+    """Local text embedder based on the hashing trick (no model download).
+
+    Text is NFKC-normalized, lower-cased and rewritten with a synonym table;
+    word tokens and character n-grams of the compacted text are hashed into a
+    fixed number of signed buckets and the vector is L2-normalized, so cosine
+    similarity is a plain dot product.
+    """
+
+    def __init__(
+        self,
+        dim: int = 1024,
+        ngram: int = 3,
+        synonyms: dict[str, str] | None = None,
+        stopwords: frozenset[str] | None = None,
+    ):
+        self.dim = dim
+        self.ngram = ngram
+        self.synonyms = DEFAULT_SYNONYMS if synonyms is None else synonyms
+        self.stopwords = DEFAULT_STOPWORDS if stopwords is None else stopwords
+
+    def normalize(self, text: str) -> list[str]:
+        """Return the normalized token list for ``text``."""
+        text = unicodedata.normalize("NFKC", text).lower()
+        for phrase, replacement in self.synonyms.items():
+            text = text.replace(phrase, f" {replacement} ")
+        return [tok for tok in _TOKEN_RE.findall(text) if tok not in self.stopwords]
+
+    def key_terms(self, text: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return the terms a paraphrase of ``text`` must share exactly.
+
+        These are the numbers and operators in order (``12 * 3 + 4`` and
+        ``12 + 3 * 4`` differ) and the set of Latin-script words, which are
+        mostly names and technical terms (``Gemini API pricing`` and
+        ``Gemini API limits`` differ) that the n-gram embedding cannot weigh
+        above the shared context.
+        """
+        tokens = self.normalize(text)
+        arithmetic = tuple(tok for tok in tokens if tok[0].isdigit() or tok in OPERATORS)
+        words = {word for tok in tokens for word in _LATIN_RE.findall(tok) if word not in self.stopwords}
+        return arithmetic, tuple(sorted(words))
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a single text into a unit-length float32 vector."""
+        tokens = self.normalize(text)
+        compact = "".join(tokens)
+        features = [f"w:{tok}" for tok in tokens]
+        features += [f"c:{compact[i:i + self.ngram]}" for i in range(max(len(compact) - self.ngram + 1, 0))]
+
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for feature in features:
+            h = zlib.crc32(feature.encode())
+            vec[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+
+class SemanticCache:
+    """Final-answer cache matched by embedding similarity of the last human turn.
+
+    An entry is reused only when the conversation before that turn hashes to
+    the same value, the turn has the same key terms (numbers and operators in
+    order, Latin-script words; see :meth:`HashingEmbedder.key_terms`), and
+    the cosine similarity of the turn reaches ``threshold``. Vectors live in a
+    preallocated float32 matrix; when it is full the least recently used slot
+    is overwritten.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        max_entries: int = 4096,
+        embedder: HashingEmbedder | None = None,
+        path: str | Path | None = None,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.embedder = embedder or HashingEmbedder()
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._vectors = np.zeros((max_entries, self.embedder.dim), dtype=np.float32)
+        self._slot_buckets: list[str] = []
+        self._answers: list[str] = []
+        self._buckets: dict[str, set[int]] = {}
+        self._last_used = np.zeros(max_entries, dtype=np.float64)
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self._slot_buckets)
+
+    def lookup(self, prefix: Sequence[BaseMessage], query: str, model: str = "") -> AIMessage | None:
+        """Return a cached final answer for a near-duplicate ``query``.
+
+        Args:
+            prefix: Conversation preceding the human turn.
+            query: Text of the last human turn.
+            model: Model id; answers are never shared across models.
+
+        Returns:
+            The cached answer, or None when no neighbour passes the threshold.
+        """
+        bucket = self._bucket(prefix, query, model)
+        vec = self.embedder.embed(query)
+        with self._lock:
+            slots = self._buckets.get(bucket)
+            if slots:
+                candidates = np.fromiter(slots, dtype=np.intp, count=len(slots))
+                scores = self._vectors[candidates] @ vec
+                i = int(np.argmax(scores))
+                if scores[i] >= self.threshold:
+                    best = candidates[i]
+                    self._last_used[best] = time.monotonic()
+                    self._stats["hits"] += 1
+                    data = json.loads(self._answers[best])
+                    return messages_from_dict([data])[0]
+            self._stats["misses"] += 1
+            return None
+
+    def add(self, prefix: Sequence[BaseMessage], query: str, answer: AIMessage, model: str = "") -> None:
+        """Cache ``answer`` as the final reply to ``query`` after ``prefix``."""
+        data = message_to_dict(answer)
+        data["data"]["id"] = None
+        self._insert(self._bucket(prefix, query, model), self.embedder.embed(query), json.dumps(data, ensure_ascii=False))
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Persist the index and answers to an ``.npz`` file."""
+        path = Path(path or self.path)
+        with self._lock:
+            n = len(self._slot_buckets)
+            meta = json.dumps({"buckets": self._slot_buckets, "answers": self._answers}, ensure_ascii=False)
+            with path.open("wb") as f:
+                np.savez(f, vectors=self._vectors[:n], last_used=self._last_used[:n], meta=np.array(meta))
+
+    def load(self, path: str | Path) -> None:
+        """Load entries previously written by :meth:`save`."""
+        with np.load(path) as data:
+            vectors, last_used = data["vectors"], data["last_used"]
+            meta = json.loads(str(data["meta"]))
+        if vectors.shape[1] != self.embedder.dim:
+            raise ValueError(f"Index dimension {vectors.shape[1]} does not match embedder dimension {self.embedder.dim}")
+        # Keep the most recently used entries if the file holds more than fit
+        order = np.argsort(last_used)[-self.max_entries:]
+        with self._lock:
+            n = len(order)
+            self._vectors[:n] = vectors[order]
+            # Shift saved timestamps below this process's clock, keeping their order
+            self._last_used[:n] = last_used[order] - (last_used.max() if n else 0.0) - 1.0
+            self._slot_buckets = [meta["buckets"][i] for i in order]
+            self._answers = [meta["answers"][i] for i in order]
+            self._buckets = {}
+            for slot, bucket in enumerate(self._slot_buckets):
+                self._buckets.setdefault(bucket, set()).add(slot)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and index size."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._slot_buckets),
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+    def _bucket(self, prefix: Sequence[BaseMessage], query: str, model: str) -> str:
+        # Paraphrases may differ in wording but never in their arithmetic or named terms
+        arithmetic, words = self.embedder.key_terms(query)
+        return f"{hash_messages(prefix, model)}|{' '.join(arithmetic)}|{' '.join(words)}"
+
+    def _insert(self, bucket: str, vec: np.ndarray, answer: str) -> None:
+        with self._lock:
+            n = len(self._slot_buckets)
+            if n < self.max_entries:
+                slot = n
+                self._slot_buckets.append(bucket)
+                self._answers.append(answer)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._buckets[self._slot_buckets[slot]].discard(slot)
+                self._slot_buckets[slot] = bucket
+                self._answers[slot] = answer
+                self._stats["evictions"] += 1
+            self._buckets.setdefault(bucket, set()).add(slot)
+            self._vectors[slot] = vec
+            self._last_used[slot] = time.monotonic()
+            self._stats["stores"] += 1
+
+
+_semantic_cache: SemanticCache | None = None
+
+
+def configure_semantic_cache(**kwargs) -> SemanticCache:
+    """Enable the process-wide semantic cache; kwargs go to :class:`SemanticCache`."""
+    global _semantic_cache
+    _semantic_cache = SemanticCache(**kwargs)
+    return _semantic_cache
+
+
+def get_semantic_cache() -> SemanticCache | None:
+    """Return the process-wide semantic cache, or None when it is disabled."""
+    return _semantic_cache
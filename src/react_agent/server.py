@@ -0,0 +1,529 @@
+"""Asyncio HTTP/1.1 server exposing the agent graph.
+
+Endpoints (JSON bodies):
+
+* ``POST /chat`` with ``{"query": ..., "thread_id": ...}`` returns the answer,
+  tool calls, token usage and latency of one turn.
+* ``POST /chat/stream`` takes the same body and answers with Server-Sent
+  Events: ``token``, ``tool_call``, ``tool_result`` and ``summary`` events
+  while the turn runs, then ``done`` (same fields as ``/chat``) or ``error``.
+* ``GET /threads/<thread_id>`` returns the stored messages of a session.
+* ``GET /health`` returns server counters.
+
+A request without ``thread_id`` starts a new session; the id is returned in
+the body and the ``X-Thread-Id`` header. Turns of one session run one at a
+time, different sessions run concurrently. Connections are persistent
+(HTTP/1.1 keep-alive), and streamed bodies use chunked encoding so the
+connection can be reused afterwards.
+
+With ``coalesce_graph`` set (``main.py --serve --coalesce``), identical
+turns that are in flight at the same time (same query on the same
+conversation history, e.g. many new sessions asking one question during a
+spike) run the graph once and share the result and stream events; each
+session still gets the turn written to its own thread.
+
+Only the standard library is used. The server is meant for local serving
+behind a proxy: there is no TLS and no authentication.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from http import HTTPStatus
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage, messages_to_dict
+
+from react_agent.batch import summarize_messages
+from react_agent.singleflight import SingleFlight
+
+MAX_HEADERS = 100
+MAX_THREAD_ID = 128
+# How often a running request checks whether its client has hung up
+DISCONNECT_POLL = 0.1
+
+
+class HTTPError(Exception):
+    """An error answered with ``status`` and a JSON ``{"error": ...}`` body."""
+
+    def __init__(self, status: int, message: str | None = None):
+        super().__init__(message or HTTPStatus(status).phrase)
+        self.status = status
+
+
+@dataclass
+class Request:
+    """A parsed HTTP request."""
+
+    method: str
+    path: str
+    version: str
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self) -> dict:
+        """Return the body as a JSON object.
+
+        Raises:
+            HTTPError: 400 if the body is not a JSON object.
+        """
+        try:
+            data = json.loads(self.body or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise HTTPError(400, f"invalid JSON body: {e}") from e
+        if not isinstance(data, dict):
+            raise HTTPError(400, "body must be a JSON object")
+        return data
+
+
+async def read_request(reader: asyncio.StreamReader, max_body: int) -> Request | None:
+    """Read one request from ``reader``; None if the peer closed the connection.
+
+    Raises:
+        HTTPError: If the request is malformed or too large.
+    """
+    try:
+        line = await reader.readline()
+        if not line:
+            return None
+        parts = line.decode("latin-1").rstrip("\r\n").split(" ")
+        if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+            raise HTTPError(400, "malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if len(headers) >= MAX_HEADERS:
+                raise HTTPError(431)
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+    except ValueError as e:
+        # StreamReader line limit exceeded
+        raise HTTPError(431) from e
+
+    if "transfer-encoding" in headers:
+        raise HTTPError(411, "chunked request bodies are not supported; send Content-Length")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError as e:
+        raise HTTPError(400, "invalid Content-Length") from e
+    if length < 0 or length > max_body:
+        raise HTTPError(413)
+    body = await reader.readexactly(length) if length else b""
+    method, target, version = parts
+    return Request(method.upper(), target.partition("?")[0], version, headers, body)
+
+
+def _chunk_text(chunk: AIMessageChunk) -> str:
+    if isinstance(chunk.content, str):
+        return chunk.content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in chunk.content
+        if not isinstance(block, dict) or block.get("type", "text") == "text"
+    )
+
+
+async def agent_events(agent, inputs: dict, config: dict, tokens: bool = True) -> AsyncIterator[tuple[str, dict]]:
+    """Run one turn and yield ``(event, data)`` pairs, ending with ``_turn`` and ``done``.
+
+    ``_turn`` is internal: its data is the turn's state update (the new
+    messages plus any other channels the nodes wrote, e.g. the summary).
+
+    Args:
+        agent: Graph compiled with ``async_mode=True``.
+        inputs: Graph input, normally just the new human message.
+        config: Run config carrying the session's ``thread_id``.
+        tokens: Also yield a ``token`` event per streamed model chunk.
+    """
+    modes = ["updates", "messages"] if tokens else ["updates"]
+    new_messages, updates = [], {}
+    async with contextlib.aclosing(agent.astream(inputs, config, stream_mode=modes)) as stream:
+        async for mode, payload in stream:
+            if mode == "messages":
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") == "agent" and isinstance(chunk, AIMessageChunk):
+                    text = _chunk_text(chunk)
+                    if text:
+                        yield "token", {"text": text}
+                continue
+            for node_name, output in payload.items():
+                if node_name == "summarize" and output:
+                    yield "summary", {}
+                updates.update({k: v for k, v in (output or {}).items() if k != "messages"})
+                for msg in (output or {}).get("messages", []):
+                    new_messages.append(msg)
+                    if isinstance(msg, AIMessage):
+                        for tc in msg.tool_calls:
+                            yield "tool_call", {"id": tc["id"], "name": tc["name"], "args": tc["args"]}
+                    elif isinstance(msg, ToolMessage):
+                        yield "tool_result", {
+                            "tool_call_id": msg.tool_call_id,
+                            "name": msg.name,
+                            "content": str(msg.content),
+                        }
+    yield "_turn", {**updates, "messages": new_messages}
+    yield "done", summarize_messages(new_messages)
+
+
+def history_digest(values: dict) -> str:
+    """Hash a conversation's content, ignoring message and tool call ids.
+
+    Two sessions with the same digest send the model the same input.
+    """
+    digest = hashlib.sha256()
+    for msg in values.get("messages", []):
+        calls = [(tc["name"], tc["args"]) for tc in getattr(msg, "tool_calls", None) or []]
+        digest.update(json.dumps([msg.type, msg.content, calls], ensure_ascii=False, default=str).encode("utf-8"))
+    digest.update(json.dumps([values.get("summary"), values.get("summarized_through")]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _sse(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n".encode("utf-8")
+
+
+class AgentServer:
+    """Serves an async agent graph over HTTP.
+
+    Args:
+        agent: Graph compiled with ``async_mode=True`` and a checkpointer.
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free port (see ``port`` after ``start``).
+        request_timeout: Seconds a turn may take, waiting for its session
+            included; slower requests get 504 (or an ``error`` event).
+        idle_timeout: Seconds a connection may wait for (or send) the next
+            request before it is closed.
+        drain_timeout: Seconds ``shutdown`` waits for in-flight requests.
+        max_body: Largest accepted request body in bytes.
+        coalesce_graph: The same graph compiled without a checkpointer. If
+            given, identical in-flight turns share one run of it.
+    """
+
+    def __init__(
+        self,
+        agent,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        request_timeout: float = 60.0,
+        idle_timeout: float = 15.0,
+        drain_timeout: float = 30.0,
+        max_body: int = 1 << 20,
+        coalesce_graph=None,
+    ):
+        self.agent = agent
+        self.host = host
+        self.port = port
+        self.request_timeout = request_timeout
+        self.idle_timeout = idle_timeout
+        self.drain_timeout = drain_timeout
+        self.max_body = max_body
+        self.coalesce_graph = coalesce_graph
+        self._flights = SingleFlight()
+        self._server: asyncio.Server | None = None
+        # Connection task -> whether it is handling a request right now
+        self._connections: dict[asyncio.Task, bool] = {}
+        # thread_id -> [lock, users]; a session's turns must not interleave
+        self._sessions: dict[str, list] = {}
+        self._draining = False
+        self._stats = {"requests": 0, "errors": 0, "timeouts": 0, "in_flight": 0, "connections": 0}
+
+    async def start(self) -> None:
+        """Bind and start accepting connections."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def shutdown(self) -> dict:
+        """Stop accepting, let in-flight requests finish, then close everything.
+
+        Idle keep-alive connections are closed at once. Requests still running
+        after ``drain_timeout`` are cancelled. Returns the final stats.
+        """
+        self._draining = True
+        if self._server is not None:
+            self._server.close()
+        for task, busy in list(self._connections.items()):
+            if not busy:
+                task.cancel()
+        busy = [task for task in self._connections if not task.done()]
+        if busy:
+            _, still_running = await asyncio.wait(busy, timeout=self.drain_timeout)
+            for task in still_running:
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        return self.stats()
+
+    def stats(self) -> dict:
+        stats = {**self._stats, "open_connections": len(self._connections), "sessions": len(self._sessions)}
+        if self.coalesce_graph is not None:
+            stats["coalesce"] = self._flights.stats()
+        return stats
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections[task] = False
+        self._stats["connections"] += 1
+        try:
+            while not self._draining:
+                try:
+                    request = await asyncio.wait_for(read_request(reader, self.max_body), self.idle_timeout)
+                except HTTPError as e:
+                    self._stats["errors"] += 1
+                    await self._send_json(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    break
+                except (TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                self._connections[task] = True
+                try:
+                    keep_alive = await self._dispatch(request, reader, writer)
+                finally:
+                    self._connections[task] = False
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            # Cancelled by shutdown; this task is owned by the server and nothing awaits its result
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def _dispatch(self, request: Request, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request and return whether the connection stays open."""
+        self._stats["requests"] += 1
+        routes = {
+            "/chat": ("POST", self._chat),
+            "/chat/stream": ("POST", self._chat_stream),
+            "/health": ("GET", self._health),
+        }
+        path = request.path
+        try:
+            if path.startswith("/threads/"):
+                method, handler = "GET", self._thread
+            elif path in routes:
+                method, handler = routes[path]
+            else:
+                raise HTTPError(404)
+            if request.method != method:
+                raise HTTPError(405)
+            return await self._unless_disconnected(reader, handler(request, writer))
+        except ConnectionError:
+            raise
+        except Exception as e:
+            if not isinstance(e, HTTPError):
+                e = HTTPError(500, f"{type(e).__name__}: {e}")
+            self._stats["errors"] += 1
+            return await self._send_json(writer, e.status, {"error": str(e)}, request.keep_alive)
+
+    async def _unless_disconnected(self, reader: asyncio.StreamReader, handler) -> bool:
+        """Await ``handler``, cancelling it if the client closes the connection first.
+
+        Raises:
+            ConnectionResetError: If the client disconnected.
+        """
+        task = asyncio.ensure_future(handler)
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=DISCONNECT_POLL)
+                if reader.at_eof() and not task.done():
+                    task.cancel()
+                    await asyncio.wait({task})
+                    raise ConnectionResetError("client disconnected")
+            return task.result()
+        finally:
+            # Cancelled ourselves (e.g. by shutdown): take the request down with us
+            if not task.done():
+                task.cancel()
+                await asyncio.wait({task})
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        headers: dict[str, str],
+        body: bytes | None,
+        keep_alive: bool,
+    ) -> bool:
+        keep_alive = keep_alive and not self._draining
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+        return keep_alive
+
+    async def _send_json(
+        self, writer: asyncio.StreamWriter, status: int, data: dict, keep_alive: bool, headers: dict | None = None
+    ) -> bool:
+        body = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        headers = {"Content-Type": "application/json; charset=utf-8", **(headers or {})}
+        return await self._send(writer, status, headers, body, keep_alive)
+
+    def _turn(self, request: Request) -> tuple[str, str]:
+        data = request.json()
+        query, thread_id = data.get("query"), data.get("thread_id")
+        if not isinstance(query, str) or not query.strip():
+            raise HTTPError(400, "'query' must be a non-empty string")
+        if thread_id is None:
+            thread_id = uuid.uuid4().hex
+        elif not isinstance(thread_id, str) or not thread_id or len(thread_id) > MAX_THREAD_ID:
+            raise HTTPError(400, f"'thread_id' must be a string of 1-{MAX_THREAD_ID} characters")
+        return query, thread_id
+
+    @contextlib.asynccontextmanager
+    async def _session(self, thread_id: str):
+        """Hold ``thread_id``'s lock while a turn runs.
+
+        A turn that fails, times out or loses its client is rolled back, so
+        the session never keeps half a turn (e.g. a tool call without its
+        result) that would break the next one.
+        """
+        entry = self._sessions.setdefault(thread_id, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                self._stats["in_flight"] += 1
+                config = {"configurable": {"thread_id": thread_id}}
+                checkpointer = self.agent.checkpointer
+                before = await checkpointer.aget_tuple(config) if checkpointer else None
+                try:
+                    yield
+                except BaseException:
+                    if checkpointer:
+                        await asyncio.shield(self._rollback(thread_id, before))
+                    raise
+                finally:
+                    self._stats["in_flight"] -= 1
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._sessions[thread_id]
+
+    async def _rollback(self, thread_id: str, before) -> None:
+        """Make ``before`` (the checkpoint preceding a failed turn) the latest one again."""
+        config = {"configurable": {"thread_id": thread_id}}
+        latest = await self.agent.checkpointer.aget_tuple(config)
+        if latest is None or (before is not None and latest.config == before.config):
+            return
+        if before is None:
+            await self.agent.checkpointer.adelete_thread(thread_id)
+        else:
+            await self.agent.aupdate_state(before.config, None, as_node="__copy__")
+
+    async def _turn_events(self, query: str, thread_id: str, tokens: bool) -> AsyncIterator[tuple[str, dict]]:
+        """Run one turn of ``thread_id`` (joining an identical in-flight turn if enabled)."""
+        config = {"configurable": {"thread_id": thread_id}}
+        human = HumanMessage(content=query)
+        if self.coalesce_graph is None:
+            events = agent_events(self.agent, {"messages": [human]}, config, tokens)
+        else:
+            # Run the turn statelessly on this session's history, shared with identical turns,
+            # then write its result to this session only
+            values = (await self.agent.aget_state(config)).values or {}
+            inputs = {**values, "messages": [*values.get("messages", []), HumanMessage(content=query)]}
+            events = self._flights.stream(
+                (history_digest(values), query), lambda: agent_events(self.coalesce_graph, inputs, {})
+            )
+        async with contextlib.aclosing(events) as events:
+            async for event, data in events:
+                if event == "_turn":
+                    if self.coalesce_graph is not None:
+                        update = {**data, "messages": [human, *data["messages"]]}
+                        await self.agent.aupdate_state(config, update, as_node="agent")
+                elif event != "token" or tokens:
+                    yield event, data
+
+    async def _chat(self, request: Request, writer: asyncio.StreamWriter) -> bool:
+        query, thread_id = self._turn(request)
+        start = time.perf_counter()
+        result = None
+        try:
+            async with (
+                asyncio.timeout(self.request_timeout),
+                self._session(thread_id),
+                contextlib.aclosing(self._turn_events(query, thread_id, tokens=False)) as events,
+            ):
+                async for event, data in events:
+                    if event == "done":
+                        result = data
+        except TimeoutError as e:
+            self._stats["timeouts"] += 1
+            raise HTTPError(504, f"request timed out after {self.request_timeout}s") from e
+        if result is None:
+            raise HTTPError(500, "the turn ended without a result")
+        body = {"thread_id": thread_id, **result, "latency_s": round(time.perf_counter() - start, 4)}
+        return await self._send_json(writer, 200, body, request.keep_alive, {"X-Thread-Id": thread_id})
+
+    async def _chat_stream(self, request: Request, writer: asyncio.StreamWriter) -> bool:
+        query, thread_id = self._turn(request)
+        chunked = request.version != "HTTP/1.0"
+        headers = {
+            "Content-Type": "text/event-stream; charset=utf-8",
+            "Cache-Control": "no-cache",
+            "X-Thread-Id": thread_id,
+        }
+        if chunked:
+            headers["Transfer-Encoding"] = "chunked"
+        keep_alive = await self._send(writer, 200, headers, None, request.keep_alive and chunked)
+
+        async def emit(event: str, data: dict) -> None:
+            payload = _sse(event, data)
+            writer.write(b"%x\r\n%s\r\n" % (len(payload), payload) if chunked else payload)
+            # Raises ConnectionError once the client is gone, which abandons the turn
+            await writer.drain()
+
+        start = time.perf_counter()
+        try:
+            async with (
+                asyncio.timeout(self.request_timeout),
+                self._session(thread_id),
+                contextlib.aclosing(self._turn_events(query, thread_id, tokens=True)) as events,
+            ):
+                async for event, data in events:
+                    if event == "done":
+                        data = {"thread_id": thread_id, **data, "latency_s": round(time.perf_counter() - start, 4)}
+                    await emit(event, data)
+        except TimeoutError:
+            self._stats["timeouts"] += 1
+            await emit("error", {"error": f"request timed out after {self.request_timeout}s"})
+        except ConnectionError:
+            raise
+        except Exception as e:
+            self._stats["errors"] += 1
+            await emit("error", {"error": f"{type(e).__name__}: {e}"})
+        if chunked:
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        return keep_alive and not self._draining
+
+    async def _thread(self, request: Request, writer: asyncio.StreamWriter) -> bool:
+        thread_id = request.path.removeprefix("/threads/")
+        state = await self.agent.aget_state({"configurable": {"thread_id": thread_id}})
+        messages = (state.values or {}).get("messages")
+        if not messages:
+            raise HTTPError(404, f"unknown thread: {thread_id}")
+        body = {"thread_id": thread_id, "messages": messages_to_dict(messages)}
+        return await self._send_json(writer, 200, body, request.keep_alive)
+
+    async def _health(self, request: Request, writer: asyncio.StreamWriter) -> bool:
+        body = {"status": "draining" if self._draining else "ok", **self.stats()}
+        return await self._send_json(writer, 200, body, request.keep_alive)
@@ -0,0 +1,110 @@
+"""Coalescing of identical in-flight async work ("singleflight").
+
+``SingleFlight.stream(key, producer)`` runs ``producer()`` at most once per
+key at a time: callers that arrive while a run with the same key is in
+flight join it instead of starting their own. Every caller receives every
+item of the run from the first one (items produced before it joined are
+replayed) and, if the run fails, its exception; a run cancelled from
+outside raises ``asyncio.CancelledError`` in every caller instead of ending
+as if it had finished.
+
+The run belongs to no caller. It executes in its own task, so a caller that
+is cancelled (e.g. because its client disconnected) or stops iterating only
+detaches itself; the others keep receiving items. The run is cancelled when
+its last caller detaches, and a cancelled run is never joined.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Callable, Hashable
+from typing import Any
+
+
+class _Flight:
+    """One in-flight run and the items it has produced so far."""
+
+    def __init__(self):
+        self.items: list = []
+        self.done = False
+        self.error: BaseException | None = None
+        self.waiters = 0
+        self.changed = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        # Waiters hold the old event; swap first so none misses a later change
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
+class SingleFlight:
+    """Shares one run of an async generator among concurrent callers with the same key."""
+
+    def __init__(self):
+        self._flights: dict[Hashable, _Flight] = {}
+        self._stats = {"runs": 0, "joined": 0, "cancelled": 0}
+
+    async def _run(self, key: Hashable, flight: _Flight, producer: Callable[[], AsyncIterator]) -> None:
+        try:
+            async with contextlib.aclosing(producer()) as items:
+                async for item in items:
+                    flight.items.append(item)
+                    flight.notify()
+        except asyncio.CancelledError as e:
+            # The items are truncated; waiters must not mistake them for a full run
+            flight.error = e
+            raise
+        except Exception as e:
+            flight.error = e
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            flight.done = True
+            flight.notify()
+
+    async def stream(self, key: Hashable, producer: Callable[[], AsyncIterator]) -> AsyncIterator[Any]:
+        """Yield the items of the in-flight run for ``key``, starting one if needed.
+
+        Iterate to the end or close the generator (``contextlib.aclosing``)
+        so the caller is detached promptly when it stops early.
+
+        Args:
+            key: Identity of the work; equal keys share one run.
+            producer: Returns the async iterator to run when no run for
+                ``key`` is in flight.
+
+        Raises:
+            Exception: Whatever the shared run raised.
+            asyncio.CancelledError: If the shared run was cancelled.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight()
+            flight.task = asyncio.create_task(self._run(key, flight, producer))
+            self._stats["runs"] += 1
+        else:
+            self._stats["joined"] += 1
+        flight.waiters += 1
+        try:
+            seen = 0
+            while True:
+                if seen < len(flight.items):
+                    seen += 1
+                    yield flight.items[seen - 1]
+                elif flight.done:
+                    break
+                else:
+                    await flight.changed.wait()
+            if flight.error is not None:
+                raise flight.error
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.done:
+                # Last caller left: nobody needs the result, and nobody may join a cancelled run
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+                self._stats["cancelled"] += 1
+
+    def stats(self) -> dict:
+        return {**self._stats, "in_flight": len(self._flights)}
@@ -3,7 +3,7 @@
 from typing import Annotated
 
 from langgraph.graph.message import add_messages
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class AgentState(TypedDict):
@@ -11,6 +11,11 @@ class AgentState(TypedDict):
 
     Attributes:
         messages: List of messages in the conversation, managed by add_messages reducer.
+        summary: Running summary of the compacted older part of the conversation.
+        summarized_through: Index into ``messages`` up to which (exclusive) the
+            summary covers the conversation; later messages are sent verbatim.
     """
 
     messages: Annotated[list, add_messages]
+    summary: NotRequired[str]
+    summarized_through: NotRequired[int]
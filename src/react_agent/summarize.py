@@ -0,0 +1,138 @@
+"""Rolling summarization of older conversation turns."""
+
+from collections.abc import Callable
+from typing import Literal
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from react_agent.context import estimate_message_tokens
+from react_agent.llm import llm_manager
+from react_agent.state import AgentState
+
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a conversation between a user and an AI agent. "
+    "Merge the existing summary with the new messages into one concise summary. "
+    "Keep every fact, number, tool result and open request the agent may need later. "
+    "Answer with the summary only, in the language of the conversation."
+)
+
+
+def _pinned_count(messages: list) -> int:
+    count = 0
+    while count < len(messages) and isinstance(messages[count], SystemMessage):
+        count += 1
+    return count
+
+
+def _transcript(messages: list[BaseMessage]) -> str:
+    lines = []
+    for msg in messages:
+        if isinstance(msg, HumanMessage):
+            lines.append(f"User: {msg.content}")
+        elif isinstance(msg, AIMessage):
+            for tc in msg.tool_calls:
+                lines.append(f"Agent called {tc['name']}({tc['args']})")
+            if msg.content:
+                lines.append(f"Agent: {msg.content}")
+        elif isinstance(msg, ToolMessage):
+            lines.append(f"Tool {msg.name or ''} returned: {msg.content}")
+    return "\n".join(lines)
+
+
+def _text(msg: AIMessage) -> str:
+    if isinstance(msg.content, str):
+        return msg.content
+    return "".join(block.get("text", "") if isinstance(block, dict) else str(block) for block in msg.content)
+
+
+def summarized_messages(state: AgentState) -> list:
+    """Return the conversation as the model should see it.
+
+    Leading system messages are kept, compacted turns are replaced by a single
+    system message holding the running summary, and everything after
+    ``summarized_through`` is passed through unchanged.
+    """
+    messages = state["messages"]
+    through = state.get("summarized_through", 0)
+    if not through:
+        return messages
+
+    pinned = _pinned_count(messages)
+    # A stable id lets the context window keep reusing its token index
+    summary = SystemMessage(content=f"Summary of the earlier conversation:\n{state['summary']}", id=f"summary-{through}")
+    return [*messages[:pinned], summary, *messages[through:]]
+
+
+class Summarizer:
+    """Compacts older turns into ``AgentState.summary`` once history grows too long.
+
+    The summarizer only ever reads the messages between the previous
+    ``summarized_through`` index and the new cut, together with the previous
+    summary, so its cost per invocation is independent of conversation length.
+    Cuts fall on human-turn boundaries, keeping tool calls with their results.
+
+    Args:
+        trigger_tokens: Estimated tokens of unsummarized history that trigger
+            a summarization.
+        keep_recent_turns: Number of most recent human turns never summarized
+            (at least the current one is always kept).
+        estimator: Per-message token estimator.
+    """
+
+    def __init__(
+        self,
+        trigger_tokens: int = 4000,
+        keep_recent_turns: int = 2,
+        estimator: Callable[[BaseMessage], int] = estimate_message_tokens,
+    ):
+        self.trigger_tokens = trigger_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self.estimator = estimator
+
+    def route(self, state: AgentState) -> Literal["summarize", "agent"]:
+        """Decide whether to summarize before the next agent step."""
+        return "summarize" if self._cut(state) is not None else "agent"
+
+    def node(self, state: AgentState) -> dict:
+        """Fold the newly compactable messages into the running summary."""
+        cut = self._cut(state)
+        if cut is None:
+            return {}
+        response = llm_manager.get_llm().invoke(self._prompt(state, cut))
+        return {"summary": _text(response), "summarized_through": cut}
+
+    async def anode(self, state: AgentState) -> dict:
+        """Async variant of :meth:`node`."""
+        cut = self._cut(state)
+        if cut is None:
+            return {}
+        response = await llm_manager.get_llm().ainvoke(self._prompt(state, cut))
+        return {"summary": _text(response), "summarized_through": cut}
+
+    def _cut(self, state: AgentState) -> int | None:
+        messages = state["messages"]
+        start = max(state.get("summarized_through", 0), _pinned_count(messages))
+
+        tokens = 0
+        turn_starts = []
+        for i in range(start, len(messages)):
+            tokens += self.estimator(messages[i])
+            if isinstance(messages[i], HumanMessage):
+                turn_starts.append(i)
+
+        # The turn in progress is never summarized
+        keep = max(self.keep_recent_turns, 1)
+        if tokens <= self.trigger_tokens or len(turn_starts) <= keep:
+            return None
+        return turn_starts[-keep]
+
+    def _prompt(self, state: AgentState, cut: int) -> list[BaseMessage]:
+        messages = state["messages"]
+        start = max(state.get("summarized_through", 0), _pinned_count(messages))
+        previous = state.get("summary") or "(none)"
+        return [
+            SystemMessage(content=SUMMARY_PROMPT),
+            HumanMessage(
+                content=f"Existing summary:\n{previous}\n\nNew messages:\n{_transcript(messages[start:cut])}"
+            ),
+        ]
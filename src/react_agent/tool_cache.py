@@ -0,0 +1,161 @@
+"""Memoizing result cache for pure tools."""
+
+import functools
+import inspect
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Every cache created by cached_tool, by function name, for stats reporting
+_registry: dict[str, "ToolResultCache"] = {}
+
+
+def normalize_query(query: str) -> str:
+    """Canonicalize a free-text query: NFKC, case-folded, whitespace collapsed."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", query)).strip().casefold()
+
+
+def normalize_expression(expression: str) -> str:
+    """Canonicalize an arithmetic expression by removing all whitespace."""
+    return _WHITESPACE_RE.sub("", unicodedata.normalize("NFKC", expression))
+
+
+class ToolResultCache:
+    """Thread-safe LRU of tool results with a per-entry time-to-live."""
+
+    def __init__(self, ttl: float | None = None, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+
+    def get(self, key: tuple) -> tuple[bool, object]:
+        """Return ``(found, value)`` for ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored, value = entry
+                if self.ttl is None or time.monotonic() - stored <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return True, value
+                del self._entries[key]
+                self._stats["expired"] += 1
+            self._stats["misses"] += 1
+            return False, None
+
+    def put(self, key: tuple, value: object) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+
+def cached_tool(
+    ttl: float | None = 300.0,
+    max_entries: int = 1024,
+    canonicalize: dict[str, Callable[[object], object]] | None = None,
+    name: str | None = None,
+) -> Callable:
+    """Memoize a deterministic tool function; apply it beneath ``@tool``.
+
+    The tool schema is unaffected because the wrapper keeps the original
+    signature and docstring. Arguments are bound to the signature (so
+    positional, keyword and default values map to the same key) and passed
+    through the per-argument ``canonicalize`` functions before lookup. Do not
+    use it on impure tools such as ``get_current_time``. Setting
+    ``REACT_AGENT_TOOL_CACHE=0`` bypasses every tool cache.
+
+    Results are shared by every caller whose arguments canonicalize to the
+    same key, so cache a value that does not echo the raw arguments and
+    format it for each caller in the tool itself.
+
+    Args:
+        ttl: Seconds a result stays valid (None keeps it until evicted).
+        max_entries: Maximum cached results for this tool.
+        canonicalize: Argument name to normalization function.
+        name: Name for stats and ``clear_tool_cache`` (default: the function name).
+    """
+    canonicalize = canonicalize or {}
+
+    def decorator(func: Callable) -> Callable:
+        cache = ToolResultCache(ttl=ttl, max_entries=max_entries)
+        signature = inspect.signature(func)
+        _registry[name or func.__name__] = cache
+
+        def make_key(args: tuple, kwargs: dict) -> tuple:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return tuple(
+                (name, canonicalize[name](value) if name in canonicalize else value)
+                for name, value in bound.arguments.items()
+            )
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if os.getenv("REACT_AGENT_TOOL_CACHE") == "0":
+                    return await func(*args, **kwargs)
+                key = make_key(args, kwargs)
+                found, value = cache.get(key)
+                if not found:
+                    value = await func(*args, **kwargs)
+                    cache.put(key, value)
+                return value
+
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if os.getenv("REACT_AGENT_TOOL_CACHE") == "0":
+                return func(*args, **kwargs)
+            key = make_key(args, kwargs)
+            found, value = cache.get(key)
+            if not found:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def clear_tool_cache(name: str | None = None) -> None:
+    """Drop cached results of the tool function ``name``, or of every tool."""
+    for cache_name, cache in _registry.items():
+        if name is None or cache_name == name:
+            cache.clear()
+
+
+def tool_cache_stats() -> dict[str, dict]:
+    """Return hit-rate counters of every cached tool, keyed by function name."""
+    return {name: cache.stats() for name, cache in _registry.items()}
@@ -0,0 +1,162 @@
+"""Concurrent execution of the tool calls in one AIMessage."""
+
+import asyncio
+import contextvars
+import time
+import weakref
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.tools import BaseTool
+
+from react_agent.state import AgentState
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT = 30.0
+
+
+def _error_message(call: dict, error: str) -> ToolMessage:
+    return ToolMessage(content=f"Error: {error}", name=call["name"], tool_call_id=call["id"], status="error")
+
+
+class ParallelToolNode:
+    """Graph node that runs all tool calls of the last AIMessage concurrently.
+
+    Sync tools run on bounded thread pools shared by all graph runs, one pool
+    per tool, so a slow or rate-limited tool can only occupy its own threads
+    (a timed-out call keeps its thread until the tool returns); async tools
+    are awaited together with ``asyncio.gather`` (sync tools join them
+    through the same pools). A tool's concurrency limit is the size of its
+    pool, so calls over the limit wait in the pool queue without holding a
+    thread. Each call is bounded by a timeout, counted from submission so it
+    includes time spent waiting for a slot; a failed or timed-out call
+    produces an error ToolMessage instead of failing the graph. Tools run in
+    a copy of the caller's context, as in LangGraph's ``ToolNode``. Results
+    are always returned in tool_call order, so the ``add_messages`` state is
+    deterministic.
+
+    Args:
+        tools: Tools available to the agent.
+        max_workers: Thread pool size of each tool without a limit.
+        timeout: Default per-call timeout in seconds (None for no timeout).
+        limits: Maximum concurrent calls per tool name.
+        timeouts: Per-tool timeout overrides in seconds.
+    """
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        limits: dict[str, int] | None = None,
+        timeouts: dict[str, float | None] | None = None,
+    ):
+        self.tools_by_name = {t.name: t for t in tools}
+        self.timeout = timeout
+        self.limits = limits or {}
+        self.timeouts = timeouts or {}
+        # Threads start lazily, so idle tools cost nothing
+        self._executors = {
+            name: ThreadPoolExecutor(max_workers=self.limits.get(name, max_workers), thread_name_prefix=f"tool-{name}")
+            for name in self.tools_by_name
+        }
+        # asyncio semaphores are bound to one event loop
+        self._async_limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def as_runnable(self) -> RunnableLambda:
+        """Wrap the node so LangGraph can drive it both sync and async."""
+        return RunnableLambda(self.invoke, afunc=self.ainvoke, name="tools")
+
+    def invoke(self, state: AgentState, config: RunnableConfig) -> dict:
+        """Run the pending tool calls on the thread pool."""
+        calls = self._pending_calls(state)
+        submitted = time.monotonic()
+        futures = [self._submit(call, config) for call in calls]
+        messages = []
+        for call, future in zip(calls, futures):
+            # Each call's timeout runs from submission, not from when we start waiting on it
+            timeout = self._timeout(call)
+            remaining = None if timeout is None else max(submitted + timeout - time.monotonic(), 0)
+            try:
+                messages.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                future.cancel()
+                messages.append(_error_message(call, f"{call['name']} timed out after {timeout}s"))
+        return {"messages": messages}
+
+    async def ainvoke(self, state: AgentState, config: RunnableConfig) -> dict:
+        """Run the pending tool calls concurrently on the event loop."""
+        calls = self._pending_calls(state)
+        messages = await asyncio.gather(*(self._run_async(call, config) for call in calls))
+        return {"messages": list(messages)}
+
+    def _pending_calls(self, state: AgentState) -> list[dict]:
+        last_message = state["messages"][-1]
+        if not isinstance(last_message, AIMessage):
+            return []
+        return [{**call, "type": "tool_call"} for call in last_message.tool_calls]
+
+    def _timeout(self, call: dict) -> float | None:
+        return self.timeouts.get(call["name"], self.timeout)
+
+    def _submit(self, call: dict, config: RunnableConfig) -> Future:
+        tool = self.tools_by_name.get(call["name"])
+        if tool is None:
+            future = Future()
+            future.set_result(_error_message(call, f"unknown tool {call['name']}"))
+            return future
+        context = contextvars.copy_context()
+        return self._executors[tool.name].submit(context.run, self._run_sync, tool, call, config)
+
+    def _run_sync(self, tool: BaseTool, call: dict, config: RunnableConfig) -> ToolMessage:
+        try:
+            return self._call_sync(tool, call, config)
+        except Exception as e:
+            return _error_message(call, str(e))
+
+    @staticmethod
+    def _call_sync(tool: BaseTool, call: dict, config: RunnableConfig) -> ToolMessage:
+        # Async-only tools get a private event loop on the worker thread
+        if getattr(tool, "func", None) is None and getattr(tool, "coroutine", None) is not None:
+            return asyncio.run(tool.ainvoke(call, config))
+        return tool.invoke(call, config)
+
+    async def _run_async(self, call: dict, config: RunnableConfig) -> ToolMessage:
+        tool = self.tools_by_name.get(call["name"])
+        if tool is None:
+            return _error_message(call, f"unknown tool {call['name']}")
+
+        async def run() -> ToolMessage:
+            limit = self._async_limit(call["name"])
+            if limit is None:
+                return await start()
+            async with limit:
+                return await start()
+
+        def start():
+            if getattr(tool, "coroutine", None) is not None:
+                return tool.ainvoke(call, config)
+            context = contextvars.copy_context()
+            return asyncio.get_running_loop().run_in_executor(
+                self._executors[tool.name], context.run, tool.invoke, call, config
+            )
+
+        timeout = self._timeout(call)
+        try:
+            return await asyncio.wait_for(run(), timeout)
+        except asyncio.TimeoutError:
+            return _error_message(call, f"{call['name']} timed out after {timeout}s")
+        except Exception as e:
+            return _error_message(call, str(e))
+
+    def _async_limit(self, name: str) -> asyncio.Semaphore | None:
+        if name not in self.limits:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphores = self._async_limits.setdefault(loop, {})
+        if name not in semaphores:
+            semaphores[name] = asyncio.Semaphore(self.limits[name])
+        return semaphores[name]
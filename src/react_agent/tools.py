@@ -4,7 +4,31 @@ from datetime import datetime
 
 from langchain_core.tools import tool
 
+from react_agent.arithmetic import BudgetExceeded, ExpressionError, compile_expression, evaluate, evaluate_many
+from react_agent.keyword_matcher import KeywordTable
+from react_agent.search_index import get_search_index
+from react_agent.tool_cache import cached_tool, clear_tool_cache, normalize_expression, normalize_query
+from react_agent.vector_index import get_search_settings, get_vector_index
+
+# Offline results for search_web when no search index is configured; editing
+# the table rebuilds its keyword automaton and drops cached search results
+MOCK_RESULTS = KeywordTable(
+    {
+        "langgraph": "LangGraph is a library for building stateful, multi-actor applications with LLMs.",
+        "react agent": "ReAct (Reasoning and Acting) is a paradigm that combines reasoning and action in LLM agents.",
+        "gemini api": "Google Gemini API provides access to Google's multimodal AI models.",
+    },
+    on_change=lambda: clear_tool_cache("search_web"),
+)
+
 
+# Tools whose output depends only on their arguments, so an answer built from
+# them may be reused by the semantic cache; anything else (e.g. get_current_time)
+# keeps the answer out of it
+CACHEABLE_TOOLS = frozenset({"search_web", "calculator", "calculator_batch"})
+
+
+# Impure: never wrap with cached_tool
 @tool
 def get_current_time() -> str:
     """Get the current date and time.
@@ -16,29 +40,56 @@ def get_current_time() -> str:
     return f"현재 시간: {now.strftime('%Y년 %m월 %d일 %H시 %M분 %S초')}"
 
 
+@cached_tool(ttl=3600, max_entries=4096, canonicalize={"query": normalize_query}, name="search_web")
+def _search(query: str, max_results: int = 3) -> str:
+    """Return the text that follows ``Search results for '<query>':``.
+
+    The query itself is left out because the result is shared by every
+    query that normalizes to the same key.
+    """
+    index = get_search_index()
+    if index is not None:
+        vectors = get_vector_index()
+        if vectors is not None:
+            hits = vectors.hybrid_search(index, query, k=min(max_results, 10), **get_search_settings())
+        else:
+            hits = index.search(query, k=min(max_results, 10))
+        if not hits:
+            return " No results found."
+        return "\n" + "\n".join(f"{i}. {hit.title}: {hit.snippet}" for i, hit in enumerate(hits, 1))
+
+    # Mock implementation for testing purposes
+    matches = MOCK_RESULTS.lookup(query)[:max_results]
+    if len(matches) == 1:
+        return f" {matches[0][1]}"
+    if matches:
+        return "\n" + "\n".join(f"{i}. {keyword}: {result}" for i, (keyword, result) in enumerate(matches, 1))
+
+    return " No specific results found. This is a mock search tool."
+
+
 @tool
-def search_web(query: str) -> str:
+def search_web(query: str, max_results: int = 3) -> str:
     """Search the web for information.
 
     Args:
         query: The search query string.
+        max_results: Maximum number of results to return.
 
     Returns:
-        Mock search results as a string.
+        Search results as a string.
     """
-    # Mock implementation for testing purposes
-    mock_results = {
-        "langgraph": "LangGraph is a library for building stateful, multi-actor applications with LLMs.",
-        "react agent": "ReAct (Reasoning and Acting) is a paradigm that combines reasoning and action in LLM agents.",
-        "gemini api": "Google Gemini API provides access to Google's multimodal AI models.",
-    }
+    return f"Search results for '{query}':{_search(query, max_results)}"
 
-    query_lower = query.lower()
-    for keyword, result in mock_results.items():
-        if keyword in query_lower:
-            return f"Search results for '{query}': {result}"
 
-    return f"Search results for '{query}': No specific results found. This is a mock search tool."
+@cached_tool(ttl=None, max_entries=4096, canonicalize={"expression": normalize_expression}, name="calculator")
+def _calculate(expression: str):
+    """Evaluate ``expression``, returning the error instead of raising it."""
+    try:
+        return evaluate(expression)
+    except (ZeroDivisionError, ExpressionError) as e:
+        # Drop the traceback so the cache does not keep the evaluator's frames alive
+        return e.with_traceback(None)
 
 
 @tool
@@ -51,15 +102,69 @@ def calculator(expression: str) -> str:
     Returns:
         The result of the calculation as a string.
     """
-    try:
-        # Only allow safe mathematical operations
-        allowed_chars = set("0123456789+-*/(). ")
-        if not all(c in allowed_chars for c in expression):
-            return "Error: Invalid characters in expression. Only numbers and basic operators (+, -, *, /, parentheses) are allowed."
-
-        result = eval(expression)  # noqa: S307
-        return f"Result: {expression} = {result}"
-    except ZeroDivisionError:
+    result = _calculate(expression)
+    if isinstance(result, ZeroDivisionError):
+        return "Error: Division by zero"
+    if isinstance(result, BudgetExceeded):
+        return f"Error: Expression exceeds the evaluation budget. {result}"
+    if isinstance(result, ExpressionError):
+        return f"Error: Could not evaluate expression. {result}"
+    return f"Result: {expression} = {result}"
+
+
+def _format_result(value) -> str:
+    if isinstance(value, ZeroDivisionError):
         return "Error: Division by zero"
-    except Exception as e:
-        return f"Error: Could not evaluate expression. {e}"
+    if isinstance(value, ExpressionError):
+        return f"Error: {value}"
+    return str(value)
+
+
+@tool
+def calculator_batch(
+    expressions: list[str] | None = None,
+    template: str | None = None,
+    variables: dict[str, list[int | float]] | None = None,
+) -> str:
+    """Evaluate many mathematical expressions in a single call.
+
+    Prefer this over repeated calculator calls. Pass either a list of
+    independent expressions, or one template expression using variable names
+    together with a list of values per name; the template is evaluated once
+    per position (e.g., template "price * qty" with variables
+    {"price": [10, 20], "qty": [3, 4]} gives 30 and 80). A template must use
+    at least one variable.
+
+    Args:
+        expressions: Expressions to evaluate (e.g., ["2 + 2", "10 * 5"]).
+        template: An expression with variables (e.g., "price * qty * 1.1").
+        variables: Variable name to a list of values; all lists have the same length.
+
+    Returns:
+        One numbered result per line.
+    """
+    if (expressions is None) == (template is None):
+        return "Error: Provide either expressions or template (with variables), not both."
+    try:
+        if expressions is not None:
+            results = evaluate_many(expressions)
+            lines = [f"{i}. {expr} = {_format_result(r)}" for i, (expr, r) in enumerate(zip(expressions, results), 1)]
+        else:
+            variables = variables or {}
+            compiled = compile_expression(template)
+            if not compiled.variables:
+                return "Error: The template uses no variables; use calculator for a single expression."
+            if len({len(values) for values in variables.values()}) > 1:
+                return "Error: All variable lists must have the same length."
+            results = compiled.batch(variables)
+            # Bind only the names the template reads; unused entries are not printed
+            names = sorted(compiled.variables)
+            lines = [f"{template}:"]
+            for i, result in enumerate(results):
+                bindings = ", ".join(f"{name}={variables[name][i]}" for name in names)
+                lines.append(f"{i + 1}. {bindings}: {_format_result(result)}")
+    except BudgetExceeded as e:
+        return f"Error: Batch exceeds the evaluation budget. {e}"
+    except ExpressionError as e:
+        return f"Error: Could not evaluate batch. {e}"
+    return "\n".join(lines)
@@ -0,0 +1,115 @@
+"""Append-only NDJSON conversation transcripts.
+
+A transcript is one JSON object per line: a ``session`` header followed by
+one record per message in LangChain's ``message_to_dict`` form plus a
+``seq`` number. Writers only ever append, so exporting after every turn
+costs time proportional to the new messages, not to the conversation.
+
+Files ending in ``.gz`` or ``.zst`` are compressed. Every append is written
+as its own gzip member / zstd frame, so the file is valid after each append
+(even if the process dies later) and readers decode the members back to
+back. zstd needs the optional ``zstandard`` package.
+"""
+
+import gzip
+import io
+import json
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import IO
+
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+TRANSCRIPT_VERSION = 1
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("Reading or writing .zst transcripts requires the 'zstandard' package") from e
+    return zstandard
+
+
+def compression_for(path: str | Path) -> str | None:
+    """Return ``"gzip"``, ``"zstd"`` or None from the file suffix."""
+    suffix = Path(path).suffix
+    return {".gz": "gzip", ".zst": "zstd"}.get(suffix)
+
+
+def _open_append(path: Path) -> IO[bytes]:
+    compression = compression_for(path)
+    raw = open(path, "ab")
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="ab", compresslevel=GZIP_LEVEL)
+    if compression == "zstd":
+        return _zstd().ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=True)
+    return raw
+
+
+def _open_read(path: Path) -> IO[bytes]:
+    compression = compression_for(path)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        reader = _zstd().ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+        return io.BufferedReader(reader, buffer_size=1 << 16)
+    return open(path, "rb", buffering=1 << 16)
+
+
+def iter_records(path: str | Path) -> Iterator[dict]:
+    """Yield every JSON record of a transcript, header lines included.
+
+    Reads in constant memory; a torn tail (from a crash mid-append) is
+    skipped.
+    """
+    with _open_read(Path(path)) as f:
+        try:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    yield json.loads(line)
+        except EOFError:
+            # Truncated gzip member
+            return
+
+
+def read_transcript(path: str | Path) -> Iterator[BaseMessage]:
+    """Yield the messages of a transcript in order."""
+    for record in iter_records(path):
+        if "seq" in record:
+            yield messages_from_dict([record])[0]
+
+
+class TranscriptWriter:
+    """Appends messages to an NDJSON transcript, continuing an existing file.
+
+    Args:
+        path: Transcript file; ``.gz`` / ``.zst`` select compression.
+        thread_id: Session id written to the header of a new file.
+    """
+
+    def __init__(self, path: str | Path, thread_id: str | None = None):
+        self.path = Path(path)
+        self.thread_id = thread_id
+        # Continue numbering after the messages already in the file
+        self.count = sum("seq" in r for r in iter_records(self.path)) if self.path.exists() else 0
+
+    def append(self, messages: Iterable[BaseMessage]) -> int:
+        """Append ``messages`` as one write and return how many were written."""
+        lines = [{"seq": self.count + i, **message_to_dict(msg)} for i, msg in enumerate(messages)]
+        if not lines:
+            return 0
+        if not self.path.exists() or not self.path.stat().st_size:
+            header = {"type": "session", "version": TRANSCRIPT_VERSION, "thread_id": self.thread_id}
+            lines.insert(0, {**header, "created": datetime.now().isoformat()})
+        data = "".join(json.dumps(line, ensure_ascii=False, default=str) + "\n" for line in lines)
+        with _open_append(self.path) as f:
+            f.write(data.encode("utf-8"))
+        written = sum("seq" in line for line in lines)
+        self.count += written
+        return written
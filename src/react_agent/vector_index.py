@@ -0,0 +1,346 @@
+"""Dense vector retrieval over the documents of a BM25 :class:`SearchIndex`.
+
+Documents are split into overlapping word windows, embedded with the local
+:class:`HashingEmbedder` and stored as a float32 matrix that is memory-mapped
+when opened. Queries are scored with blocked matrix multiplies, either
+exactly over every chunk or, with ``nprobe``, over the chunks of the
+``nprobe`` nearest k-means clusters (an IVF index: the matrix is stored
+grouped by cluster so each probe reads one contiguous slice). Hybrid search
+fuses the dense scores with BM25 scores of the same documents.
+"""
+
+import json
+import math
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from react_agent.search_index import SearchHit, SearchIndex, get_search_index
+from react_agent.semantic_cache import HashingEmbedder
+from react_agent.tool_cache import clear_tool_cache
+
+INDEX_VERSION = 1
+DEFAULT_DIM = 256
+DEFAULT_CHUNK_WORDS = 120
+DEFAULT_CHUNK_OVERLAP = 30
+# Rows scored per matrix multiply; bounds the temporary score matrix
+BLOCK_ROWS = 65536
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def chunk_spans(text: str, words: int = DEFAULT_CHUNK_WORDS, overlap: int = DEFAULT_CHUNK_OVERLAP) -> list[tuple[int, int]]:
+    """Split ``text`` into overlapping windows of ``words`` words.
+
+    Returns:
+        ``(start, end)`` character offsets of each chunk.
+    """
+    spans = [m.span() for m in _WORD_RE.finditer(text)]
+    if not spans:
+        return [(0, 0)]
+    step = max(words - overlap, 1)
+    chunks = []
+    for i in range(0, len(spans), step):
+        window = spans[i : i + words]
+        chunks.append((window[0][0], window[-1][1]))
+        if i + words >= len(spans):
+            break
+    return chunks
+
+
+def _kmeans(vectors: np.ndarray, clusters: int, iterations: int, seed: int) -> np.ndarray:
+    """Spherical k-means on unit vectors; returns unit-length centroids."""
+    rng = np.random.default_rng(seed)
+    sample = vectors[rng.choice(len(vectors), size=min(len(vectors), clusters * 64), replace=False)]
+    centroids = sample[rng.choice(len(sample), size=clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        empty = norms[:, 0] == 0
+        # Re-seed empty clusters with random sample points
+        sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+        norms[empty] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+    return centroids
+
+
+class VectorIndex:
+    """Memory-mapped chunk embeddings with exact and IVF top-k search.
+
+    Args:
+        path: Directory written by :meth:`build`.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.meta = json.loads((self.path / "meta.json").read_text())
+        if self.meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported vector index version in {self.path}")
+        self.embedder = HashingEmbedder(dim=self.meta["dim"], ngram=self.meta["ngram"])
+
+        def load(name: str) -> np.ndarray:
+            return np.load(self.path / f"{name}.npy", mmap_mode="r")
+
+        self.vectors = load("vectors")
+        self.chunk_docs = load("chunk_docs")
+        self.chunk_starts = load("chunk_starts")
+        self.centroids = np.asarray(load("centroids"))
+        self.list_offsets = np.asarray(load("list_offsets"))
+
+    @classmethod
+    def open(cls, path: str | Path) -> "VectorIndex":
+        """Memory-map an index written by :meth:`build`."""
+        return cls(path)
+
+    @classmethod
+    def build(
+        cls,
+        search_index: SearchIndex,
+        path: str | Path,
+        dim: int = DEFAULT_DIM,
+        chunk_words: int = DEFAULT_CHUNK_WORDS,
+        overlap: int = DEFAULT_CHUNK_OVERLAP,
+        clusters: int | None = None,
+        seed: int = 0,
+    ) -> "VectorIndex":
+        """Chunk and embed every document of ``search_index`` into ``path``.
+
+        Args:
+            search_index: BM25 index whose documents are embedded; dense hits
+                refer to its document ids.
+            path: Output directory; existing index files are overwritten.
+            dim: Embedding dimension.
+            chunk_words: Words per chunk.
+            overlap: Words shared by consecutive chunks.
+            clusters: IVF cluster count (default about 4 * sqrt(chunks); 0 disables IVF).
+            seed: Seed for k-means initialization.
+        """
+        started = time.perf_counter()
+        out = Path(path)
+        out.mkdir(parents=True, exist_ok=True)
+        (out / "meta.json").unlink(missing_ok=True)
+        embedder = HashingEmbedder(dim=dim)
+
+        rows, docs, starts = [], [], []
+        for doc_id in range(search_index.num_docs):
+            title, text = search_index.document(doc_id)
+            for start, end in chunk_spans(text, chunk_words, overlap):
+                rows.append(embedder.embed(f"{title}\n{text[start:end]}"))
+                docs.append(doc_id)
+                starts.append(start)
+        vectors = np.vstack(rows).astype(np.float32) if rows else np.zeros((0, dim), dtype=np.float32)
+        chunk_docs = np.asarray(docs, dtype=np.int32)
+        chunk_starts = np.asarray(starts, dtype=np.int32)
+
+        if clusters is None:
+            clusters = min(int(4 * math.sqrt(len(vectors))), len(vectors) // 8)
+        if clusters >= 2:
+            centroids = _kmeans(vectors, clusters, iterations=10, seed=seed)
+            assign = np.concatenate(
+                [np.argmax(vectors[i : i + BLOCK_ROWS] @ centroids.T, axis=1) for i in range(0, len(vectors), BLOCK_ROWS)]
+            )
+            # Store each cluster's chunks contiguously so a probe is one slice
+            order = np.argsort(assign, kind="stable")
+            vectors, chunk_docs, chunk_starts = vectors[order], chunk_docs[order], chunk_starts[order]
+            list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=clusters))])
+        else:
+            centroids = np.zeros((0, dim), dtype=np.float32)
+            list_offsets = np.zeros(1, dtype=np.int64)
+
+        arrays = {
+            "vectors": vectors,
+            "chunk_docs": chunk_docs,
+            "chunk_starts": chunk_starts,
+            "centroids": centroids,
+            "list_offsets": list_offsets.astype(np.int64),
+        }
+        for name, values in arrays.items():
+            np.save(out / f"{name}.npy", values)
+        meta = {
+            "version": INDEX_VERSION,
+            "dim": dim,
+            "ngram": embedder.ngram,
+            "chunks": len(vectors),
+            "clusters": len(centroids),
+            "chunk_words": chunk_words,
+            "overlap": overlap,
+            "search_index": str(search_index.path.resolve()),
+            "search_docs": search_index.num_docs,
+            "build_seconds": time.perf_counter() - started,
+        }
+        (out / "meta.json").write_text(json.dumps(meta, indent=2))
+        return cls(out)
+
+    def check_source(self, search_index: SearchIndex) -> None:
+        """Check that this index was built from ``search_index``.
+
+        Dense hits are document ids of the BM25 index the vectors were built
+        from, so any other index would return the wrong documents.
+
+        Raises:
+            ValueError: If the source path or document count differs.
+        """
+        built_from = Path(self.meta["search_index"]).resolve()
+        if built_from != search_index.path.resolve():
+            raise ValueError(
+                f"Vector index {self.path} was built from search index {built_from}, not {search_index.path}"
+            )
+        docs = self.meta.get("search_docs")
+        if docs is not None and docs != search_index.num_docs:
+            raise ValueError(
+                f"Vector index {self.path} was built from {docs} documents, but search index "
+                f"{search_index.path} has {search_index.num_docs}; rebuild it with --build-vector-index"
+            )
+
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Embed queries into a ``(len(queries), dim)`` float32 matrix."""
+        return np.vstack([self.embedder.embed(q) for q in queries]).astype(np.float32)
+
+    @staticmethod
+    def _merge(ids: np.ndarray, scores: np.ndarray, new_ids: np.ndarray, new_scores: np.ndarray, k: int):
+        ids, scores = np.concatenate([ids, new_ids]), np.concatenate([scores, new_scores])
+        if len(scores) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[keep], scores[keep]
+        return ids, scores
+
+    def _search_exact(self, queries: np.ndarray, k: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+        results = [empty] * len(queries)
+        for start in range(0, len(self.vectors), BLOCK_ROWS):
+            block_scores = queries @ np.asarray(self.vectors[start : start + BLOCK_ROWS]).T
+            ids = np.arange(start, start + block_scores.shape[1])
+            results = [self._merge(*results[q], ids, block_scores[q], k) for q in range(len(queries))]
+        return results
+
+    def _search_ivf(self, queries: np.ndarray, k: int, nprobe: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        nprobe = min(nprobe, len(self.centroids))
+        probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        results = []
+        for q, lists in enumerate(probes):
+            ids = np.concatenate([np.arange(self.list_offsets[c], self.list_offsets[c + 1]) for c in lists])
+            scores = np.asarray(self.vectors[ids]) @ queries[q]
+            results.append(self._merge(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32), ids, scores, k))
+        return results
+
+    def search_chunks(
+        self, queries: list[str], k: int = 10, nprobe: int | None = None
+    ) -> list[list[tuple[int, float]]]:
+        """Return the top ``k`` ``(chunk_id, cosine)`` pairs per query, best first.
+
+        Args:
+            queries: Query texts, scored together in one matrix multiply per block.
+            k: Chunks per query.
+            nprobe: Clusters to scan (IVF); None or an index without clusters
+                searches exactly. Higher values trade latency for recall.
+        """
+        if not queries or len(self.vectors) == 0 or k <= 0:
+            return [[] for _ in queries]
+        matrix = self.embed_queries(queries)
+        if nprobe and len(self.centroids):
+            raw = self._search_ivf(matrix, k, nprobe)
+        else:
+            raw = self._search_exact(matrix, k)
+        return [
+            sorted(zip(ids.tolist(), scores.tolist()), key=lambda item: (-item[1], item[0]))
+            for ids, scores in raw
+        ]
+
+    def search(self, query: str, k: int = 5, nprobe: int | None = None) -> list[tuple[int, float, int]]:
+        """Return the top ``k`` documents as ``(doc_id, score, best_chunk_id)``.
+
+        A document scores as its best chunk.
+        """
+        best: dict[int, tuple[float, int]] = {}
+        for chunk, score in self.search_chunks([query], k * 4, nprobe)[0]:
+            doc = int(self.chunk_docs[chunk])
+            if doc not in best:
+                best[doc] = (score, chunk)
+        return [(doc, score, chunk) for doc, (score, chunk) in list(best.items())[:k]]
+
+    def hybrid_search(
+        self,
+        search_index: SearchIndex,
+        query: str,
+        k: int = 5,
+        alpha: float = 0.5,
+        nprobe: int | None = None,
+    ) -> list[SearchHit]:
+        """Fuse dense and BM25 scores and return the top ``k`` documents.
+
+        Each score list is scaled by its best score before mixing, so
+        ``alpha`` weighs the two rankings independently of their units:
+        1.0 is dense-only, 0.0 keyword-only.
+        """
+        dense = self.search(query, k * 4, nprobe) if alpha > 0 else []
+        keyword = search_index.top(query, k * 4) if alpha < 1 else []
+        top_dense = max((score for _, score, _ in dense), default=0.0)
+        top_keyword = max((score for _, score in keyword), default=0.0)
+
+        combined: dict[int, float] = {}
+        anchors: dict[int, int] = {}
+        for doc, score, chunk in dense:
+            if top_dense > 0 and score > 0:
+                combined[doc] = alpha * score / top_dense
+                anchors[doc] = int(self.chunk_starts[chunk])
+        for doc, score in keyword:
+            if top_keyword > 0:
+                combined[doc] = combined.get(doc, 0.0) + (1 - alpha) * score / top_keyword
+
+        ranked = sorted(combined.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [search_index.hit(doc, score, query, anchor=anchors.get(doc, 0)) for doc, score in ranked]
+
+    def stats(self) -> dict:
+        """Return chunk, cluster and size counters."""
+        return {
+            "chunks": self.meta["chunks"],
+            "clusters": self.meta["clusters"],
+            "dim": self.meta["dim"],
+            "index_bytes": sum(p.stat().st_size for p in self.path.iterdir() if p.is_file()),
+        }
+
+
+# Process-wide dense index and its search settings; None disables dense search
+_vector_index: VectorIndex | None = None
+_search_settings: dict = {}
+
+
+def configure_vector_index(path: str | Path, alpha: float = 0.5, nprobe: int | None = None) -> VectorIndex:
+    """Open the dense index at ``path`` for ``search_web``.
+
+    Call :func:`~react_agent.search_index.configure_search_index` first; the
+    dense index must have been built from that search index.
+
+    Args:
+        path: Directory written by :meth:`VectorIndex.build`.
+        alpha: Weight of dense scores in hybrid ranking (1.0 for dense-only).
+        nprobe: IVF clusters to scan per query; None searches exactly.
+
+    Raises:
+        ValueError: If no search index is configured or the dense index was
+            built from a different one.
+    """
+    global _vector_index, _search_settings
+    search_index = get_search_index()
+    if search_index is None:
+        raise ValueError("configure a search index before the vector index")
+    vectors = VectorIndex.open(path)
+    vectors.check_source(search_index)
+    _vector_index = vectors
+    _search_settings = {"alpha": alpha, "nprobe": nprobe}
+    clear_tool_cache("search_web")
+    return _vector_index
+
+
+def get_vector_index() -> VectorIndex | None:
+    """Return the process-wide dense index, or None when none is configured."""
+    return _vector_index
+
+
+def get_search_settings() -> dict:
+    """Return the ``alpha``/``nprobe`` settings passed to :func:`configure_vector_index`."""
+    return dict(_search_settings)